@@ -25,7 +25,8 @@ import {
     RECEIVE_SESSION_STATUS,
     WAS_EVER_ACTIVE,
     REQUEST_SESSION_STATUS,
-    SET_CLIENT_ID
+    SET_CLIENT_ID,
+    SET_STATUS_STREAM_STATUS
 } from '../actions';
 import {
     selectMatlabPending,
@@ -73,6 +74,13 @@ export function setOverlayVisibility (visibility) {
     };
 }
 
+export function setStatusStreamStatus (status) {
+    return {
+        type: SET_STATUS_STREAM_STATUS,
+        status
+    };
+}
+
 export function setClientId (clientId) {
     return {
         type: SET_CLIENT_ID,
@@ -238,34 +246,33 @@ export async function fetchWithTimeout (dispatch, resource, options = {}, timeou
     }
 }
 
-export function fetchServerStatus (requestTransferSession = false) {
-    return async function (dispatch, getState) {
-        const isConcurrencyEnabled = selectIsConcurrencyEnabled(getState());
-        const isAuthEnabled = selectAuthEnabled(getState());
-        const isAuthenticated = selectIsAuthenticated(getState());
-        const clientIdInState = selectClientId(getState());
-        const clientId = clientIdInState;
-
-        dispatch(requestServerStatus());
-        let url = './get_status';
+// Builds the URL for an endpoint which serves the server status, such as get_status or status_stream.
+function getServerStatusUrl (state, endpoint, requestTransferSession = false) {
+    const isConcurrencyEnabled = selectIsConcurrencyEnabled(state);
+    const isAuthEnabled = selectAuthEnabled(state);
+    const isAuthenticated = selectIsAuthenticated(state);
+    const clientId = selectClientId(state);
+    let url = endpoint;
 
-        if ((!isAuthEnabled || isAuthenticated) && isConcurrencyEnabled) {
-            url = `${url}?IS_DESKTOP=TRUE`;
+    if ((!isAuthEnabled || isAuthenticated) && isConcurrencyEnabled) {
+        url = `${url}?IS_DESKTOP=TRUE`;
 
-            if (isConcurrencyEnabled && clientId) {
-                const params = new URLSearchParams();
-                params.append('MWI_CLIENT_ID', encodeURIComponent(clientId));
+        if (isConcurrencyEnabled && clientId) {
+            const params = new URLSearchParams();
+            params.append('MWI_CLIENT_ID', encodeURIComponent(clientId));
 
-                if (requestTransferSession) {
-                    params.append('TRANSFER_SESSION', encodeURIComponent(requestTransferSession));
-                }
-                url = url + '&' + params.toString();
+            if (requestTransferSession) {
+                params.append('TRANSFER_SESSION', encodeURIComponent(requestTransferSession));
             }
+            url = url + '&' + params.toString();
         }
+    }
+    return url;
+}
 
-        const response = await fetchWithTimeout(dispatch, url, {}, 10000);
-
-        const data = await response.json();
+export function handleServerStatus (data) {
+    return function (dispatch, getState) {
+        const clientId = selectClientId(getState());
         dispatch(receiveServerStatus(data));
 
         if (clientId == null && data.clientId) {
@@ -280,6 +287,39 @@ export function fetchServerStatus (requestTransferSession = false) {
     };
 }
 
+export function fetchServerStatus (requestTransferSession = false) {
+    return async function (dispatch, getState) {
+        dispatch(requestServerStatus());
+        const url = getServerStatusUrl(getState(), './get_status', requestTransferSession);
+
+        const response = await fetchWithTimeout(dispatch, url, {}, 10000);
+
+        const data = await response.json();
+        dispatch(handleServerStatus(data));
+    };
+}
+
+// Opens a stream on which the server pushes its status whenever it changes.
+// Returns the EventSource, which must be closed by the caller.
+// If the stream fails, it is marked unavailable so that the status is polled instead.
+export function subscribeToServerStatus () {
+    return function (dispatch, getState) {
+        const eventSource = new window.EventSource(getServerStatusUrl(getState(), './status_stream'));
+
+        eventSource.onopen = () => {
+            dispatch(setStatusStreamStatus('open'));
+        };
+        eventSource.onmessage = (event) => {
+            dispatch(handleServerStatus(JSON.parse(event.data)));
+        };
+        eventSource.onerror = () => {
+            eventSource.close();
+            dispatch(setStatusStreamStatus('unavailable'));
+        };
+        return eventSource;
+    };
+}
+
 export function fetchEnvConfig () {
     return async function (dispatch) {
         dispatch(requestEnvConfig());
@@ -26,3 +26,4 @@ export const REQUEST_SERVER_INITIALIZATION = 'REQUEST_SERVER_INITIALIZATION';
 export const RECEIVE_SESSION_STATUS = 'RECEIVE_SESSION_STATUS';
 export const WAS_EVER_ACTIVE = 'WAS_EVER_ACTIVE';
 export const REQUEST_SESSION_STATUS = 'REQUEST_SESSION_STATUS';
+export const SET_STATUS_STREAM_STATUS = 'SET_STATUS_STREAM_STATUS';
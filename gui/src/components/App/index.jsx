@@ -17,6 +17,7 @@ import ShutdownWarning from '../ShutdownWarning';
 import {
     selectOverlayVisible,
     selectFetchStatusPeriod,
+    selectShouldUseStatusStream,
     selectHasFetchedServerStatus,
     selectLicensingProvided,
     selectMatlabUp,
@@ -33,6 +34,7 @@ import {
     selectWasEverActive,
     selectIsConcurrencyEnabled,
     selectIsActiveClient,
+    selectClientId,
     selectIdleTimeoutDurationInMS,
     selectIsMatlabBusy,
     selectMatlabStarting,
@@ -45,6 +47,8 @@ import {
 import {
     setOverlayVisibility,
     fetchServerStatus,
+    subscribeToServerStatus,
+    setStatusStreamStatus,
     fetchEnvConfig,
     updateAuthStatus,
     fetchShutdownIntegration
@@ -58,6 +62,7 @@ function App() {
 
     const overlayVisible = useSelector(selectOverlayVisible);
     const fetchStatusPeriod = useSelector(selectFetchStatusPeriod);
+    const shouldUseStatusStream = useSelector(selectShouldUseStatusStream);
     const hasFetchedServerStatus = useSelector(selectHasFetchedServerStatus);
     const hasFetchedEnvConfig = useSelector(selectHasFetchedEnvConfig);
     const licensingProvided = useSelector(selectLicensingProvided);
@@ -68,6 +73,7 @@ function App() {
     const loadUrl = useSelector(selectLoadUrl);
     const isConnectionError = useSelector(selectIsConnectionError);
     const isAuthenticated = useSelector(selectIsAuthenticated);
+    const clientId = useSelector(selectClientId);
     const authEnabled = useSelector(selectAuthEnabled);
     const licensingInfo = useSelector(selectLicensingInfo);
     const isSessionConcurrent = useSelector(selectIsConcurrent);
@@ -290,6 +296,18 @@ function App() {
         }
     }, fetchStatusPeriod);
 
+    // Stream server status, re-opening the stream when the identity of the client changes
+    useEffect(() => {
+        if (!shouldUseStatusStream) {
+            return;
+        }
+        const eventSource = dispatch(subscribeToServerStatus());
+        return () => {
+            eventSource.close();
+            dispatch(setStatusStreamStatus('closed'));
+        };
+    }, [dispatch, shouldUseStatusStream, isAuthenticated, clientId]);
+
     // Load URL
     useEffect(() => {
         if (loadUrl !== null) {
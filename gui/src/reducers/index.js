@@ -27,7 +27,8 @@ import {
     RECEIVE_SESSION_STATUS,
     REQUEST_SESSION_STATUS,
     RECEIVE_CONCURRENCY_CHECK,
-    WAS_EVER_ACTIVE
+    WAS_EVER_ACTIVE,
+    SET_STATUS_STREAM_STATUS
 } from '../actions';
 
 // Stores info on whether token authentication enabled on the backend.
@@ -252,6 +253,18 @@ export function hasFetched (state = false, action) {
     }
 }
 
+// Stores the state of the status stream, one of 'closed', 'open' or 'unavailable'.
+// Once the stream fails, the status is polled for the rest of the session.
+export function statusStreamStatus (state = 'closed', action) {
+    switch (action.type) {
+        case SET_STATUS_STREAM_STATUS:
+            // Do not retry the stream once it is known to be unavailable.
+            return state === 'unavailable' ? state : action.status;
+        default:
+            return state;
+    }
+}
+
 export function hasClientInitialized (state = false, action) {
     switch (action.type) {
         case REQUEST_SERVER_INITIALIZATION:
@@ -401,7 +414,8 @@ export const serverStatus = combineReducers({
     isFetchingServerStatus,
     hasFetched,
     isSubmitting,
-    fetchFailCount
+    fetchFailCount,
+    statusStreamStatus
 });
 
 export const sessionStatus = combineReducers({
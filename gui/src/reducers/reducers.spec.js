@@ -360,6 +360,23 @@ describe('reducers', () => {
         });
     });
 
+    describe('statusStreamStatus', () => {
+        it('should by default return closed', () => {
+            action = _.cloneDeep(genericAction);
+            expect(reducers.statusStreamStatus(undefined, action)).toBe('closed');
+        });
+
+        it('should return the status when action is SET_STATUS_STREAM_STATUS', () => {
+            action = { type: actions.SET_STATUS_STREAM_STATUS, status: 'open' };
+            expect(reducers.statusStreamStatus('closed', action)).toBe('open');
+        });
+
+        it('should remain unavailable once the stream has failed', () => {
+            action = { type: actions.SET_STATUS_STREAM_STATUS, status: 'open' };
+            expect(reducers.statusStreamStatus('unavailable', action)).toBe('unavailable');
+        });
+    });
+
     describe('loadUrl', () => {
         it('should by default return null', () => {
             action = _.cloneDeep(genericAction);
@@ -14,6 +14,7 @@ export const selectWsEnv = state => state.serverStatus.wsEnv;
 export const selectSubmittingServerStatus = state => state.serverStatus.isSubmitting;
 export const selectHasFetchedServerStatus = state => state.serverStatus.hasFetched;
 export const selectIsFetchingServerStatus = state => state.serverStatus.isFetchingServerStatus;
+export const selectStatusStreamStatus = state => state.serverStatus.statusStreamStatus;
 export const selectLicensingInfo = state => state.serverStatus.licensingInfo;
 export const selectServerStatusFetchFailCount = state => state.serverStatus.fetchFailCount;
 export const selectLoadUrl = state => state.loadUrl;
@@ -108,14 +109,30 @@ export const getFetchAbortController = createSelector(
     serverStatus => serverStatus.fetchAbortController
 );
 
-// If the session is concurrent or if there is a connection error then disable the fetching of data such as get_status.
+// Use the status stream instead of polling get_status once the initial status has been fetched,
+// unless the stream has failed or the session is concurrent.
+export const selectShouldUseStatusStream = createSelector(
+    selectHasFetchedServerStatus,
+    selectStatusStreamStatus,
+    selectIsConcurrencyEnabled,
+    selectIsConcurrent,
+    (hasFetched, statusStreamStatus, isConcurrencyEnabled, isConcurrent) => {
+        return hasFetched &&
+            statusStreamStatus !== 'unavailable' &&
+            !(isConcurrencyEnabled && isConcurrent) &&
+            typeof window.EventSource !== 'undefined';
+    }
+);
+
+// If the session is concurrent, if there is a connection error or if the status is being streamed then disable the fetching of data such as get_status.
 export const selectFetchStatusPeriod = createSelector(
     selectSubmittingServerStatus,
     selectIsFetchingServerStatus,
     selectIsConcurrencyEnabled,
     selectIsConcurrent,
-    (isSubmitting, isFetchingServerStatus, isConcurrencyEnabled, isConcurrent) => {
-        if (isSubmitting || isFetchingServerStatus || (isConcurrencyEnabled && isConcurrent)) {
+    selectStatusStreamStatus,
+    (isSubmitting, isFetchingServerStatus, isConcurrencyEnabled, isConcurrent, statusStreamStatus) => {
+        if (isSubmitting || isFetchingServerStatus || (isConcurrencyEnabled && isConcurrent) || statusStreamStatus === 'open') {
             return null;
         }
         return STATUS_REQUEST_INTERVAL_MS; // milliseconds
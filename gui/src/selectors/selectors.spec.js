@@ -58,6 +58,7 @@ describe('selectors', () => {
         selectOverlayVisibility,
         getFetchAbortController,
         selectFetchStatusPeriod,
+        selectShouldUseStatusStream,
         selectLicensingProvided,
         selectLicensingIsMhlm,
         selectLicensingMhlmUsername,
@@ -284,6 +285,30 @@ describe('selectors', () => {
             expect(selectFetchStatusPeriod(modifiedState)).toBe(STATUS_REQUEST_INTERVAL_MS);
         });
 
+        test('selectFetchStatusPeriod should return null if the status stream is open', () => {
+            modifiedState = _.cloneDeep(state);
+            modifiedState.serverStatus.isSubmitting = false;
+            modifiedState.sessionStatus.isActiveClient = true;
+            modifiedState.serverStatus.statusStreamStatus = 'open';
+            expect(selectFetchStatusPeriod(modifiedState)).toBeNull();
+        });
+
+        test('selectShouldUseStatusStream should return false once the status stream is unavailable', () => {
+            modifiedState = _.cloneDeep(state);
+            modifiedState.serverStatus.hasFetched = true;
+            modifiedState.sessionStatus.isActiveClient = true;
+            window.EventSource = function () {};
+
+            modifiedState.serverStatus.statusStreamStatus = 'closed';
+            expect(selectShouldUseStatusStream(modifiedState)).toBe(true);
+
+            modifiedState = _.cloneDeep(modifiedState);
+            modifiedState.serverStatus.statusStreamStatus = 'unavailable';
+            expect(selectShouldUseStatusStream(modifiedState)).toBe(false);
+
+            delete window.EventSource;
+        });
+
         test('selectLicensingProvided should return true if licensingInfo has property type else false', () => {
             expect(selectLicensingProvided(state)).toBe(true);
 
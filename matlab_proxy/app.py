@@ -1,6 +1,8 @@
 # Copyright 2020-2025 The MathWorks, Inc.
 
 import asyncio
+import gzip
+import hashlib
 import json
 import mimetypes
 import pkgutil
@@ -9,15 +11,21 @@ import sys
 
 import aiohttp
 from aiohttp import client_exceptions, web
+from aiohttp.web_urldispatcher import (
+    AbstractResource,
+    ResourceRoute,
+    UrlMappingMatchInfo,
+)
 from aiohttp_session import setup as aiohttp_session_setup
 from aiohttp_session.cookie_storage import EncryptedCookieStorage
 from cryptography import fernet
+from yarl import URL
 
 import matlab_proxy
 from matlab_proxy import constants, settings, util
 from matlab_proxy.app_state import AppState
 from matlab_proxy.constants import IS_CONCURRENCY_CHECK_ENABLED
-from matlab_proxy.util import mwi
+from matlab_proxy.util import mwi, websocket_relay
 from matlab_proxy.util.mwi import download, token_auth
 from matlab_proxy.util.mwi import environment_variables as mwi_env
 from matlab_proxy.util.mwi.exceptions import AppError, InvalidTokenError, LicensingError
@@ -29,6 +37,12 @@ mimetypes.add_type("font/ttf", ".ttf")
 mimetypes.add_type("application/json", ".map")
 mimetypes.add_type("image/png", ".ico")
 
+# Brotli is an optional dependency, static assets are only precompressed with gzip when it is unavailable.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # TODO It is bad practice to have global state in aiohttp applications, instead this
 # mount point should be read in the application start up function, then if it is not
 # an empty string, registering a subapp with the given prefix. In addition, if it is
@@ -106,6 +120,70 @@ def create_status_response(app, loadUrl=None, client_id=None, is_active_client=N
     Returns:
         JSONResponse: A JSONResponse object containing the generic state of the server, MATLAB, MATLAB Licensing and the client session status.
     """
+    if loadUrl is None and client_id is None:
+        etag, body = get_status_snapshot(app, is_active_client=is_active_client)
+        return create_json_snapshot_response(None, etag, body)
+
+    return web.json_response(
+        marshal_status(
+            app,
+            loadUrl=loadUrl,
+            client_id=client_id,
+            is_active_client=is_active_client,
+        )
+    )
+
+
+def get_status_snapshot(app, is_active_client=None):
+    """Returns the status of the server serialized to JSON along with its ETag.
+    The status is only marshalled and serialized again after it changes.
+
+    Args:
+        app (aiohttp.web.Application): Web Server
+        is_active_client (Boolean, optional): Represents whether the current client is the active_client when concurrency check is enabled. Defaults to None.
+
+    Returns:
+        Tuple[str, bytes]: ETag and JSON encoded status.
+    """
+    return app["state"].get_status_snapshot(
+        is_active_client,
+        lambda: marshal_status(app, is_active_client=is_active_client),
+    )
+
+
+def create_json_snapshot_response(req, etag, body):
+    """Creates a response for JSON data which has already been serialized.
+
+    Args:
+        req (HTTPRequest): HTTPRequest Object, can be None if conditional requests need not be handled.
+        etag (str): ETag of the serialized data.
+        body (bytes): JSON encoded data.
+
+    Returns:
+        HTTPResponse: HTTPResponse object containing the data, or an empty
+        HTTPResponse with status 304 if the client's cached copy is still valid.
+    """
+    # no-cache makes browsers revalidate their cached copy with the ETag on every request
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if req is not None and _is_etag_match(req.headers.get("If-None-Match"), [etag]):
+        return web.Response(status=304, headers=headers)
+
+    return web.Response(body=body, content_type="application/json", headers=headers)
+
+
+def marshal_status(app, loadUrl=None, client_id=None, is_active_client=None):
+    """Gather/Marshal the generic status of the server, MATLAB, MATLAB Licensing and the client session status.
+
+    Args:
+        app (aiohttp.web.Application): Web Server
+        loadUrl (String, optional): Represents the root URL. Defaults to None.
+        client_id (String, optional): Represents the generated client_id when concurrency check is enabled and client does not have a client_id. Defaults to None.
+        is_active_client (Boolean, optional): Represents whether the current client is the active_client when concurrency check is enabled. Defaults to None.
+
+    Returns:
+        Dict: Containing the generic state of the server, MATLAB, MATLAB Licensing and the client session status.
+    """
     state = app["state"]
     status = {
         "matlab": {
@@ -125,7 +203,7 @@ def create_status_response(app, loadUrl=None, client_id=None, is_active_client=N
     if is_active_client is not None:
         status["isActiveClient"] = is_active_client
 
-    return web.json_response(status)
+    return status
 
 
 @token_auth.authenticate_access_decorator
@@ -195,13 +273,34 @@ async def get_env_config(req):
         JSONResponse: contains a Dict representing environment specific configuration serialized to JSON
     """
     state = req.app["state"]
-    config = state.settings["env_config"]
 
-    config["isConcurrencyEnabled"] = IS_CONCURRENCY_CHECK_ENABLED
     # In a previously authenticated session, if the url is accessed without the token(using session cookie), send the token as well.
+    is_authenticated = True if await token_auth.authenticate_request(req) else False
+
+    etag, body = state.get_env_config_snapshot(
+        (state.settings["matlab_version"], is_authenticated),
+        lambda: marshal_env_config(state, is_authenticated),
+    )
+    return create_json_snapshot_response(req, etag, body)
+
+
+def marshal_env_config(state, is_authenticated):
+    """Gather/Marshal the Matlab Web Desktop environment specific configuration.
+
+    Args:
+        state (AppState): State of the App.
+        is_authenticated (bool): Whether the request for the configuration was authenticated.
+
+    Returns:
+        Dict: Containing the environment specific configuration.
+    """
+    # Copy the configuration, as settings are shared by all requests.
+    config = dict(state.settings["env_config"])
+
+    config["isConcurrencyEnabled"] = IS_CONCURRENCY_CHECK_ENABLED
     config["authentication"] = {
         "enabled": state.settings["mwi_is_token_auth_enabled"],
-        "status": True if await token_auth.authenticate_request(req) else False,
+        "status": is_authenticated,
     }
 
     config["matlab"] = {
@@ -214,7 +313,7 @@ async def get_env_config(req):
     # Send timeout duration for the idle timer as part of the response
     config["idleTimeoutDuration"] = state.settings["mwi_idle_timeout"]
 
-    return web.json_response(config)
+    return config
 
 
 # @token_auth.authenticate_access_decorator
@@ -232,6 +331,7 @@ async def get_status(req):
     """
     # The client sends the CLIENT_ID as a query parameter if the concurrency check has been set to true.
     state = req.app["state"]
+    state.record_client_activity()
     client_id = req.query.get("MWI_CLIENT_ID", None)
     transfer_session = json.loads(req.query.get("TRANSFER_SESSION", "false"))
     is_desktop = req.query.get("IS_DESKTOP", False)
@@ -240,9 +340,100 @@ async def get_status(req):
         is_desktop, client_id, transfer_session
     )
 
-    return create_status_response(
-        req.app, client_id=generated_client_id, is_active_client=is_active_client
+    if generated_client_id:
+        return create_status_response(
+            req.app, client_id=generated_client_id, is_active_client=is_active_client
+        )
+
+    etag, body = get_status_snapshot(req.app, is_active_client=is_active_client)
+    return create_json_snapshot_response(req, etag, body)
+
+
+# @token_auth.authenticate_access_decorator
+# Explicitly disabling authentication for this end-point,
+# because the front end requires this endpoint to be available at all times.
+async def status_stream(req):
+    """API Endpoint which streams the generic status of the server, MATLAB and MATLAB Licensing as Server-Sent Events.
+
+    A new event is sent only when the status changes, with comments sent periodically to keep the connection alive.
+    Accepts the same query parameters as the get_status endpoint.
+
+    Args:
+        req (HTTPRequest): HTTPRequest Object.
+
+    Returns:
+        StreamResponse: StreamResponse object which is written to until the client disconnects or the server shuts down.
+    """
+    state = req.app["state"]
+    client_id = req.query.get("MWI_CLIENT_ID", None)
+    transfer_session = json.loads(req.query.get("TRANSFER_SESSION", "false"))
+    is_desktop = req.query.get("IS_DESKTOP", False)
+
+    generated_client_id, is_active_client = state.get_session_status(
+        is_desktop, client_id, transfer_session
+    )
+    client_id = client_id or generated_client_id
+
+    response = web.StreamResponse(
+        headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            # Disable buffering of the events by reverse proxies like nginx
+            "X-Accel-Buffering": "no",
+            **req.app["settings"]["mwi_custom_http_headers"],
+        }
     )
+    await response.prepare(req)
+
+    if client_id:
+        state.add_status_stream_client(client_id)
+
+    try:
+        sent_version = None
+        while not state.are_status_streams_closed:
+            state.record_client_activity()
+
+            # An open status stream implies activity, similar to polling the get_status endpoint.
+            if state.is_idle_timeout_enabled:
+                await state.reset_timer()
+
+            if sent_version != state.status_version:
+                sent_version = state.status_version
+
+                if is_active_client is not None:
+                    is_active_client = state.active_client == client_id
+
+                if generated_client_id:
+                    body = json.dumps(
+                        marshal_status(
+                            req.app,
+                            client_id=generated_client_id,
+                            is_active_client=is_active_client,
+                        )
+                    ).encode()
+                    # The generated client id needs to be sent only once.
+                    generated_client_id = None
+                else:
+                    _, body = get_status_snapshot(
+                        req.app, is_active_client=is_active_client
+                    )
+
+                await response.write(b"data: " + body + b"\n\n")
+            else:
+                await response.write(b": keepalive\n\n")
+
+            await state.wait_for_status_change(
+                sent_version, timeout=constants.STATUS_STREAM_KEEPALIVE_INTERVAL_SECONDS
+            )
+
+    except ConnectionResetError:
+        logger.debug("Status stream closed by the client")
+
+    finally:
+        if client_id:
+            state.remove_status_stream_client(client_id)
+
+    return response
 
 
 # @token_auth.authenticate_access_decorator
@@ -313,6 +504,93 @@ async def stop_matlab(req):
     return create_status_response(req.app)
 
 
+@token_auth.authenticate_access_decorator
+async def get_embedded_connector_pool_stats(req):
+    """API Endpoint to get statistics about the pool of connections to the MATLAB Embedded Connector.
+
+    Args:
+        req (HTTPRequest): HTTPRequest Object.
+
+    Returns:
+        JSONResponse: JSONResponse object containing the pool statistics. Statistics are None when MATLAB is not running.
+    """
+    state = req.app["state"]
+    ec_pool = state.embedded_connector_pool
+
+    return web.json_response(
+        {"embeddedConnectorPool": ec_pool.get_stats() if ec_pool else None}
+    )
+
+
+@token_auth.authenticate_access_decorator
+async def get_matlab_state_polling_stats(req):
+    """API Endpoint to get the policy used to probe the state of MATLAB and statistics about the probes.
+
+    Args:
+        req (HTTPRequest): HTTPRequest Object.
+
+    Returns:
+        JSONResponse: JSONResponse object containing the polling statistics.
+    """
+    state = req.app["state"]
+
+    return web.json_response(
+        {"matlabStatePolling": state.matlab_state_polling.get_stats()}
+    )
+
+
+@token_auth.authenticate_access_decorator
+async def get_background_task_stats(req):
+    """API Endpoint to get statistics about the wake ups of the periodic background tasks and the time they spent running.
+
+    Args:
+        req (HTTPRequest): HTTPRequest Object.
+
+    Returns:
+        JSONResponse: JSONResponse object containing the statistics of the background tasks.
+    """
+    state = req.app["state"]
+
+    return web.json_response({"backgroundTasks": state.timer_wheel.get_stats()})
+
+
+@token_auth.authenticate_access_decorator
+async def get_websocket_connections(req):
+    """API Endpoint to get the websocket connections which are being relayed to MATLAB and the statistics of each of them.
+
+    Args:
+        req (HTTPRequest): HTTPRequest Object.
+
+    Returns:
+        JSONResponse: JSONResponse object containing the number of connections and the statistics of each connection.
+    """
+    return web.json_response(
+        {"websocketConnections": req.app["ws_registry"].get_stats()}
+    )
+
+
+@token_auth.authenticate_access_decorator
+async def get_matlab_startup_report(req):
+    """API Endpoint to get the time taken by each phase of starting MATLAB, for the latest and all previous starts.
+
+    Args:
+        req (HTTPRequest): HTTPRequest Object.
+
+    Returns:
+        JSONResponse: JSONResponse object containing the startup report and histograms.
+    """
+    state = req.app["state"]
+
+    return web.json_response(
+        {
+            "matlabStartup": {
+                **state.matlab_startup_report.get_stats(),
+                "phaseDurations": state.matlab_startup_timings,
+            }
+        }
+    )
+
+
 @token_auth.authenticate_access_decorator
 async def set_licensing_info(req):
     """API Endpoint to set licensing information on the server side.
@@ -485,19 +763,143 @@ async def root_redirect(request):
 
 
 async def static_get(req):
-    """Returns HTTP Response objects for the static files
+    """Returns HTTP Response objects for the static files.
+    Static files are served from memory, in the best encoding accepted by the client.
 
     Args:
         req (HTTPRequest): HTTPRequest object
 
     Returns:
-        HTTPResponse: HTTPResponse object containing the static file.
+        HTTPResponse: HTTPResponse object containing the static file, or an empty
+        HTTPResponse with status 304 if the client's cached copy is still valid.
     """
     details = req.app["static_route_table"][req.path]
-    return web.Response(
-        headers=details["headers"],
-        status=200,
-        body=pkgutil.get_data(details["mod"], details["name"]),
+    variants = details["variants"]
+
+    encoding = _select_static_encoding(req.headers.get("Accept-Encoding"), variants)
+    variant = variants[encoding]
+    headers = {**details["headers"], "ETag": variant["etag"]}
+
+    if _is_etag_match(
+        req.headers.get("If-None-Match"),
+        [variant["etag"] for variant in variants.values()],
+    ):
+        return web.Response(status=304, headers=headers)
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    return web.Response(headers=headers, status=200, body=variant["body"])
+
+
+def _is_etag_match(if_none_match, etags):
+    """Check if any of the entity tags in an If-None-Match header matches any of the current entity tags of a resource.
+
+    Args:
+        if_none_match (str): Value of the If-None-Match request header, can be None.
+        etags (List[str]): Current entity tags of the resource, eg: one for each encoding of a static file.
+
+    Returns:
+        bool: True if the client already has an up to date copy of the resource.
+    """
+    if not if_none_match:
+        return False
+
+    requested_etags = {etag.strip() for etag in if_none_match.split(",")}
+    if "*" in requested_etags:
+        return True
+
+    # Weak comparison, as required for If-None-Match
+    requested_etags = {
+        etag[2:] if etag.startswith("W/") else etag for etag in requested_etags
+    }
+    return any(etag in requested_etags for etag in etags)
+
+
+def _select_static_encoding(accept_encoding, variants):
+    """Selects the encoding of a static file to send based on the Accept-Encoding request header.
+
+    Args:
+        accept_encoding (str): Value of the Accept-Encoding request header, can be None.
+        variants (Dict): Encodings of a static file as created by _make_static_variants()
+
+    Returns:
+        str: One of "br", "gzip" or "identity"
+    """
+    if not accept_encoding:
+        return "identity"
+
+    accepted = set()
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        _, _, quality = params.partition("q=")
+        try:
+            # Codings with a quality value of 0 are explicitly not acceptable
+            if quality and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(name.strip())
+
+    for encoding in ("br", "gzip"):
+        if encoding in variants and (encoding in accepted or "*" in accepted):
+            return encoding
+
+    return "identity"
+
+
+def _make_static_variants(body, content_type):
+    """Precomputes the encodings of a static file which can be sent to clients.
+
+    Compressed encodings are only created for compressible content types and are only
+    kept when they are smaller than the original content.
+
+    Args:
+        body (bytes): Content of the static file
+        content_type (str): MIME type of the static file
+
+    Returns:
+        Dict: Mapping from encoding to a Dict containing the body and a strong ETag for that encoding.
+    """
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    variants = {"identity": {"body": body, "etag": f'"{digest}"'}}
+
+    if len(body) < constants.MIN_STATIC_FILE_SIZE_TO_COMPRESS or not (
+        _is_compressible_content_type(content_type)
+    ):
+        return variants
+
+    compressors = {"gzip": lambda data: gzip.compress(data, mtime=0)}
+    if brotli is not None:
+        compressors["br"] = brotli.compress
+
+    for encoding, compress in compressors.items():
+        compressed = compress(body)
+        if len(compressed) < len(body):
+            variants[encoding] = {
+                "body": compressed,
+                "etag": f'"{digest}-{encoding}"',
+            }
+
+    return variants
+
+
+def _is_compressible_content_type(content_type):
+    """Check if static files of the given MIME type benefit from compression.
+
+    Args:
+        content_type (str): MIME type of the static file, can be None.
+
+    Returns:
+        bool: True for text based content types.
+    """
+    if not content_type:
+        return False
+
+    return (
+        content_type.startswith("text/")
+        or content_type.endswith(("json", "javascript", "xml"))
+        or content_type in ("image/svg+xml", "font/ttf", "font/eot")
     )
 
 
@@ -506,6 +908,9 @@ def make_static_route_table(app):
     Key for the Dict is the complete path to a file
     Value for the Dict is the header and other information.
 
+    The content of each file is read once and cached along with its precompressed
+    encodings and ETags, so that requests for static files are served from memory.
+
     Args:
         app (aiohttp server): The aiohttp server.
 
@@ -539,18 +944,98 @@ def make_static_route_table(app):
                     else:
                         content_type = mimetypes.guess_type(name)[0]
 
-                    headers = {"content-type": content_type}
+                    # Files in /static/js and /static/css have content hashes in their names, so they never change.
+                    # All other files (Eg: index.html) must be revalidated by the browser using their ETag.
+                    cache_control = (
+                        "public, max-age=31536000, immutable"
+                        if parent in ("/static/js", "/static/css")
+                        else "no-cache"
+                    )
+
+                    headers = {
+                        "content-type": content_type,
+                        "Cache-Control": cache_control,
+                        "Vary": "Accept-Encoding",
+                    }
                     headers.update(app["settings"]["mwi_custom_http_headers"])
 
                     table[f"{base_url}{parent}/{name}"] = {
                         "mod": mod,
                         "name": name,
                         "headers": headers,
+                        "variants": _make_static_variants(
+                            pkgutil.get_data(mod, name), content_type
+                        ),
                     }
 
     return table
 
 
+class StaticFilesResource(AbstractResource):
+    """A single aiohttp resource which serves all the static files in the static route table.
+
+    Matching a request against this resource is a dict lookup, irrespective of the number of static files.
+    Requests for paths which are not in the static route table are not matched, and fall through to
+    the resources registered after it (Eg: the catch-all route to the MATLAB Embedded Connector).
+    """
+
+    def __init__(self, prefix, route_table, handler, *, name=None):
+        """Parameterized constructor for the StaticFilesResource class.
+
+        Args:
+            prefix (str): Common prefix of all the paths in the route table. Eg: The base_url
+            route_table (Dict): Static route table as created by make_static_route_table()
+            handler (callable): Request handler which serves the static files.
+            name (str, optional): Name of the resource. Defaults to None.
+        """
+        super().__init__(name=name)
+        self._prefix = prefix
+        self._route_table = route_table
+        self._route = ResourceRoute("GET", handler, self)
+
+    @property
+    def canonical(self):
+        return f"{self._prefix}/"
+
+    def url_for(self, *, filename):
+        return URL.build(path=f"{self._prefix}/{filename.lstrip('/')}")
+
+    def add_prefix(self, prefix):
+        # Called when the application is added as a sub-application. The route table is updated in place,
+        # as static_get() looks up the requested paths in the same table.
+        assert prefix.startswith("/")
+        assert not prefix.endswith("/")
+        assert len(prefix) > 1
+        self._prefix = prefix + self._prefix
+        entries = list(self._route_table.items())
+        self._route_table.clear()
+        self._route_table.update({prefix + path: details for path, details in entries})
+
+    def get_info(self):
+        return {"prefix": self._prefix, "files": len(self._route_table)}
+
+    def raw_match(self, path):
+        return path in self._route_table
+
+    async def resolve(self, request):
+        if request.path not in self._route_table:
+            return None, set()
+
+        if request.method != "GET":
+            return None, {"GET"}
+
+        return UrlMappingMatchInfo({}, self._route), {"GET"}
+
+    def __len__(self):
+        return 1
+
+    def __iter__(self):
+        return iter([self._route])
+
+    def __repr__(self):
+        return f"<StaticFilesResource {self._prefix}/ ({len(self._route_table)} files)>"
+
+
 @token_auth.authenticate_access_decorator
 async def matlab_view(req):
     """API Endpoint which proxies requests to the MATLAB Embedded Connector
@@ -568,6 +1053,7 @@ async def matlab_view(req):
     reqH = req.headers.copy()
 
     state = req.app["state"]
+    state.record_client_activity()
     matlab_port = state.matlab_port
     matlab_protocol = req.app["settings"]["matlab_protocol"]
     mwapikey = req.app["settings"]["mwapikey"]
@@ -576,9 +1062,12 @@ async def matlab_view(req):
 
     cookies_from_jar = cookie_jar.get_dict() if cookie_jar else None
 
+    # Pool of keep-alive connections to the Embedded Connector, shared by all proxied requests.
+    ec_pool = state.embedded_connector_pool
+
     # If we are trying to send request to matlab while the matlab_port is still not assigned
     # by embedded connector, return service not available and log a message
-    if not matlab_port:
+    if not matlab_port or ec_pool is None:
         logger.debug(
             "MATLAB hasn't fully started, please retry after embedded connector has started"
         )
@@ -586,163 +1075,177 @@ async def matlab_view(req):
 
     # WebSocket
     if _is_websocket_upgrade_request(req.method, reqH):
+        # Messages waiting to be relayed in either direction share the memory budget of the connection,
+        # which is also the size of the largest message accepted from either side.
+        ws_memory_budget = websocket_relay.MemoryBudget(
+            req.app["settings"]["mwi_ws_memory_budgets"]["per_connection"],
+            parent=req.app["ws_memory_budget"],
+            wait_timeout=constants.WS_MEMORY_BUDGET_WAIT_SECONDS,
+        )
+
         ws_server = web.WebSocketResponse(
-            max_msg_size=constants.MAX_WEBSOCKET_MESSAGE_SIZE_IN_MB, compress=True
+            max_msg_size=ws_memory_budget.limit,
+            compress=True,
+            **websocket_relay.get_websocket_options(),
         )
         await ws_server.prepare(req)
 
-        async with aiohttp.ClientSession(
-            cookies=(
-                cookies_from_jar if cookie_jar else req.cookies
-            ),  # If cookie jar is not provided, use the cookies from the incoming request
-            trust_env=True,
-            connector=aiohttp.TCPConnector(ssl=False),
-        ) as client_session:
-            try:
-                async with client_session.ws_connect(
-                    matlab_base_url + req.path_qs,
-                    max_msg_size=constants.MAX_WEBSOCKET_MESSAGE_SIZE_IN_MB,  # max websocket message size from MATLAB to browser
-                    compress=12,  # enable websocket messages compression
-                ) as ws_client:
-
-                    async def wsforward(ws_from, ws_to):
-                        async for msg in ws_from:
-                            mt = msg.type
-                            md = msg.data
-
-                            # When a websocket is closed by the MATLAB JSD, it sends out a few http requests to the Embedded Connector about the events
-                            # that had occured (figureWindowClosed etc.)
-                            # The Embedded Connector responds by sending a message of type 'Error' with close code as Abnormal closure.
-                            # When this happens, matlab-proxy can safely exit out of the loop
-                            # and close the websocket connection it has with the Embedded Connector (ws_client)
-                            if (
-                                mt == aiohttp.WSMsgType.ERROR
-                                and ws_from.close_code
-                                == aiohttp.WSCloseCode.ABNORMAL_CLOSURE
-                            ):
-                                break
-
-                            if mt == aiohttp.WSMsgType.TEXT:
-                                await ws_to.send_str(md)
-                            elif mt == aiohttp.WSMsgType.BINARY:
-                                await ws_to.send_bytes(md)
-                            elif mt == aiohttp.WSMsgType.PING:
-                                await ws_to.ping()
-                            elif mt == aiohttp.WSMsgType.PONG:
-                                await ws_to.pong()
-                            elif ws_to.closed:
-                                await ws_to.close(
-                                    code=ws_to.close_code, message=msg.extra
-                                )
-                            elif mt == aiohttp.WSMsgType.ERROR:
-                                logger.error(f"WebSocket error received: {msg}")
-                                if "exceeds limit" in str(msg.data):
-                                    logger.error(
-                                        f"Message too large: {msg.data}. Please refresh browser tab to reconnect."
-                                    )
-                                break
-                            else:
-                                raise ValueError(f"Unexpected message type: {msg}")
-
-                    await asyncio.wait(
-                        [
-                            asyncio.create_task(
-                                wsforward(ws_server, ws_client)
-                            ),  # browser to MATLAB
-                            asyncio.create_task(
-                                wsforward(ws_client, ws_server)
-                            ),  # MATLAB to browser
-                        ],
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
+        # Messages to the browser are compressed according to the configured policy, if it negotiated compression.
+        ws_compressor = websocket_relay.create_compressor(
+            ws_server, req.app["settings"].get("mwi_ws_compression_policy")
+        )
 
-                    return ws_server
+        # If cookie jar is not provided, use the cookies from the incoming request
+        ws_cookies = cookies_from_jar if cookie_jar else req.cookies
 
-            except Exception as err:
-                logger.error(
-                    f"Failed to create web socket connection with error: {err}"
-                )
+        # The pooled session does not hold any cookies, so pass them along as a header.
+        ws_headers = (
+            {"Cookie": "; ".join(f"{k}={v}" for k, v in ws_cookies.items())}
+            if ws_cookies
+            else None
+        )
 
-                code, message = (
-                    aiohttp.WSCloseCode.INTERNAL_ERROR,
-                    "Failed to establish websocket connection with MATLAB",
+        try:
+            async with ec_pool.ws_connect(
+                req.path_qs,
+                headers=ws_headers,
+                max_msg_size=ws_memory_budget.limit,  # max websocket message size from MATLAB to browser
+                # The Embedded Connector is reached over the loopback interface, where compression only costs CPU.
+                compress=0,
+                **websocket_relay.get_websocket_options(),
+            ) as ws_client:
+
+                # Relays messages in both directions until either side closes its websocket, after which
+                # the relay of the other direction is cancelled and both websockets are closed.
+                await req.app["ws_registry"].relay(
+                    req.path,
+                    ws_server,
+                    ws_client,
+                    compressor=ws_compressor,
+                    memory_budget=ws_memory_budget,
                 )
-                await ws_server.close(code=code, message=message.encode("utf-8"))
-                raise aiohttp.WebSocketError(code=code, message=message)
 
-    # Standard HTTP Request
-    else:
-        # Proxy, injecting request header, disabling request timeouts
-        timeout = aiohttp.ClientTimeout(total=None)
-        async with aiohttp.ClientSession(
-            trust_env=True,
-            connector=aiohttp.TCPConnector(ssl=False),
-            timeout=timeout,
-        ) as client_session:
-            try:
-                req_body = await transform_body(req)
-                req_url = await transform_request_url(
-                    req, matlab_base_url=matlab_base_url
-                )
-                # Set content length in case of modification
-                reqH["Content-Length"] = str(len(req_body))
-                reqH["x-forwarded-proto"] = "http"
-
-                async with client_session.request(
-                    req.method,
-                    req_url,
-                    headers={**reqH, **{"mwapikey": mwapikey}},
-                    allow_redirects=False,
-                    data=req_body,
-                    params=None,
-                    cookies=cookies_from_jar,  # Pass cookies from  cookie_jar for HTTP requests to MATLAB. This value will
-                    # be none if cookie jar is not enabled
-                ) as res:
-                    headers = res.headers.copy()
-                    body = await res.read()
-
-                    response = web.Response(
-                        status=res.status, headers=headers, body=body
+                if ws_compressor is not None:
+                    logger.debug(
+                        f"Compression of websocket messages to the browser: {ws_compressor.get_stats()}"
                     )
 
-                    # Purpose of the cookie-jar in matlab-proxy is to:
-                    # 1) Update the cookies within it when the Embedded Connector sends back Set-Cookie headers in the response.
-                    # 2) Read these cookies from the cookie jar and insert them into subsequent requests to the Embedded Connector.
+                return ws_server
 
-                    # Due to matlab-proxy's PING requests to EC, the number cookies present in the cookie-jar and their
-                    # value will be more than the ones present on the browser side.
-                    # Example: The JSESSIONID cookie will be present in the cookie-jar but not on the browser side.
-                    # This inconsistency of cookies between the browser and matlab-proxy's cookie-jar is expected and okay
-                    # as these cookies are HttpOnly cookies.
+        except Exception as err:
+            logger.error(f"Failed to create web socket connection with error: {err}")
 
-                    # Incase the Embedded Connector sends cookies which are not HttpOnly, then additional logic needs to be written
-                    # to update the response with cookies from the cookie jar before it is forwarded to the browser.
-                    if cookie_jar:
-                        # Update the cookies in the cookie jar with the Set-Cookie headers in the response.
-                        cookie_jar.update_from_response_headers(headers)
+            code, message = (
+                aiohttp.WSCloseCode.INTERNAL_ERROR,
+                "Failed to establish websocket connection with MATLAB",
+            )
+            await ws_server.close(code=code, message=message.encode("utf-8"))
+            raise aiohttp.WebSocketError(code=code, message=message)
 
-                    response.headers.update(
-                        req.app["settings"]["mwi_custom_http_headers"]
-                    )
+    # Standard HTTP Request
+    else:
+        # The request body is streamed to the Embedded Connector, so aiohttp does not enforce
+        # client_max_size on it. Reject requests which declare a body larger than the limit upfront.
+        if (
+            req.content_length is not None
+            and req.content_length > constants.MAX_HTTP_REQUEST_SIZE
+        ):
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=constants.MAX_HTTP_REQUEST_SIZE,
+                actual_size=req.content_length,
+            )
 
-                    return response
+        response = None
+        try:
+            if _is_body_transform_required(req):
+                # Only requests which need rewriting are buffered.
+                req_body = await transform_body(req)
+                # Set content length in case of modification
+                reqH["Content-Length"] = str(len(req_body))
+            else:
+                # Stream the request body as it arrives. The Content-Length header (if any) is
+                # forwarded as is, otherwise aiohttp uses chunked transfer encoding.
+                req_body = req.content if req.body_exists else None
+            reqH.popall("Transfer-Encoding", None)
+
+            req_url = await transform_request_url(req, matlab_base_url=matlab_base_url)
+            reqH["x-forwarded-proto"] = "http"
+
+            # Proxy using a pooled connection, injecting request header. Request timeouts are disabled on the pool.
+            async with ec_pool.request(
+                req.method,
+                req_url,
+                headers={**reqH, **{"mwapikey": mwapikey}},
+                allow_redirects=False,
+                data=req_body,
+                params=None,
+                cookies=cookies_from_jar,  # Pass cookies from  cookie_jar for HTTP requests to MATLAB. This value will
+                # be none if cookie jar is not enabled
+            ) as res:
+                headers = res.headers.copy()
+
+                # Purpose of the cookie-jar in matlab-proxy is to:
+                # 1) Update the cookies within it when the Embedded Connector sends back Set-Cookie headers in the response.
+                # 2) Read these cookies from the cookie jar and insert them into subsequent requests to the Embedded Connector.
+
+                # matlab-proxy's health checks to EC are sent by the HealthClient, which keeps its own cookie jar. So,
+                # only the cookies set in response to proxied requests end up in this cookie-jar.
+                # Any inconsistency of cookies between the browser and matlab-proxy's cookie-jar is expected and okay
+                # as these cookies are HttpOnly cookies.
+
+                # Incase the Embedded Connector sends cookies which are not HttpOnly, then additional logic needs to be written
+                # to update the response with cookies from the cookie jar before it is forwarded to the browser.
+                if cookie_jar:
+                    # Update the cookies in the cookie jar with the Set-Cookie headers in the response.
+                    cookie_jar.update_from_response_headers(headers)
+
+                # The framing of the response to the browser is decided by the StreamResponse.
+                headers.popall("Transfer-Encoding", None)
+
+                # aiohttp decompresses the response body as it is read, so the original
+                # encoding and length no longer apply to the bytes forwarded to the browser.
+                if headers.popall("Content-Encoding", None):
+                    headers.popall("Content-Length", None)
+
+                response = web.StreamResponse(status=res.status, headers=headers)
+                response.headers.update(req.app["settings"]["mwi_custom_http_headers"])
+                await response.prepare(req)
+
+                # Forward chunks to the browser as they arrive from the Embedded Connector
+                async for chunk in res.content.iter_any():
+                    await response.write(chunk)
+
+                await response.write_eof()
+                return response
+
+        except Exception as err:
+            # The status and headers have already been sent to the browser, so an error response
+            # can no longer be returned. Close the connection to signal an incomplete response.
+            if response is not None and response.prepared:
+                logger.debug(
+                    f"Failed to stream HTTP response from MATLAB to the browser with error: {err}"
+                )
+                if req.transport is not None:
+                    req.transport.close()
+                return response
 
             # Handles any pending HTTP requests from the browser when the MATLAB process is terminated before responding to them.
-            except (
-                client_exceptions.ServerDisconnectedError,
-                client_exceptions.ClientConnectionError,
+            if isinstance(
+                err,
+                (
+                    client_exceptions.ServerDisconnectedError,
+                    client_exceptions.ClientConnectionError,
+                ),
             ):
                 logger.debug(
                     "Failed to forward HTTP request as MATLAB process may not be running."
                 )
+                state.matlab_state_polling.probe_now("Proxied request failed")
                 raise web.HTTPServiceUnavailable()
 
             # Some other exception has been raised (by MATLAB Embedded Connector), log the error and return 404
-            except Exception as err:
-                logger.error(
-                    f"Failed to forward HTTP request to MATLAB with error: {err}"
-                )
-                raise web.HTTPNotFound()
+            logger.error(f"Failed to forward HTTP request to MATLAB with error: {err}")
+            raise web.HTTPNotFound()
 
 
 def _is_websocket_upgrade_request(request_method, request_headers):
@@ -797,6 +1300,21 @@ async def transform_request_url(req, matlab_base_url):
     return original_request_url
 
 
+def _is_body_transform_required(req):
+    """Check if the body of the request may need to be rewritten before it is sent to MATLAB.
+    Such requests are buffered, while all others are streamed.
+
+    Args:
+        req (HTTPRequest): HTTPRequest Object.
+
+    Returns:
+        bool: True if the request is a POST request to the messageservice/json/secure endpoint.
+    """
+    return req.method == "POST" and req.rel_url.path.endswith(
+        "messageservice/json/secure"
+    )
+
+
 async def transform_body(req):
     """Transform HTTP POST requests as required by the MATLAB JavaScript Desktop.
 
@@ -810,7 +1328,7 @@ async def transform_body(req):
     body = await req.read()
 
     # Only attempt to rewrite requests known to need rewriting
-    if req.method == "POST" and req.rel_url.path.endswith("messageservice/json/secure"):
+    if _is_body_transform_required(req):
         data = json.loads(body)
         # Change messages.ClientType.properties.TYPE if necessary
         try:
@@ -881,12 +1399,21 @@ async def cleanup_background_tasks(app):
     state = app["state"]
     state.clean_up_mwi_server_session()
 
+    # Close status streams, as the server waits for all open requests to complete before shutting down.
+    state.close_status_streams()
+
+    # Close websocket connections to MATLAB for the same reason.
+    await app["ws_registry"].close_all()
+
     await state.stop_matlab(force_quit=True)
 
     # Cleanup server tasks
     server_tasks = state.server_tasks
     await util.cancel_tasks(server_tasks)
 
+    # Close any connections to the Embedded Connector which outlived MATLAB
+    await state.close_embedded_connector_pool()
+
 
 def configure_and_start(app):
     """Configure the site for the app and update app with appropriate values
@@ -910,6 +1437,8 @@ def configure_and_start(app):
             f, cookie_name="matlab-proxy-session-" + uniqify_session_cookie
         ),
     )
+    # Session cookies encrypted with the above key which are known to be valid.
+    app["auth_verdict_cache"] = token_auth.AuthVerdictCache()
 
     # Setup runner
     runner = web.AppRunner(
@@ -960,21 +1489,55 @@ def create_app(config_name=matlab_proxy.get_default_config_name()):
     # Initialise application state
     app["state"] = AppState(app["settings"])
 
+    # Websocket connections which are being relayed to MATLAB.
+    app["ws_registry"] = websocket_relay.WebSocketRegistry()
+
+    # Memory budget shared by the websocket messages waiting to be relayed on all connections.
+    app["ws_memory_budget"] = websocket_relay.MemoryBudget(
+        app["settings"]["mwi_ws_memory_budgets"]["total"],
+        wait_timeout=constants.WS_MEMORY_BUDGET_WAIT_SECONDS,
+    )
+
     # In development mode, the node development server proxies requests to this
     # development server instead of serving the static files directly
     if not mwi_env.is_development_mode_enabled():
         app["static_route_table"] = make_static_route_table(app)
-        for key in app["static_route_table"].keys():
-            app.router.add_route("GET", key, static_get)
+        # Serve all static files through a single resource, so that the cost of resolving
+        # the routes registered after it does not grow with the number of static files.
+        app.router.register_resource(
+            StaticFilesResource(
+                app["settings"]["base_url"], app["static_route_table"], static_get
+            )
+        )
 
     base_url = app["settings"]["base_url"]
     app.router.add_route("GET", f"{base_url}/get_status", get_status)
+    app.router.add_route("GET", f"{base_url}/status_stream", status_stream)
     app.router.add_route("POST", f"{base_url}/authenticate", authenticate)
     app.router.add_route("GET", f"{base_url}/get_auth_token", get_auth_token)
     app.router.add_route("GET", f"{base_url}/get_env_config", get_env_config)
     app.router.add_route("PUT", f"{base_url}/start_matlab", start_matlab)
     app.router.add_route("POST", f"{base_url}/clear_client_id", clear_client_id)
     app.router.add_route("DELETE", f"{base_url}/stop_matlab", stop_matlab)
+    app.router.add_route(
+        "GET",
+        f"{base_url}/get_embedded_connector_pool_stats",
+        get_embedded_connector_pool_stats,
+    )
+    app.router.add_route(
+        "GET",
+        f"{base_url}/get_matlab_state_polling_stats",
+        get_matlab_state_polling_stats,
+    )
+    app.router.add_route(
+        "GET", f"{base_url}/get_background_task_stats", get_background_task_stats
+    )
+    app.router.add_route(
+        "GET", f"{base_url}/get_websocket_connections", get_websocket_connections
+    )
+    app.router.add_route(
+        "GET", f"{base_url}/get_matlab_startup_report", get_matlab_startup_report
+    )
     app.router.add_route("PUT", f"{base_url}/set_licensing_info", set_licensing_info)
     app.router.add_route("PUT", f"{base_url}/update_entitlement", update_entitlement)
     app.router.add_route(
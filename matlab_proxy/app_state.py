@@ -2,22 +2,29 @@
 
 import asyncio
 import contextlib
+import hashlib
 import json
 import logging
+import math
 import os
 import sys
 import time
 import uuid
-from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Callable, Final, Optional
+from typing import Callable, Final, Hashable, Optional, Tuple
 
 from matlab_proxy import util
 from matlab_proxy.constants import (
     CHECK_MATLAB_STATUS_INTERVAL_SECONDS,
+    CHECK_MATLAB_STATUS_INTERVAL_WHILE_STARTING_SECONDS,
+    CLIENT_ACTIVITY_WINDOW_SECONDS,
     CONNECTOR_SECUREPORT_FILENAME,
     IS_CONCURRENCY_CHECK_ENABLED,
     MATLAB_LOGS_FILE_NAME,
+    MATLAB_STARTUP_HISTOGRAM_BUCKETS_SECONDS,
+    MAX_MATLAB_LOG_BYTES,
+    MAX_MATLAB_LOG_LINES,
+    TIMER_WHEEL_RESOLUTION_SECONDS,
     USER_CODE_OUTPUT_FILE_NAME,
 )
 from matlab_proxy.settings import get_process_startup_timeout
@@ -37,10 +44,41 @@ from matlab_proxy.util.mwi.exceptions import (
     WindowManagerError,
     log_error,
 )
+from matlab_proxy.util.file_watcher import read_file_when_ready
+from matlab_proxy.util.polling import AdaptivePollingScheduler
+from matlab_proxy.util.startup_report import StartupReport
 
 logger = mwi.logger.get()
 
 
+def _make_json_snapshot(data):
+    """Serializes data to JSON and computes a strong ETag for it.
+
+    Args:
+        data (Dict): Data to be serialized.
+
+    Returns:
+        Tuple[str, bytes]: ETag and JSON encoded data.
+    """
+    body = json.dumps(data).encode()
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"', body
+
+
+@contextlib.contextmanager
+def _record_duration(timings, phase):
+    """Records the time taken by the enclosed block in seconds into timings[phase].
+
+    Args:
+        timings (Dict): Dictionary to record the duration into.
+        phase (str): Name of the phase.
+    """
+    start_time = time.monotonic()
+    try:
+        yield
+    finally:
+        timings[phase] = round(time.monotonic() - start_time, 3)
+
+
 class AppState:
     """A Class which represents the state of the App.
     This class handles state of MATLAB, MATLAB Licensing and Xvfb.
@@ -57,7 +95,49 @@ class AppState:
             settings (Dict): Represents the settings required for managing MATLAB, Licensing and Xvfb.
         """
         self.settings = settings
-        self.processes = {"matlab": None, "xvfb": None}
+        # The Xvfb and window manager processes outlive MATLAB when it is restarted, see __start_display()
+        self.processes = {"matlab": None, "xvfb": None, "window_manager": None}
+
+        # Incremented whenever a field which is part of the status sent to clients changes.
+        # Must be initialized before any of those fields are set.
+        self.__status_version = 0
+        self.__status_changed_event = asyncio.Event()
+        self.__licensing = None
+        self.__error = None
+        self.__warnings = []
+        self.__matlab_busy_state = None
+        self.__active_client = None
+
+        # Serialized copies of the status and environment configuration sent to clients, along with their ETags.
+        # The status snapshots are only valid for the status version they were created at.
+        self.__status_snapshots = {}
+        self.__status_snapshots_version = None
+        self.__env_config_snapshots = {}
+
+        # Number of open status streams per client id, used to detect whether the active client is still connected.
+        self.__status_stream_clients = {}
+        self.__are_status_streams_closed = False
+
+        # Time (as per time.monotonic()) at which a client last sent a request.
+        self.__last_client_activity_time = None
+
+        # Time (as per time.monotonic()) after which matlab-proxy shuts down, if the IDLE timeout is enabled.
+        # Moved forward on activity and compared against the clock only when needed.
+        self.__idle_deadline = None
+
+        # Shared timers on which the periodic background tasks sleep, so that their wake ups are coalesced.
+        self.timer_wheel = util.TimerWheel(resolution=TIMER_WHEEL_RESOLUTION_SECONDS)
+
+        # Decides how often the state of MATLAB is probed by the update_matlab_state task.
+        self.matlab_state_polling = AdaptivePollingScheduler(
+            base_interval=CHECK_MATLAB_STATUS_INTERVAL_SECONDS,
+            starting_interval=CHECK_MATLAB_STATUS_INTERVAL_WHILE_STARTING_SECONDS,
+            max_interval=self.settings.get(
+                "mwi_matlab_status_max_interval",
+                mwi.validators.validate_matlab_status_max_interval(None),
+            ),
+            timer_wheel=self.timer_wheel,
+        )
 
         # Timeout for processes started by matlab-proxy
         self.PROCESS_TIMEOUT = get_process_startup_timeout()
@@ -65,6 +145,21 @@ class AppState:
         # The port on which MATLAB(started by this matlab-proxy process) starts on.
         self.matlab_port = None
 
+        # Time taken in seconds by each phase of the latest start of MATLAB, by phase.
+        self.matlab_startup_timings = {}
+
+        # Time at which each phase of starting MATLAB was completed, for the latest and all previous starts.
+        self.matlab_startup_report = StartupReport(
+            MATLAB_STARTUP_HISTOGRAM_BUCKETS_SECONDS
+        )
+
+        # Pool of keep-alive connections to the Embedded Connector of the MATLAB process started by this matlab-proxy process.
+        # Created once the Embedded Connector has written its port information and closed when MATLAB is stopped.
+        self.embedded_connector_pool = None
+
+        # Client used to check the health of the Embedded Connector, with the same lifetime as embedded_connector_pool.
+        self.embedded_connector_health_client = None
+
         # The directory in which the instance of MATLAB (started by this matlab-proxy process) will write logs to.
         self.mwi_logs_dir = None
 
@@ -81,11 +176,17 @@ class AppState:
         }
 
         self.licensing = None
+        # Tokens and entitlements fetched from MathWorks servers for online licensing
+        self.licensing_cache = mw.LicensingCache()
         # MATLAB process related tasks which have the same lifetime as MATLAB
         self.matlab_tasks = {}
         self.logs = {
-            "matlab": deque(maxlen=200),
+            "matlab": mw.BoundedLogBuffer(
+                max_lines=MAX_MATLAB_LOG_LINES, max_bytes=MAX_MATLAB_LOG_BYTES
+            ),
         }
+        # Task which stops MATLAB when an error is found in its stderr pipe while it is starting
+        self.__startup_error_stop_task = None
 
         # Initialize with the error state from the initialization of settings
         self.error = settings["error"]
@@ -130,14 +231,184 @@ class AppState:
         )
 
         if self.is_idle_timeout_enabled:
-            self.__initial_idle_timeout = self.__remaining_idle_timeout = self.settings[
-                "mwi_idle_timeout"
-            ]
+            self.__initial_idle_timeout = self.settings["mwi_idle_timeout"]
+            self.__idle_deadline = time.monotonic() + self.__initial_idle_timeout
             # Lock to be used before updating IDLE timer.
             self.idle_timeout_lock = util.TrackingLock(purpose="MATLAB IDLE timer")
-            self.server_tasks["decrement_idle_timer"] = loop.create_task(
-                self.__decrement_idle_timer()
-            )
+            self.server_tasks["idle_timer"] = loop.create_task(self.__run_idle_timer())
+
+    @property
+    def status_version(self) -> int:
+        """Returns a number which is incremented whenever the status sent to clients changes."""
+        return self.__status_version
+
+    def notify_status_change(self) -> None:
+        """Signals that a field which is part of the status sent to clients has changed.
+        Needs to be called explicitly only when such a field is mutated in place."""
+        self.__status_version += 1
+
+        # Wake up all the waiters, and create a new event for subsequent waiters.
+        event, self.__status_changed_event = (
+            self.__status_changed_event,
+            asyncio.Event(),
+        )
+        event.set()
+
+    async def wait_for_status_change(self, version, timeout=None) -> int:
+        """Waits until the status sent to clients changes from the given version, or until the timeout expires.
+
+        Args:
+            version (int): The version of the status last seen by the caller.
+            timeout (float, optional): Time in seconds to wait for. Defaults to None, which waits indefinitely.
+
+        Returns:
+            int: The current version of the status.
+        """
+        if version == self.__status_version:
+            # Unlike asyncio.wait_for(), asyncio.wait() never swallows the cancellation of the caller.
+            waiter = asyncio.ensure_future(self.__status_changed_event.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=timeout)
+            finally:
+                waiter.cancel()
+
+        return self.__status_version
+
+    def get_status_snapshot(
+        self, key: Hashable, marshal: Callable[[], dict]
+    ) -> Tuple[str, bytes]:
+        """Returns the status sent to clients serialized to JSON, along with its ETag.
+
+        The serialized status is cached until the status version changes, so that clients
+        polling for the status do not each marshal and serialize the same status.
+
+        Args:
+            key (Hashable): Identifies a variant of the status, eg: whether the client is the active client.
+            marshal (Callable): Returns the status as a Dict. Called only when there is no valid cached copy.
+
+        Returns:
+            Tuple[str, bytes]: ETag and JSON encoded body of the status.
+        """
+        if self.__status_snapshots_version != self.__status_version:
+            self.__status_snapshots = {}
+            self.__status_snapshots_version = self.__status_version
+
+        snapshot = self.__status_snapshots.get(key)
+        if snapshot is None:
+            snapshot = self.__status_snapshots[key] = _make_json_snapshot(marshal())
+
+        return snapshot
+
+    def get_env_config_snapshot(
+        self, key: Hashable, marshal: Callable[[], dict]
+    ) -> Tuple[str, bytes]:
+        """Returns the environment configuration sent to clients serialized to JSON, along with its ETag.
+
+        Args:
+            key (Hashable): Values of all the fields of the configuration which can change while the server is running.
+            marshal (Callable): Returns the configuration as a Dict. Called only when there is no cached copy for the key.
+
+        Returns:
+            Tuple[str, bytes]: ETag and JSON encoded body of the environment configuration.
+        """
+        snapshot = self.__env_config_snapshots.get(key)
+        if snapshot is None:
+            snapshot = self.__env_config_snapshots[key] = _make_json_snapshot(marshal())
+
+        return snapshot
+
+    def record_client_activity(self) -> None:
+        """Records that a client has sent a request to the server."""
+        self.__last_client_activity_time = time.monotonic()
+
+    def has_connected_clients(self) -> bool:
+        """Returns True if a client has an open status stream or has recently sent a request to the server."""
+        if self.__status_stream_clients:
+            return True
+
+        return (
+            self.__last_client_activity_time is not None
+            and time.monotonic() - self.__last_client_activity_time
+            < CLIENT_ACTIVITY_WINDOW_SECONDS
+        )
+
+    def add_status_stream_client(self, client_id) -> None:
+        """Registers an open status stream for the client."""
+        self.__status_stream_clients[client_id] = (
+            self.__status_stream_clients.get(client_id, 0) + 1
+        )
+
+    def remove_status_stream_client(self, client_id) -> None:
+        """Unregisters an open status stream for the client."""
+        count = self.__status_stream_clients.get(client_id, 0) - 1
+        if count > 0:
+            self.__status_stream_clients[client_id] = count
+        else:
+            self.__status_stream_clients.pop(client_id, None)
+
+    @property
+    def are_status_streams_closed(self) -> bool:
+        """Returns True once the server has asked all status streams to close."""
+        return self.__are_status_streams_closed
+
+    def close_status_streams(self) -> None:
+        """Asks all open status streams to close, so that the server can shutdown without waiting on them."""
+        self.__are_status_streams_closed = True
+        self.notify_status_change()
+
+    @property
+    def error(self):
+        """Returns the error (if any) to be displayed to clients."""
+        return self.__error
+
+    @error.setter
+    def error(self, new_error):
+        if new_error is not self.__error:
+            self.__error = new_error
+            self.notify_status_change()
+
+    @property
+    def warnings(self):
+        """Returns the list of warnings to be displayed to clients."""
+        return self.__warnings
+
+    @warnings.setter
+    def warnings(self, new_warnings):
+        self.__warnings = new_warnings
+        self.notify_status_change()
+
+    @property
+    def licensing(self):
+        """Returns the licensing information of MATLAB."""
+        return self.__licensing
+
+    @licensing.setter
+    def licensing(self, new_licensing):
+        self.__licensing = new_licensing
+        self.notify_status_change()
+
+    @property
+    def matlab_busy_state(self):
+        """Returns the busy state of MATLAB, either 'busy', 'idle' or None."""
+        return self.__matlab_busy_state
+
+    @matlab_busy_state.setter
+    def matlab_busy_state(self, new_busy_state):
+        if new_busy_state != self.__matlab_busy_state:
+            self.__extend_idle_deadline_if_matlab_is_active()
+            self.__matlab_busy_state = new_busy_state
+            self.notify_status_change()
+
+    @property
+    def active_client(self):
+        """Returns the client id of the active client."""
+        return self.__active_client
+
+    @active_client.setter
+    def active_client(self, new_active_client):
+        if new_active_client != self.__active_client:
+            self.__active_client = new_active_client
+            self.notify_status_change()
 
     def set_remaining_idle_timeout(self, new_timeout):
         """Sets the remaining IDLE timeout after the validating checks.
@@ -145,11 +416,10 @@ class AppState:
         Args:
             new_timeout (int): New timeout value
         """
-        caller = util.get_caller_name()
-        if self.idle_timeout_lock.validate_lock_for_caller(caller):
-            self.__remaining_idle_timeout = new_timeout
+        if self.idle_timeout_lock.validate_lock_for_current_task():
+            self.__idle_deadline = time.monotonic() + new_timeout
             logger.debug(
-                f"'{util.get_caller_name()}()' function acquired the lock to update IDLE timer"
+                f"'{self.idle_timeout_lock.acquired_by}()' function acquired the lock to update IDLE timer"
             )
 
         else:
@@ -162,45 +432,52 @@ class AppState:
         Returns:
             int: Remaining IDLE timeout
         """
+        # The IDLE timer does not run out while MATLAB is starting, stopping or busy.
+        if self.__is_matlab_active():
+            return self.__initial_idle_timeout
 
-        # Lock is not required when reading __idle_timeout_left as the value maybe atmost 1 second old.
-        # Additionally, having a lock for the getter will increase the latency for the /get_status requests coming in.
-        return self.__remaining_idle_timeout
+        # Computed on demand from the deadline, so no lock or background task is required to keep it up to date.
+        remaining = self.__idle_deadline - time.monotonic()
+        return max(0, math.ceil(remaining))
 
     async def reset_timer(self):
-        """Resets the IDLE timer to its original value after acquiring a lock."""
-        await self.idle_timeout_lock.acquire()
-        self.set_remaining_idle_timeout(self.__initial_idle_timeout)
-        await self.idle_timeout_lock.release()
+        """Resets the IDLE timer to its original value.
 
-        logger.debug(
-            f"IDLE timer has been reset to {self.get_remaining_idle_timeout()} seconds"
+        Only the deadline is moved forward, which is cheap enough to be done on every request.
+        """
+        self.__idle_deadline = time.monotonic() + self.__initial_idle_timeout
+
+    def __is_matlab_active(self) -> bool:
+        return (
+            self.__matlab_state in ["starting", "stopping"]
+            or self.__matlab_busy_state == "busy"
         )
 
-    async def __decrement_idle_timer(self):
-        """Decrements the IDLE timer by 1 after acquiring a lock."""
-        this_task = "decrement_idle_timer"
+    def __extend_idle_deadline_if_matlab_is_active(self):
+        # Called before the state of MATLAB changes, so that the IDLE timer restarts from the
+        # moment MATLAB stops being active.
+        if self.__idle_deadline is not None and self.__is_matlab_active():
+            self.__idle_deadline = time.monotonic() + self.__initial_idle_timeout
+
+    async def __run_idle_timer(self):
+        """Shuts down matlab-proxy once the IDLE deadline has passed.
+
+        Sleeps until the deadline instead of waking up every second. If the deadline was moved
+        forward in the meantime, or MATLAB is active, sleeps again until the new deadline.
+        """
+        this_task = "idle_timer"
         logger.debug(f"{this_task}: Starting task...")
 
-        while self.get_remaining_idle_timeout() > 0:
-            # If MATLAB is either starting, stopping or busy, reset the IDLE timer.
-            if (
-                self.get_matlab_state() in ["starting", "stopping"]
-                or self.matlab_busy_state == "busy"
-            ):
+        while True:
+            if self.__is_matlab_active():
                 await self.reset_timer()
 
-            else:
-                new_value = self.get_remaining_idle_timeout() - 1
-                await self.idle_timeout_lock.acquire()
-                self.set_remaining_idle_timeout(new_value)
-                await self.idle_timeout_lock.release()
-
-                logger.debug(
-                    f"{this_task}: IDLE timer decremented to {new_value} seconds"
-                )
+            remaining = self.__idle_deadline - time.monotonic()
+            if remaining <= 0:
+                break
 
-            await asyncio.sleep(1)
+            logger.debug(f"{this_task}: IDLE timer runs out in {remaining:.0f} seconds")
+            await self.timer_wheel.sleep(this_task, remaining)
 
         logger.info("The IDLE timer for shutdown has run out...")
         logger.info(f"Shutting down {self.settings['integration_name']}")
@@ -374,14 +651,18 @@ class AppState:
 
     async def __update_matlab_state_using_ping_endpoint(self) -> None:
         """Updates MATLAB and its busy state based on the response from PING endpoint"""
-        # matlab-proxy sends a request to itself to the endpoint: /messageservice/json/state
-        # which the server redirects to the matlab_view() function to handle (which then sends the request to EC)
-        headers = self._get_token_auth_headers()
+        # Once the port of the Embedded Connector is known, the request is sent directly to it.
+        # Until then, matlab-proxy sends a request to itself to the endpoint: /messageservice/json/state
+        # which the server redirects to the matlab_view() function to handle.
         self.embedded_connector_state = await mwi.embedded_connector.request.get_state(
             mwi_server_url=self.settings["mwi_server_url"],
-            headers=headers,
+            headers=self._get_token_auth_headers(),
+            health_client=self.embedded_connector_health_client,
         )
 
+        if self.embedded_connector_state == "up":
+            self.matlab_startup_report.mark("embeddedConnectorPinged")
+
         await self.__update_matlab_state_based_on_connector_state()
 
         # When using the 'ping' endpoint its not possible to determine the busy status
@@ -393,15 +674,17 @@ class AppState:
 
     async def __update_matlab_state_using_busy_status_endpoint(self) -> None:
         """Updates MATLAB and its busy state based on the response from 'ping' endpoint"""
-        # matlab-proxy sends a request to itself to the endpoint: /messageservice/json/state
-        # which the server redirects to the matlab_view() function to handle (which then sends the request to EC)
-        headers = self._get_token_auth_headers()
+        # Sent directly to the Embedded Connector once its port is known, see __update_matlab_state_using_ping_endpoint()
         self.matlab_busy_state = await mwi.embedded_connector.request.get_busy_state(
             mwi_server_url=self.settings["mwi_server_url"],
-            headers=headers,
+            headers=self._get_token_auth_headers(),
+            health_client=self.embedded_connector_health_client,
         )
 
         self.embedded_connector_state = "down" if not self.matlab_busy_state else "up"
+        if self.matlab_busy_state:
+            self.matlab_startup_report.mark("busyStatusAvailable")
+
         await self.__update_matlab_state_based_on_connector_state()
 
     async def __update_matlab_state_based_on_endpoint_to_use(
@@ -450,7 +733,11 @@ class AppState:
                 f"{this_task}: Required processes are ready, Embedded Connector status is '{self.get_matlab_state()}'"
             )
 
-        await asyncio.sleep(CHECK_MATLAB_STATUS_INTERVAL_SECONDS)
+        await self.matlab_state_polling.wait_for_next_probe(
+            matlab_state=self.get_matlab_state(),
+            matlab_busy_state=self.matlab_busy_state,
+            has_clients=self.has_connected_clients(),
+        )
 
     async def __update_matlab_state(self) -> None:
         """An indefinitely running asyncio task which determines the status of MATLAB to be down/starting/up."""
@@ -486,6 +773,7 @@ class AppState:
                     warning = f"{mwi_env.get_env_name_shutdown_on_idle_timeout()} environment variable is supported only for MATLAB versions R2021a or later"
                     logger.warning(warning)
                     self.warnings.append(warning)
+                    self.notify_status_change()
 
                 else:
                     logger.debug(
@@ -505,10 +793,14 @@ class AppState:
         Args:
             new_state (str): The new state of MATLAB
         """
-        caller = util.get_caller_name()
-        if self.matlab_state_updater_lock.validate_lock_for_caller(caller):
-            self.__matlab_state = new_state
-            logger.debug(f"'{caller}()' function updated MATLAB state to '{new_state}'")
+        if self.matlab_state_updater_lock.validate_lock_for_current_task():
+            if new_state != self.__matlab_state:
+                self.__extend_idle_deadline_if_matlab_is_active()
+                self.__matlab_state = new_state
+                self.notify_status_change()
+            logger.debug(
+                f"'{self.matlab_state_updater_lock.acquired_by}()' function updated MATLAB state to '{new_state}'"
+            )
 
         else:
             # NOTE: This code branch should only ever be hit during development. We exit to enforce proper usage of this function during development time.
@@ -527,6 +819,7 @@ class AppState:
     async def stop_server_tasks(self):
         """Stops all matlab-proxy server tasks"""
         await util.cancel_tasks(self.server_tasks)
+        await self.licensing_cache.close()
 
     def _are_required_processes_ready(
         self, matlab_process=None, xvfb_process=None
@@ -631,10 +924,11 @@ class AppState:
                 return
 
         # If the matlab_ready_file path is constructed and is not yet created by the embedded connector.
-        if matlab_ready_file and not matlab_ready_file.exists():
+        # Once matlab_port has been read from the file, it is known to exist and is not checked on every probe.
+        if not self.__is_matlab_ready_file_found(matlab_ready_file):
             await self.matlab_state_updater_lock.acquire()
-            if (
-                matlab_ready_file and not matlab_ready_file.exists()
+            if not self.__is_matlab_ready_file_found(
+                matlab_ready_file
             ):  # Double check that matlab_ready_file is truthy and exists before invoking set_matlab_state()
                 self.set_matlab_state("starting")
                 await self.matlab_state_updater_lock.release()
@@ -648,16 +942,21 @@ class AppState:
 
         await func_to_update_matlab_state()
 
+    def __is_matlab_ready_file_found(self, matlab_ready_file) -> bool:
+        return self.matlab_port is not None or matlab_ready_file.exists()
+
     async def set_licensing_nlm(self, conn_str):
         """Set the licensing type to NLM and the connection string."""
 
         # TODO Validate connection string
         self.licensing = {"type": "nlm", "conn_str": conn_str}
+        self.licensing_cache.clear()
         self.persist_config_data()
 
     def set_licensing_existing_license(self):
         """Set the licensing type to NLM and the connection string."""
         self.licensing = {"type": "existing_license"}
+        self.licensing_cache.clear()
         self.persist_config_data()
 
     async def set_licensing_mhlm(
@@ -678,7 +977,23 @@ class AppState:
             entitlement_id (String, optional): ID of an entitlement. Defaults to None.
         """
         try:
-            token_data = await mw.fetch_expand_token(
+            # The entitlements do not depend on the details of the user, so they are fetched concurrently
+            # and served from the cache to update_entitlements() below. Errors in fetching them are
+            # raised by update_entitlements().
+            entitlements_task = asyncio.ensure_future(
+                self.licensing_cache.fetch_entitlements(
+                    self.settings["mwa_api_endpoint"],
+                    self.settings["mhlm_api_endpoint"],
+                    identity_token,
+                    source_id,
+                    self.settings["matlab_version"],
+                )
+            )
+            entitlements_task.add_done_callback(
+                lambda task: task.cancelled() or task.exception()
+            )
+
+            token_data = await self.licensing_cache.fetch_expand_token(
                 self.settings["mwa_api_endpoint"], identity_token, source_id
             )
 
@@ -717,6 +1032,7 @@ class AppState:
         """Unset the licensing."""
 
         self.licensing = None
+        self.licensing_cache.clear()
 
         # If the error was due to licensing, clear it
         if isinstance(self.error, LicensingError):
@@ -760,17 +1076,12 @@ class AppState:
             )
 
         try:
-            # Fetch an access token
-            access_token_data = await mw.fetch_access_token(
+            # Fetch entitlements, along with the access token required to fetch them
+            entitlements = await self.licensing_cache.fetch_entitlements(
                 self.settings["mwa_api_endpoint"],
+                self.settings["mhlm_api_endpoint"],
                 self.licensing["identity_token"],
                 self.licensing["source_id"],
-            )
-
-            # Fetch entitlements
-            entitlements = await mw.fetch_entitlements(
-                self.settings["mhlm_api_endpoint"],
-                access_token_data["token"],
                 self.settings["matlab_version"],
             )
 
@@ -787,6 +1098,7 @@ class AppState:
             self.licensing["profile_id"] = None
             self.licensing["entitlements"] = []
             self.licensing["entitlement_id"] = None
+            self.notify_status_change()
             # To ensure that any entitlement errors are displayed on the control panel,
             # the function returns true. The cached license file only contains the license type
             # and the user's email address. These two attributes are necessary for preventing
@@ -808,9 +1120,17 @@ class AppState:
 
         self.licensing["entitlements"] = entitlements
 
+        # Keep the access token fresh, so that starting MATLAB does not wait on a request to MathWorks servers.
+        self.licensing_cache.start_refresh(
+            self.settings["mwa_api_endpoint"],
+            self.licensing["identity_token"],
+            self.licensing["source_id"],
+        )
+
         # Auto-select the entitlement if only one entitlement is returned from MHLM
         if len(entitlements) == 1:
             self.licensing["entitlement_id"] = entitlements[0]["id"]
+        self.notify_status_change()
 
         # Successful update
         return True
@@ -818,6 +1138,7 @@ class AppState:
     # Set the entitlement information on app state as well as the cached file
     async def update_user_selected_entitlement_info(self, entitlement_id):
         self.licensing["entitlement_id"] = entitlement_id
+        self.notify_status_change()
         logger.debug(f"Successfully set {entitlement_id} as the entitlement_id")
         self.persist_config_data()
 
@@ -924,29 +1245,29 @@ class AppState:
             # Files may not exist if cleanup is called before they are created
             pass
 
-    async def __setup_env_for_matlab(self) -> dict:
-        """Configure the environment variables required for starting MATLAB by matlab-proxy.
+    async def __get_licensing_env_for_matlab(self) -> dict:
+        """Configure the environment variables related to licensing required for starting MATLAB.
+        For online licensing, this requests an access token from MathWorks.
 
         Returns:
             [dict]: Containing keys as the Env variable names and values are its corresponding values.
         """
-        matlab_env = os.environ.copy()
+        licensing_env = {}
 
-        # Env setup related to licensing
         # No additional env setup required if licensing type is set to existing_license
         if self.licensing["type"] == "mhlm":
             try:
-                # Request an access token
-                access_token_data = await mw.fetch_access_token(
+                # Request an access token, which is served from the cache unless it is about to expire
+                access_token_data = await self.licensing_cache.fetch_access_token(
                     self.settings["mwa_api_endpoint"],
                     self.licensing["identity_token"],
                     self.licensing["source_id"],
                 )
-                matlab_env["MLM_WEB_LICENSE"] = "true"
-                matlab_env["MLM_WEB_USER_CRED"] = access_token_data["token"]
-                matlab_env["MLM_WEB_ID"] = self.licensing["entitlement_id"]
+                licensing_env["MLM_WEB_LICENSE"] = "true"
+                licensing_env["MLM_WEB_USER_CRED"] = access_token_data["token"]
+                licensing_env["MLM_WEB_ID"] = self.licensing["entitlement_id"]
 
-                matlab_env["MHLM_CONTEXT"] = (
+                licensing_env["MHLM_CONTEXT"] = (
                     "MATLAB_JAVASCRIPT_DESKTOP"
                     if os.getenv(mwi_env.get_env_name_mhlm_context()) is None
                     else os.getenv(mwi_env.get_env_name_mhlm_context())
@@ -955,7 +1276,26 @@ class AppState:
                 raise e
 
         elif self.licensing["type"] == "nlm":
-            matlab_env["MLM_LICENSE_FILE"] = self.licensing["conn_str"]
+            licensing_env["MLM_LICENSE_FILE"] = self.licensing["conn_str"]
+
+        return licensing_env
+
+    async def __setup_env_for_matlab(self, licensing_env=None) -> dict:
+        """Configure the environment variables required for starting MATLAB by matlab-proxy.
+
+        Args:
+            licensing_env (dict, optional): Environment variables related to licensing, if already fetched.
+                Defaults to None, in which case they are fetched.
+
+        Returns:
+            [dict]: Containing keys as the Env variable names and values are its corresponding values.
+        """
+        matlab_env = os.environ.copy()
+
+        # Env setup related to licensing
+        if licensing_env is None:
+            licensing_env = await self.__get_licensing_env_for_matlab()
+        matlab_env.update(licensing_env)
 
         # Env setup related to MATLAB
         ## Update the values only if it does not already exist in the environment
@@ -1048,6 +1388,78 @@ class AppState:
             key: value for key, value in env_vars.items() if not key.startswith(prefix)
         }
 
+    async def __start_display(self, timings) -> bool:
+        """Starts the Xvfb process and then the window manager on linux, if they are available.
+
+        Processes which are still running from a previous start of MATLAB are reused, and only
+        those which have exited are started again.
+
+        Args:
+            timings (Dict): Dictionary to record the time taken to start each of them into.
+
+        Returns:
+            bool: False if the Xvfb process failed to start, True otherwise.
+        """
+        # Start Xvfb process on linux if possible
+        if system.is_linux() and self.settings["is_xvfb_available"]:
+            if self.__is_process_running(self.processes["xvfb"]):
+                logger.info(
+                    f"Reusing Xvfb with PID={self.processes['xvfb'].pid} on DISPLAY={self.settings.get('matlab_display')}"
+                )
+
+            else:
+                # The window manager is tied to the display of the Xvfb process which has exited.
+                await self.__stop_display()
+
+                with _record_duration(timings, "xvfb"):
+                    xvfb = await self.__start_xvfb_process()
+
+                # xvfb variable would be None if creation of the process failed.
+                if xvfb is None:
+                    return False
+
+                self.processes["xvfb"] = xvfb
+
+            self.matlab_startup_report.mark("xvfbReady")
+
+        # Start Window Manager on linux if possible
+        if system.is_linux() and self.settings["is_windowmanager_available"]:
+            window_manager = self.processes.get("window_manager")
+            if self.__is_process_running(window_manager):
+                logger.info(f"Reusing window manager with PID={window_manager.pid}")
+
+            else:
+                display = self.settings.get("matlab_display", None)
+                with _record_duration(timings, "windowManager"):
+                    self.processes["window_manager"] = (
+                        await self.__start_window_manager(display)
+                    )
+
+            self.matlab_startup_report.mark("windowManagerReady")
+
+        return True
+
+    @staticmethod
+    def __is_process_running(process) -> bool:
+        return process is not None and process.returncode is None
+
+    async def __stop_display(self):
+        """Terminates the window manager and Xvfb processes, if they are running."""
+        if not system.is_posix():
+            return
+
+        waiters = []
+        for name in ["window_manager", "xvfb"]:
+            process = self.processes.get(name)
+            if self.__is_process_running(process):
+                logger.debug(f"Terminating {name} (PID={process.pid})")
+                process.terminate()
+                waiters.append(process.wait())
+            self.processes[name] = None
+
+        for waiter in waiters:
+            await waiter
+
     async def __start_window_manager(self, display=None):
         if display is None:
             logger.info("Not starting fluxbox as display is not provided")
@@ -1059,14 +1471,15 @@ class AppState:
 
         try:
             logger.info(f"Starting window manager with DISPLAY={wm_env['DISPLAY']}")
+            # Nothing reads the output of fluxbox, which would fill up a pipe and block it, so it is discarded.
             return await asyncio.create_subprocess_exec(
-                *wm_cmd, close_fds=False, env=wm_env, stderr=asyncio.subprocess.PIPE
+                *wm_cmd, close_fds=False, env=wm_env, stderr=asyncio.subprocess.DEVNULL
             )
 
         except Exception as err:
             self.error = WindowManagerError(
                 "Unable to start the Fluxbox Window Manager due to the following error: "
-                + err
+                + str(err)
             )
             # Log the error on the console.
             log_error(logger, self.error)
@@ -1083,7 +1496,7 @@ class AppState:
 
         # Start Xvfb process and update display number in settings
         create_xvfb_cmd = self.settings["create_xvfb_cmd"]
-        xvfb_cmd, dpipe = create_xvfb_cmd()
+        xvfb_cmd, dpipe = create_xvfb_cmd(self.settings.get("mwi_xvfb_options"))
         filtered_env_variables = AppState.__filter_env_variables(
             os.environ.copy(), "MWI_"
         )
@@ -1180,6 +1593,7 @@ class AppState:
         This task will start and stop with the MATLAB process.
         """
         this_task = "track_embedded_connector_state:"
+        job_name = "track_embedded_connector_state"
         logger.debug(f"{this_task}: Starting task...")
 
         while True:
@@ -1188,7 +1602,7 @@ class AppState:
                     f"{this_task}: MATLAB Embedded Connector is up, not checking for any errors in MATLABs stderr pipe. Sleeping for 10 seconds..."
                 )
                 # Embedded connector is up, sleep for 10 seconds and recheck again
-                await asyncio.sleep(10)
+                await self.timer_wheel.sleep(job_name, 10)
                 continue
 
             # Embedded connector is down, so check for how long it has been down and error out if necessary
@@ -1196,7 +1610,7 @@ class AppState:
             else:
                 # If its not yet set, sleep for 1 second and recheck again
                 if not self.embedded_connector_start_time:
-                    await asyncio.sleep(1)
+                    await self.timer_wheel.sleep(job_name, 1)
                     continue
 
                 else:
@@ -1215,7 +1629,7 @@ class AppState:
                             # Stopping the MATLAB process would remove the UI window displaying the error too.
                             # Do not stop the MATLAB or break from the loop (as the error is still unknown)
                             self.error = MatlabError(generic_error)
-                            await asyncio.sleep(5)
+                            await self.timer_wheel.sleep(job_name, 5)
                             continue
 
                         else:
@@ -1237,29 +1651,65 @@ class AppState:
                         logger.debug(
                             f"{this_task}: MATLAB has been in a 'starting' state for {int(time_diff)} seconds. Sleeping for 1 second..."
                         )
-                        await asyncio.sleep(1)
+                        await self.timer_wheel.sleep(job_name, 1)
 
     async def __matlab_stderr_reader_posix(self):
         """matlab_stderr_reader_posix is an asyncio task which reads the stderr pipe of the MATLAB process, parses it
         and updates state variables accordingly.
+
+        While MATLAB is starting, every line is matched for licensing and fatal startup errors, so that MATLAB
+        is stopped as soon as one is found, instead of after the startup timeout has elapsed.
         """
         if system.is_posix():
             matlab = self.processes["matlab"]
+            startup_error_detector = mw.StartupErrorDetector(self.licensing)
             logger.debug("matlab_stderr_reader_posix() task: Starting task...")
 
             while not matlab.stderr.at_eof():
                 logger.debug(
                     "matlab_stderr_reader_posix() task: Waiting to read data from stderr pipe..."
                 )
-                line = await matlab.stderr.readline()
+                try:
+                    line = await matlab.stderr.readline()
+                except ValueError:
+                    # Raised when a line is longer than the limit of the stream. The line is discarded by the stream.
+                    logger.debug(
+                        "matlab_stderr_reader_posix() task: Discarded a line which exceeded the limit of the stderr pipe"
+                    )
+                    continue
+
                 if line is None:
                     logger.debug(
                         "matlab_stderr_reader_posix() task: Received data from stderr pipe appending to logs..."
                     )
                     break
                 self.logs["matlab"].append(line)
+
+                if self.get_matlab_state() == "starting":
+                    err = startup_error_detector.feed(
+                        line.decode(errors="replace").rstrip()
+                    )
+                    if err is not None:
+                        self.__stop_matlab_on_startup_error(err)
+
             await self.handle_matlab_output()
 
+    def __stop_matlab_on_startup_error(self, err):
+        """Sets the error found in the stderr pipe of MATLAB and stops MATLAB.
+
+        Args:
+            err (MatlabError): The error.
+        """
+        self.error = err
+        log_error(logger, err)
+        logger.info("Stopping MATLAB as it failed to start")
+
+        # stop_matlab() cancels the tasks of the MATLAB process, which includes the caller of this method.
+        # So, MATLAB is stopped in a task of its own.
+        self.__startup_error_stop_task = asyncio.create_task(
+            self.stop_matlab(force_quit=True)
+        )
+
     async def __update_matlab_port(self, delay: int):
         """Task to populate matlab_port from the matlab ready file. Times out if max_duration is breached
 
@@ -1284,15 +1734,59 @@ class AppState:
             )
 
     async def __read_matlab_ready_file(self, delay):
-        # reads with delays from the file where connector has written its port information
-        while not self.matlab_session_files["matlab_ready_file"].exists():
-            await asyncio.sleep(delay)
+        # Waits for the Embedded Connector to write its port information into the ready file.
+        # Changes to the file are notified by a filesystem watcher, with the existence of the file
+        # checked every 'delay' seconds as a fallback.
+        contents = await read_file_when_ready(
+            self.matlab_session_files["matlab_ready_file"], delay
+        )
+        self.matlab_port = int(contents)
+        self.matlab_startup_report.mark("readyFileSeen")
+        logger.debug(
+            f"MATLAB Ready file successfully read, matlab_port set to: {self.matlab_port}"
+        )
 
-        with open(self.matlab_session_files["matlab_ready_file"]) as f:
-            self.matlab_port = int(f.read())
-            logger.debug(
-                f"MATLAB Ready file successfully read, matlab_port set to: {self.matlab_port}"
-            )
+        await self.__create_embedded_connector_pool()
+        self.matlab_state_polling.probe_now("MATLAB ready file found")
+
+    async def __create_embedded_connector_pool(self):
+        """Creates the pool of connections used to proxy requests to the Embedded Connector on matlab_port,
+        along with the client used to check its health. Any previously created pool is closed first.
+        """
+        await self.close_embedded_connector_pool()
+
+        matlab_protocol = self.settings.get("matlab_protocol", "http")
+        base_url = f"{matlab_protocol}://127.0.0.1:{self.matlab_port}"
+        self.embedded_connector_health_client = mwi.embedded_connector.HealthClient(
+            base_url=base_url,
+            # MATLAB serves the Embedded Connector under the base_url of matlab-proxy (MW_CONNECTOR_CONTEXT_ROOT)
+            context_root=self.settings.get("base_url", ""),
+            mwapikey=self.settings.get("mwapikey"),
+        )
+        self.embedded_connector_pool = mwi.embedded_connector.ConnectionPool(
+            base_url=base_url,
+            limit_per_host=self.settings.get(
+                "mwi_ec_pool_limit_per_host",
+                mwi.validators.validate_ec_pool_limit_per_host(None),
+            ),
+            keepalive_timeout=self.settings.get(
+                "mwi_ec_pool_keepalive_timeout",
+                mwi.validators.validate_ec_pool_keepalive_timeout(None),
+            ),
+        )
+
+    async def close_embedded_connector_pool(self):
+        """Closes the pool of connections and the health client of the Embedded Connector, if they exist."""
+        pool, self.embedded_connector_pool = self.embedded_connector_pool, None
+        if pool is not None:
+            await pool.close()
+
+        health_client, self.embedded_connector_health_client = (
+            self.embedded_connector_health_client,
+            None,
+        )
+        if health_client is not None:
+            await health_client.close()
 
     async def start_matlab(self, restart_matlab=False):
         """Start MATLAB.
@@ -1300,8 +1794,9 @@ class AppState:
         Args:
             restart_matlab (bool, optional): Whether to restart MATLAB. Defaults to False.
         """
-        # Ensure that previous processes are stopped
-        await self.stop_matlab()
+        # Ensure that previous processes are stopped.
+        # The display is kept running, as it can be reused by the MATLAB process started below.
+        await self.stop_matlab(keep_display=True)
 
         # Acquire lock before setting MATLAB state to 'starting'.
 
@@ -1311,33 +1806,57 @@ class AppState:
         self.set_matlab_state("starting")
         logger.info(f"Starting MATLAB...")
 
+        # Switch to probing at the interval used while MATLAB is starting
+        self.matlab_state_polling.probe_now("MATLAB starting")
+
         # Clear MATLAB errors and logging
         self.error = None
         self.logs["matlab"].clear()
 
-        # Start Xvfb process on linux if possible
-        if system.is_linux() and self.settings["is_xvfb_available"]:
-            xvfb = await self.__start_xvfb_process()
+        timings = {}
+        self.matlab_startup_timings = timings
+        self.matlab_startup_report.start()
+        startup_start_time = time.monotonic()
 
-            # xvfb variable would be None if creation of the process failed.
-            # Halt MATLAB process startup by returning early.
-            if xvfb is None:
-                return
+        # The licensing environment (which requires a network request for online licensing) does not depend
+        # on the display, so it is configured concurrently with starting Xvfb and the window manager.
+        async def get_licensing_env():
+            with _record_duration(timings, "licensing"):
+                return await self.__get_licensing_env_for_matlab()
 
-            self.processes["xvfb"] = xvfb
+        licensing_env_task = util.get_event_loop().create_task(get_licensing_env())
 
-        # Start Window Manager on linux if possible
-        if system.is_linux() and self.settings["is_windowmanager_available"]:
-            display = self.settings.get("matlab_display", None)
-            await self.__start_window_manager(display)
+        try:
+            is_display_ready = await self.__start_display(timings)
+        except BaseException:
+            licensing_env_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await licensing_env_task
+            raise
+
+        # Xvfb failed to start. Halt MATLAB process startup by returning early.
+        if not is_display_ready:
+            licensing_env_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await licensing_env_task
+
+            # Release lock as we are returning early and since it will be required by stop_matlab
+            await self.matlab_state_updater_lock.release()
+            # stop_matlab() does the teardown work by removing any residual processes created till now.
+            await self.stop_matlab()
+            return
 
         try:
 
             # Prepare ready file for the MATLAB process.
-            self.create_logs_dir_for_MATLAB()
+            with _record_duration(timings, "logsDir"):
+                self.create_logs_dir_for_MATLAB()
 
             # Configure the environment MATLAB needs to start
-            matlab_env = await self.__setup_env_for_matlab()
+            licensing_env = await licensing_env_task
+            with _record_duration(timings, "environment"):
+                matlab_env = await self.__setup_env_for_matlab(licensing_env)
+            self.matlab_startup_report.mark("environmentPrepared")
 
             logger.debug(
                 "Prepared ready file and configured the environment for MATLAB startup"
@@ -1346,6 +1865,9 @@ class AppState:
         # If there's something wrong with setting up files or env setup for starting matlab, capture the error for logging
         # and to pass to the front-end. Halt MATLAB process startup by returning early
         except Exception as err:
+            licensing_env_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await licensing_env_task
             # Release lock if an exception occurs as we are returning early and since it will be required by stop_matlab
             await self.matlab_state_updater_lock.release()
             self.error = err
@@ -1359,7 +1881,8 @@ class AppState:
         logger.debug("Starting MATLAB")
 
         try:
-            matlab = await self.__start_matlab_process(matlab_env)
+            with _record_duration(timings, "matlabProcess"):
+                matlab = await self.__start_matlab_process(matlab_env)
 
         # If there's an error with starting MATLAB, set the error to the state and matlab to None
         except MatlabInstallError as err:
@@ -1377,7 +1900,12 @@ class AppState:
             await self.stop_matlab(force_quit=True)
             return
 
+        self.matlab_startup_report.mark("processSpawned")
+        timings["total"] = round(time.monotonic() - startup_start_time, 3)
         logger.debug(f"Started MATLAB (PID={matlab.pid})")
+        logger.info(
+            f"Time taken in seconds by each phase of starting MATLAB: {timings}"
+        )
         self.processes["matlab"] = matlab
 
         loop = util.get_event_loop()
@@ -1421,8 +1949,14 @@ class AppState:
         except Exception as err:
             raise err
 
-    async def stop_matlab(self, force_quit=False):
-        """Terminate MATLAB."""
+    async def stop_matlab(self, force_quit=False, keep_display=False):
+        """Terminate MATLAB.
+
+        Args:
+            force_quit (bool, optional): Whether to terminate MATLAB without requesting it to exit. Defaults to False.
+            keep_display (bool, optional): Whether to keep the Xvfb and window manager processes running,
+                to be reused by the next start of MATLAB. Defaults to False.
+        """
 
         matlab_state = self.get_matlab_state()
 
@@ -1532,13 +2066,9 @@ class AppState:
 
         logger.debug("Stopped (any running) MATLAB process.")
 
-        # Terminating Xvfb
-        if system.is_posix():
-            xvfb = self.processes["xvfb"]
-            if xvfb is not None and xvfb.returncode is None:
-                logger.debug(f"Terminating Xvfb (PID={xvfb.pid})")
-                xvfb.terminate()
-                waiters.append(xvfb.wait())
+        # Terminating Xvfb and the window manager
+        if not keep_display:
+            waiters.append(self.__stop_display())
 
         if len(waiters) > 0:
             logger.debug("Waiting for MATLAB/Xvfb to terminate")
@@ -1561,6 +2091,9 @@ class AppState:
 
         # Update matlab_port information in the event of intentionally stopping MATLAB
         self.matlab_port = None
+
+        # Close all connections to the Embedded Connector of the stopped MATLAB process
+        await self.close_embedded_connector_pool()
         logger.debug("Completed Shutdown!!!")
 
     def _close_matlab_stderr_stream(self, matlab):
@@ -1596,7 +2129,9 @@ class AppState:
         # Look for errors if MATLAB was not intentionally stopped and had an error code
         if len(self.logs["matlab"]) > 0 and rc != 0:
             err = None
-            logs = [log.decode().rstrip() for log in self.logs["matlab"]]
+            logs = [
+                log.decode(errors="replace").rstrip() for log in self.logs["matlab"]
+            ]
 
             def parsed_errs():
                 if self.licensing["type"] == "nlm":
@@ -1668,8 +2203,12 @@ class AppState:
         inactive_count = 0
         while self.active_client:
             # Check if the get_status request from the active client is received or not
-            await asyncio.sleep(sleep_time)
-            if self.active_client_request_detected:
+            await self.timer_wheel.sleep("detect_client_status", sleep_time)
+            # An open status stream implies that the active client is still connected
+            if (
+                self.active_client_request_detected
+                or self.active_client in self.__status_stream_clients
+            ):
                 self.active_client_request_detected = False
                 inactive_count = 0
             else:
@@ -7,6 +7,8 @@ CONNECTOR_SECUREPORT_FILENAME: Final[str] = "connector.securePort"
 VERSION_INFO_FILE_NAME: Final[str] = "VersionInfo.xml"
 MAX_HTTP_REQUEST_SIZE: Final[int] = 500_000_000  # 500MB
 MAX_WEBSOCKET_MESSAGE_SIZE_IN_MB: Final[int] = 500_000_000  # 500MB
+# Static files smaller than this are not precompressed, as the savings do not outweigh the overhead.
+MIN_STATIC_FILE_SIZE_TO_COMPRESS: Final[int] = 1024  # 1KB
 MATLAB_LOGS_FILE_NAME: Final[str] = "matlab_logs.txt"
 USER_CODE_OUTPUT_FILE_NAME: Final[str] = "startup_code_output.txt"
 
@@ -32,6 +34,139 @@ SUPPORTED_MATLAB_VERSIONS: Final[List[str]] = [
 # This constant when set to True restricts the number of active sessions to one
 IS_CONCURRENCY_CHECK_ENABLED: Final[bool] = True
 MWI_AUTH_TOKEN_NAME_FOR_HTTP = "mwi-auth-token"
+# Bounds on the cache of session cookies which are known to contain a valid auth token.
+# Cached cookies are not decrypted again until their entry expires or is evicted.
+AUTH_VERDICT_CACHE_MAX_ENTRIES: Final[int] = 256
+AUTH_VERDICT_CACHE_TTL_SECONDS: Final[int] = 300
 
 # Interval in seconds to wait before querying the status of MATLAB.
 CHECK_MATLAB_STATUS_INTERVAL_SECONDS: Final[int] = 1
+
+# Interval in seconds to wait before querying the status of MATLAB while it is starting.
+CHECK_MATLAB_STATUS_INTERVAL_WHILE_STARTING_SECONDS: Final[float] = 0.25
+
+# Default ceiling in seconds for the interval between queries of the status of MATLAB, when the
+# interval is backed off because MATLAB is down or idle and no clients are connected.
+DEFAULT_CHECK_MATLAB_STATUS_MAX_INTERVAL_SECONDS: Final[int] = 10
+
+# Granularity in seconds of the wake up times of the periodic background tasks of matlab-proxy.
+# Tasks which are due within the same interval of this length are woken up together.
+TIMER_WHEEL_RESOLUTION_SECONDS: Final[float] = 0.25
+
+# Upper bounds in seconds of the buckets of the histograms of the time taken to start MATLAB.
+MATLAB_STARTUP_HISTOGRAM_BUCKETS_SECONDS: Final[tuple] = (
+    0.5,
+    1,
+    2,
+    5,
+    10,
+    20,
+    30,
+    60,
+    120,
+    300,
+)
+
+# Clients are considered to be connected if they have sent a request in this many seconds.
+CLIENT_ACTIVITY_WINDOW_SECONDS: Final[int] = 30
+
+# Interval in seconds after which a keep-alive comment is sent on a status stream with no status changes.
+STATUS_STREAM_KEEPALIVE_INTERVAL_SECONDS: Final[int] = 10
+
+# Defaults for the pool of connections to the Embedded Connector used to proxy requests.
+# A limit of 0 implies no limit on the number of simultaneous connections.
+DEFAULT_EC_POOL_LIMIT_PER_HOST: Final[int] = 100
+DEFAULT_EC_POOL_KEEPALIVE_TIMEOUT_SECONDS: Final[int] = 30
+
+# Time in seconds after which a health check request to the Embedded Connector is considered to have failed.
+EC_HEALTH_CHECK_TIMEOUT_SECONDS: Final[int] = 5
+
+# Defaults for the policy of compressing the websocket messages sent to the browser.
+# Messages sent to the Embedded Connector are never compressed, as it is reached over the loopback interface.
+# Messages smaller than the min size are sent uncompressed, as deflating them saves little or makes them larger.
+DEFAULT_WS_COMPRESSION_MIN_SIZE: Final[int] = 256
+# zlib compression level from 1 (fastest) to 9 (smallest output). A level of 0 disables compression.
+DEFAULT_WS_COMPRESSION_LEVEL: Final[int] = 1
+# Base 2 logarithm of the size of the compression window, capped to the size negotiated with the browser.
+DEFAULT_WS_COMPRESSION_WINDOW_BITS: Final[int] = 15
+# Compression is stopped on a connection once WS_COMPRESSION_SAMPLE_BYTES bytes compressed in a row
+# save less than this percentage of their size. A percentage of 0 never stops compression.
+DEFAULT_WS_COMPRESSION_MIN_SAVINGS_PERCENT: Final[int] = 0
+WS_COMPRESSION_SAMPLE_BYTES: Final[int] = 64 * 1024
+
+# Defaults for the memory budgets of relayed websocket messages, in bytes. Messages waiting to be sent are
+# counted against the budget of their connection and the budget of the process. Reading from a connection
+# is paused while either budget is used up, and a message larger than the budget of a connection is refused.
+# A message is only counted once aiohttp has received all of it, so each direction of a connection can
+# additionally hold up to the budget of the connection for the message being received.
+DEFAULT_WS_MEMORY_BUDGET_PER_CONNECTION: Final[int] = 100_000_000  # 100MB
+DEFAULT_WS_MEMORY_BUDGET: Final[int] = 250_000_000  # 250MB
+# Time in seconds to wait for the budget of the process to free up, before closing a connection.
+WS_MEMORY_BUDGET_WAIT_SECONDS: Final[int] = 30
+# Max number of messages waiting to be sent in each direction of a relayed websocket.
+WS_RELAY_QUEUE_MAX_MESSAGES: Final[int] = 32
+# Messages larger than this are sent as fragments of this size, draining the connection after each fragment.
+WS_RELAY_FRAGMENT_SIZE: Final[int] = 1024 * 1024  # 1MB
+
+# Upper bounds of the buckets of the histograms of the relayed websocket messages, by size in bytes
+# and by the time in seconds from their receipt to them being sent.
+WS_MESSAGE_SIZE_HISTOGRAM_BUCKETS_BYTES: Final[tuple] = (
+    128,
+    1024,
+    16 * 1024,
+    64 * 1024,
+    1024 * 1024,
+    16 * 1024 * 1024,
+)
+WS_RELAY_LATENCY_HISTOGRAM_BUCKETS_SECONDS: Final[tuple] = (
+    0.001,
+    0.01,
+    0.1,
+    1,
+    10,
+)
+
+# Cache of the tokens and entitlements fetched from MathWorks servers for online licensing.
+# Items are fetched again this many seconds before they expire.
+MHLM_CACHE_REFRESH_MARGIN_SECONDS: Final[int] = 5 * 60
+# Time in seconds to wait before retrying a failed refresh of the access token.
+MHLM_CACHE_REFRESH_RETRY_SECONDS: Final[int] = 30
+# Lifetime in seconds of items for which the server does not send an expiration date.
+MHLM_ACCESS_TOKEN_DEFAULT_TTL_SECONDS: Final[int] = 15 * 60
+MHLM_ENTITLEMENTS_TTL_SECONDS: Final[int] = 60 * 60
+
+# Bounds on the lines written by MATLAB to stderr, which are kept to report errors.
+MAX_MATLAB_LOG_LINES: Final[int] = 200
+MAX_MATLAB_LOG_BYTES: Final[int] = 64 * 1024  # 64KB
+MAX_MATLAB_LOG_LINES_IN_ERROR: Final[int] = 100
+# Number of lines following the "License Manager Error" line written by MATLAB, which hold the details of the error.
+MHLM_ERROR_DETAIL_LINES: Final[int] = 5
+
+# Lines written by MATLAB to stderr which signal that it is unable to start, irrespective of licensing.
+FATAL_STARTUP_ERROR_SIGNATURES: Final[tuple] = (
+    "Fatal Startup Error",
+    "MATLAB is exiting because of fatal error",
+)
+
+# Types of key for the self-signed certificate generated when SSL is enabled without a certificate.
+# ECDSA keys on the P-256 curve are much faster to generate and to sign TLS handshakes with than RSA keys.
+SSL_KEY_TYPES: Final[tuple] = ("rsa", "ecdsa")
+DEFAULT_SSL_KEY_TYPE: Final[str] = "rsa"
+# A generated self-signed certificate is reused across restarts unless it expires within this many days.
+SELF_SIGNED_CERT_VALIDITY_DAYS: Final[int] = 365
+SELF_SIGNED_CERT_RENEWAL_MARGIN_DAYS: Final[int] = 7
+
+# Presets for the virtual screen of Xvfb, selected with MWI_XVFB_PROFILE.
+# Xvfb allocates its framebuffer based on the size and depth of the screen, so the "lean" profile
+# uses a smaller screen, disables backing store (-bs) and does not listen for X clients over TCP.
+DEFAULT_XVFB_PROFILE: Final[str] = "default"
+XVFB_PROFILES: Final[dict] = {
+    "default": {
+        "screen": "3840x2160x24",
+        "options": ["-dpi", "100", "-extension", "RANDR"],
+    },
+    "lean": {
+        "screen": "1920x1080x24",
+        "options": ["-dpi", "100", "-extension", "RANDR", "-nolisten", "tcp", "-bs"],
+    },
+}
@@ -7,7 +7,7 @@ import socket
 import sys
 import time
 
-from aiohttp import web
+from aiohttp import WSMsgType, web
 
 from matlab_proxy import settings
 from matlab_proxy.util.mwi import environment_variables as mwi_env
@@ -137,6 +137,7 @@ async def delete_request_handler(request):
 
 async def web_socket_handler(request):
     """API Endpoint used for testing the WebSocket Response for the proxy server.
+    Sends a greeting and then echoes every message it receives, until the websocket is closed.
 
     Args:
         request (HTTPRequest): HTTPRequest object
@@ -148,6 +149,14 @@ async def web_socket_handler(request):
     await ws.prepare(request)
     await ws.send_str("Hello world")
 
+    async for msg in ws:
+        if msg.type == WSMsgType.TEXT:
+            await ws.send_str(msg.data)
+        elif msg.type == WSMsgType.BINARY:
+            await ws.send_bytes(msg.data)
+
+    return ws
+
 
 async def fake_matlab_started(app):
     """After the specified delay in seconds, create the ready_file unless it should error.
@@ -226,25 +235,36 @@ def matlab(args):
     app["ready_delay"] = args.ready_delay
     app["port"] = port
 
-    app.router.add_route("GET", "/index-jsd-cr.html", web_handler)
+    # Like the Embedded Connector, serve all the endpoints under the context root set by matlab-proxy.
+    context_root = os.environ.get("MW_CONNECTOR_CONTEXT_ROOT", "").rstrip("/")
 
-    app.router.add_route("GET", "/http_get_request.html", get_request_handler)
+    app.router.add_route("GET", f"{context_root}/index-jsd-cr.html", web_handler)
 
     app.router.add_route(
-        "POST", "/messageservice/json/secure", fake_matlab_mvm_endpoint
+        "GET", f"{context_root}/http_get_request.html", get_request_handler
     )
 
     app.router.add_route(
-        "POST", "/messageservice/json/state", fake_matlab_ping_endpoint
+        "POST", f"{context_root}/messageservice/json/secure", fake_matlab_mvm_endpoint
     )
 
-    app.router.add_route("POST", "/post_endpoint", post_request_handler)
+    app.router.add_route(
+        "POST", f"{context_root}/messageservice/json/state", fake_matlab_ping_endpoint
+    )
 
-    app.router.add_route("PUT", "/http_put_request.html", put_request_handler)
+    app.router.add_route("POST", f"{context_root}/post_endpoint", post_request_handler)
 
-    app.router.add_route("DELETE", "/http_delete_request.html", delete_request_handler)
+    app.router.add_route(
+        "PUT", f"{context_root}/http_put_request.html", put_request_handler
+    )
 
-    app.router.add_route("GET", "/http_ws_request.html/", web_socket_handler)
+    app.router.add_route(
+        "DELETE", f"{context_root}/http_delete_request.html", delete_request_handler
+    )
+
+    app.router.add_route(
+        "GET", f"{context_root}/http_ws_request.html/", web_socket_handler
+    )
 
     app.on_startup.append(start_background_tasks)
     app.on_cleanup.append(cleanup_background_tasks)
@@ -12,12 +12,15 @@ from pathlib import Path
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
 from cryptography.x509.oid import NameOID
 
 import matlab_proxy
 from matlab_proxy import constants
-from matlab_proxy.constants import MWI_AUTH_TOKEN_NAME_FOR_HTTP
+from matlab_proxy.constants import (
+    DEFAULT_SSL_KEY_TYPE,
+    MWI_AUTH_TOKEN_NAME_FOR_HTTP,
+)
 from matlab_proxy.util import mwi, system
 from matlab_proxy.util.cookie_jar import HttpOnlyCookieJar
 from matlab_proxy.util.mwi import environment_variables as mwi_env
@@ -223,6 +226,30 @@ def get_dev_settings(config):
         "mwi_idle_timeout": None,
         "cookie_jar": _get_cookie_jar(),
         "browser_title": session_name.get_browser_title("R2020b"),
+        "mwi_ec_pool_limit_per_host": mwi.validators.validate_ec_pool_limit_per_host(
+            os.getenv(mwi_env.get_env_name_ec_pool_limit_per_host())
+        ),
+        "mwi_ec_pool_keepalive_timeout": mwi.validators.validate_ec_pool_keepalive_timeout(
+            os.getenv(mwi_env.get_env_name_ec_pool_keepalive_timeout())
+        ),
+        "mwi_matlab_status_max_interval": mwi.validators.validate_matlab_status_max_interval(
+            os.getenv(mwi_env.get_env_name_matlab_status_max_interval())
+        ),
+        "mwi_ws_compression_policy": mwi.validators.validate_ws_compression_policy(
+            os.getenv(mwi_env.get_env_name_ws_compression_min_size()),
+            os.getenv(mwi_env.get_env_name_ws_compression_level()),
+            os.getenv(mwi_env.get_env_name_ws_compression_window_bits()),
+            os.getenv(mwi_env.get_env_name_ws_compression_min_savings()),
+        ),
+        "mwi_ws_memory_budgets": mwi.validators.validate_ws_memory_budgets(
+            os.getenv(mwi_env.get_env_name_ws_memory_budget_per_connection()),
+            os.getenv(mwi_env.get_env_name_ws_memory_budget()),
+        ),
+        "mwi_xvfb_options": mwi.validators.validate_xvfb_options(
+            os.getenv(mwi_env.get_env_name_xvfb_profile()),
+            os.getenv(mwi_env.get_env_name_xvfb_screen()),
+            os.getenv(mwi_env.get_env_name_xvfb_options()),
+        ),
     }
 
 
@@ -363,6 +390,30 @@ def get_server_settings(config_name):
             os.getenv(mwi_env.get_env_name_shutdown_on_idle_timeout())
         ),
         "cookie_jar": cookie_jar,
+        "mwi_ec_pool_limit_per_host": mwi.validators.validate_ec_pool_limit_per_host(
+            os.getenv(mwi_env.get_env_name_ec_pool_limit_per_host())
+        ),
+        "mwi_ec_pool_keepalive_timeout": mwi.validators.validate_ec_pool_keepalive_timeout(
+            os.getenv(mwi_env.get_env_name_ec_pool_keepalive_timeout())
+        ),
+        "mwi_matlab_status_max_interval": mwi.validators.validate_matlab_status_max_interval(
+            os.getenv(mwi_env.get_env_name_matlab_status_max_interval())
+        ),
+        "mwi_ws_compression_policy": mwi.validators.validate_ws_compression_policy(
+            os.getenv(mwi_env.get_env_name_ws_compression_min_size()),
+            os.getenv(mwi_env.get_env_name_ws_compression_level()),
+            os.getenv(mwi_env.get_env_name_ws_compression_window_bits()),
+            os.getenv(mwi_env.get_env_name_ws_compression_min_savings()),
+        ),
+        "mwi_ws_memory_budgets": mwi.validators.validate_ws_memory_budgets(
+            os.getenv(mwi_env.get_env_name_ws_memory_budget_per_connection()),
+            os.getenv(mwi_env.get_env_name_ws_memory_budget()),
+        ),
+        "mwi_xvfb_options": mwi.validators.validate_xvfb_options(
+            os.getenv(mwi_env.get_env_name_xvfb_profile()),
+            os.getenv(mwi_env.get_env_name_xvfb_screen()),
+            os.getenv(mwi_env.get_env_name_xvfb_options()),
+        ),
     }
 
 
@@ -433,15 +484,24 @@ def get_mw_context_tags(extension_name):
     return combined_context_tags
 
 
-def create_xvfb_cmd():
+def create_xvfb_cmd(xvfb_options=None):
     """Creates the Xvfb command with a write descriptor.
 
+    Args:
+        xvfb_options (List[str], optional): Options to start Xvfb with, excluding the -displayfd option.
+            Defaults to the options of the default profile in constants.XVFB_PROFILES.
+            See the "mwi_xvfb_options" setting.
+
     Returns:
         List: Containing 2 lists.
 
     The second List contains a read and a write descriptor.
     The first List is the command to launch Xvfb process with the same write descriptor(from the first list) embedded in the command.
     """
+    if xvfb_options is None:
+        profile = constants.XVFB_PROFILES[constants.DEFAULT_XVFB_PROFILE]
+        xvfb_options = ["-screen", "0", profile["screen"], *profile["options"]]
+
     # Using os.pipe() can lead to race conditions (ie.usage of same set of file descriptors between 2 processes)
     # when called in quick succession and also when running tests.
     # Using os.pipe2() with the flag os.O_NONBLOCK will avoid race conditions.
@@ -455,16 +515,7 @@ def create_xvfb_cmd():
         "-displayfd",
         # Write descriptor
         str(dpipe[1]),
-        "-screen",
-        "0",
-        "3840x2160x24",
-        "-dpi",
-        "100",
-        # "-ac",
-        "-extension",
-        "RANDR",
-        # "+render",
-        # "-noreset",
+        *xvfb_options,
     ]
 
     return xvfb_cmd, dpipe
@@ -515,10 +566,19 @@ def _validate_ssl_files_and_get_ssl_context(mwi_config_folder):
         # certs dir under the MWI_CONFIG_FOLDER will hold the self-signed certificates
         mwi_certs_dir = mwi_config_folder / "certs"
         mwi_certs_dir.mkdir(parents=True, exist_ok=True)
+        key_type = mwi.validators.validate_ssl_key_type(
+            os.getenv(mwi_env.get_env_name_ssl_key_type())
+        )
 
-        # New certs are generated for every run leading to functionally reliable system, alternative is
-        # to check for existing certs and have error handling around expired/bad certs.
-        ssl_cert_file, ssl_key_file = generate_new_self_signed_certs(mwi_certs_dir)
+        # Generating a key, an RSA key in particular, adds to the startup time of matlab-proxy. So, the certificate
+        # generated by a previous run is reused, unless it is invalid, about to expire or of a different type of key.
+        ssl_cert_file, ssl_key_file = get_reusable_self_signed_certs(
+            mwi_certs_dir, key_type
+        )
+        if not ssl_cert_file:
+            ssl_cert_file, ssl_key_file = generate_new_self_signed_certs(
+                mwi_certs_dir, key_type
+            )
         is_self_signed_certificates = True
     try:
         ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
@@ -537,13 +597,128 @@ def _validate_ssl_files_and_get_ssl_context(mwi_config_folder):
     return ssl_context
 
 
-def generate_new_self_signed_certs(mwi_certs_dir):
+def _get_ssl_key_type(private_key):
+    if isinstance(private_key, ec.EllipticCurvePrivateKey):
+        return "ecdsa"
+    if isinstance(private_key, rsa.RSAPrivateKey):
+        return "rsa"
+    return None
+
+
+def get_reusable_self_signed_certs(mwi_certs_dir, key_type=DEFAULT_SSL_KEY_TYPE):
+    """
+    Returns the self-signed certificate and private key generated by generate_new_self_signed_certs() in a previous run,
+    if they can be reused.
+
+    Parameters:
+    - mwi_certs_dir (Path): A pathlib.Path object representing the directory where the certificate and key files are saved.
+    - key_type (str): Type of the key, one of constants.SSL_KEY_TYPES.
+
+    Returns:
+    - tuple: A tuple containing the paths to the certificate (cert.pem) and private key (key.pem) files. (None, None) if the
+             files do not exist, cannot be loaded, do not match, have a different type of key or if the certificate expires
+             within SELF_SIGNED_CERT_RENEWAL_MARGIN_DAYS days.
+    """
+    cert_file = mwi_certs_dir / "cert.pem"
+    priv_key_file = mwi_certs_dir / "key.pem"
+
+    try:
+        if not _is_private_key_file_private(priv_key_file):
+            return None, None
+
+        cert = x509.load_pem_x509_certificate(cert_file.read_bytes())
+        private_key_bytes = priv_key_file.read_bytes()
+        try:
+            # Validating an RSA key takes as long as generating one. It is skipped, as the key was generated
+            # by matlab-proxy and is checked to match the certificate below, and again when loaded by OpenSSL.
+            private_key = serialization.load_pem_private_key(
+                private_key_bytes, password=None, unsafe_skip_rsa_key_validation=True
+            )
+        except TypeError:
+            # unsafe_skip_rsa_key_validation was introduced in cryptography 39
+            private_key = serialization.load_pem_private_key(
+                private_key_bytes, password=None
+            )
+    except FileNotFoundError:
+        return None, None
+    except Exception as ex:
+        logger.debug(f"Unable to load the existing self-signed certificate: {ex}")
+        return None, None
+
+    public_key_format = (
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    if cert.public_key().public_bytes(
+        *public_key_format
+    ) != private_key.public_key().public_bytes(*public_key_format):
+        logger.debug("Existing self-signed certificate does not match its private key")
+        return None, None
+
+    if _get_ssl_key_type(private_key) != key_type:
+        logger.debug(
+            f"Existing self-signed certificate does not have a key of type: {key_type}"
+        )
+        return None, None
+
+    # not_valid_after_utc was introduced in cryptography 42, not_valid_after is a naive datetime in UTC.
+    not_valid_after = getattr(cert, "not_valid_after_utc", None) or (
+        cert.not_valid_after.replace(tzinfo=datetime.timezone.utc)
+    )
+    renew_after = not_valid_after - datetime.timedelta(
+        days=constants.SELF_SIGNED_CERT_RENEWAL_MARGIN_DAYS
+    )
+    if renew_after <= datetime.datetime.now(datetime.timezone.utc):
+        logger.debug(
+            f"Existing self-signed certificate expires at {not_valid_after}, generating a new one"
+        )
+        return None, None
+
+    logger.debug(
+        f"Reusing the self-signed certificate which expires at {not_valid_after}"
+    )
+    return cert_file, priv_key_file
+
+
+def _is_private_key_file_private(priv_key_file):
+    """Checks that a private key file is owned by the current user and that no other user can access it.
+
+    Raises:
+        FileNotFoundError: When the file does not exist.
+
+    Returns:
+        bool: True if the file is private, always on Windows where the permission bits do not apply.
+    """
+    stat_result = priv_key_file.stat()
+    if system.is_windows():
+        return True
+
+    if stat_result.st_uid != os.getuid():
+        logger.debug(
+            "Existing private key of the self-signed certificate is owned by another user"
+        )
+        return False
+
+    # Other users may have already read a key which they have access to, so it is not made private but replaced.
+    if stat_result.st_mode & 0o077:
+        logger.warning(
+            f"Existing private key of the self-signed certificate at {priv_key_file} is accessible by other users "
+            f"(mode: {oct(stat_result.st_mode & 0o777)}), generating a new one"
+        )
+        return False
+
+    return True
+
+
+def generate_new_self_signed_certs(mwi_certs_dir, key_type=DEFAULT_SSL_KEY_TYPE):
     """
     Generates a new self-signed certificate and corresponding private key, saves them as PEM files in the specified directory.
     The certificate is valid for 365 days from the time of creation.
 
     Parameters:
     - mwi_certs_dir (Path): A pathlib.Path object representing the directory where the certificate and key files will be saved.
+    - key_type (str): Type of the key, one of constants.SSL_KEY_TYPES. "rsa" generates a 2048-bit RSA key and
+                      "ecdsa" generates an ECDSA key on the P-256 curve.
 
     Returns:
     - tuple: A tuple containing the file paths (as strings) to the newly created certificate and private key PEM files.
@@ -556,7 +731,10 @@ def generate_new_self_signed_certs(mwi_certs_dir):
     cert_file = priv_key_file = None
     try:
         # Generate private key
-        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        if key_type == "ecdsa":
+            private_key = ec.generate_private_key(ec.SECP256R1())
+        else:
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
 
         # Self-signed certificate
         subject = issuer = x509.Name(
@@ -575,13 +753,20 @@ def generate_new_self_signed_certs(mwi_certs_dir):
             .public_key(private_key.public_key())
             .serial_number(x509.random_serial_number())
             .not_valid_before(datetime.datetime.utcnow())
-            .not_valid_after(datetime.datetime.utcnow() + datetime.timedelta(days=365))
+            .not_valid_after(
+                datetime.datetime.utcnow()
+                + datetime.timedelta(days=constants.SELF_SIGNED_CERT_VALIDITY_DAYS)
+            )
             .sign(private_key, hashes.SHA256())
         )
 
-        # Write private key to file
+        # Write private key to file. An existing file is removed first, as opening it
+        # would keep its permissions while the new key is written into it.
         priv_key_file = mwi_certs_dir / "key.pem"
-        with open(priv_key_file, "wb") as f:
+        priv_key_file.unlink(missing_ok=True)
+        with open(
+            os.open(priv_key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb"
+        ) as f:
             f.write(
                 private_key.private_bytes(
                     encoding=serialization.Encoding.PEM,
@@ -589,6 +774,8 @@ def generate_new_self_signed_certs(mwi_certs_dir):
                     encryption_algorithm=serialization.NoEncryption(),
                 )
             )
+        # The key is reused across runs, so it is readable only by the user.
+        os.chmod(priv_key_file, 0o600)
 
         # Write certificate to file
         cert_file = mwi_certs_dir / "cert.pem"
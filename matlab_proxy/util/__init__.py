@@ -1,6 +1,7 @@
 # Copyright 2020-2025 The MathWorks, Inc.
 import argparse
 import inspect
+import logging
 import os
 import socket
 import time
@@ -265,32 +266,41 @@ def is_valid_path(path: Path):
 
 
 def get_caller_name() -> str:
-    """Utility function that uses the `inspect` module to access the call stack and returns the name
+    """Utility function that walks up the call stack and returns the name
     of the function that is two levels above in the stack. This is typically the function
     that called the function that invoked `get_caller_name`.
 
     Ex: start_matlab() -> set_matlab_state() -> get_caller_name()
     The return value from get_caller_name() would be `start_matlab`
 
+    Only the frame objects are accessed, unlike inspect.stack() which also builds frame records
+    and reads source lines for every frame in the stack.
+
     Returns:
         str: Name of the parent function.
     """
+    frame = inspect.currentframe()
     try:
-        return inspect.stack()[2][3]
+        return frame.f_back.f_back.f_code.co_name
 
     except Exception as err:
         logger.error(f"Failed to get caller name with err:{err}")
         stack = inspect.stack()
         return stack[len(stack) - 1][3]
 
+    finally:
+        # Break the reference cycle between this frame and the local variable holding it.
+        del frame
+
 
 class TrackingLock:
     """A class which provides the same features as asyncio.Lock
-    and additionally tracks which function acquired the lock.
+    and additionally tracks which asyncio task and function acquired the lock.
     """
 
     def __init__(self, purpose):
         self._acquired_by = None
+        self._owner_task = None
         self._lock = asyncio.Lock()
         if not purpose:
             logger.warning("Provide a purpose for this instance of TrackingLock")
@@ -310,9 +320,13 @@ class TrackingLock:
     async def acquire(self):
         """Acquires the lock"""
         await self._lock.acquire()
-        # Store the current task or function information when the lock is acquired
-        self._acquired_by = get_caller_name()
-        logger.debug(f"Lock acquired by '{self.acquired_by}()'")
+        # Store the current task and function information when the lock is acquired
+        self._owner_task = asyncio.current_task()
+        # The name of the function which acquired the lock is only used for logging,
+        # so the call stack is not inspected unless debug logs are enabled.
+        if logger.isEnabledFor(logging.DEBUG):
+            self._acquired_by = get_caller_name()
+            logger.debug(f"Lock acquired by '{self.acquired_by}()'")
 
     async def release(self):
         """Releases the lock."""
@@ -321,37 +335,35 @@ class TrackingLock:
             self._lock.release()
             logger.debug(f"Lock released by '{self.acquired_by}()'")
             self._acquired_by = None
+            self._owner_task = None
 
         else:
             logger.warn(f"Trying to release {self._purpose} lock before acquiring it.")
 
-    def validate_lock_for_caller(self, caller):
-        """Checks if the specified caller is the current holder of the lock.
+    def validate_lock_for_current_task(self):
+        """Checks if the asyncio task which is currently running is the holder of the lock.
 
-        This method first verifies that the lock is currently held. If it is,
-        it then compares the holder's name with the provided caller's name
-        to ensure they match.
+        The holder is identified by its asyncio task instead of by the name of the function
+        which acquired the lock. So, the call stack is not inspected.
 
         This function should be used by setter methods for verification, before they modify critical sections.
 
-        Args:
-        caller (str): The name of the function to be matched with the lock holder.
-
         Returns:
-            bool: True if the caller currently holds the lock, False otherwise.
+            bool: True if the current task holds the lock, False otherwise.
         """
         if not self._lock.locked():
             logger.error(
                 LockAcquisitionError(
-                    f"Lock needs to be acquired by '{caller}()' before modifying {self._purpose}"
+                    f"Lock needs to be acquired before modifying {self._purpose}"
                 )
             )
             return False
 
-        if self._acquired_by != caller:
+        current_task = asyncio.current_task()
+        if current_task is None or self._owner_task is not current_task:
             logger.error(
                 LockAcquisitionError(
-                    f"Lock was acquired by {self._acquired_by} but {self._purpose} is being modified by {caller}."
+                    f"Lock was acquired by {self._acquired_by} in a different task than the one modifying {self._purpose}."
                 )
             )
             return False
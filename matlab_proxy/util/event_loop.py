@@ -1,9 +1,11 @@
-# Copyright 2020-2024 The MathWorks, Inc.
+# Copyright 2020-2025 The MathWorks, Inc.
 
 from typing import Dict, Set, Union
 from contextlib import suppress
 
 import asyncio
+import math
+import random
 
 from matlab_proxy.util import mwi, system, windows
 
@@ -61,3 +63,177 @@ async def __cancel_task(task):
     with suppress(asyncio.CancelledError):
         task.cancel()
         await task
+
+
+class TimerWheel:
+    """Wakes up the periodic background tasks of matlab-proxy from a shared set of timers.
+
+    Instead of calling asyncio.sleep(), a task (referred to as a job) calls TimerWheel.sleep() with its name.
+    The time at which the job should wake up is rounded down to a multiple of resolution seconds (or up, if
+    that time has already passed), and all the jobs which are due at the same multiple are woken up by a single
+    timer. So, jobs with similar cadences wake up the event loop together instead of each at its own time.
+
+    Each job can additionally be given a jitter, be paused and resumed, and is reported with the time it spent
+    running between consecutive sleeps.
+    """
+
+    def __init__(self, resolution):
+        """Parameterized constructor for the TimerWheel class.
+
+        Args:
+            resolution (float): Granularity in seconds of the wake up times of the jobs.
+        """
+        self.resolution = resolution
+
+        # Futures of the jobs which are due at a tick, along with the timer which wakes them up, by tick.
+        self.__slots = {}
+        self.__timers = {}
+        self.__jobs = {}
+
+        self.__wakeups_count = 0
+        self.__jobs_woken_count = 0
+
+    def register(self, name, jitter=0.0) -> None:
+        """Registers a job. Jobs are registered on their first call to sleep() if not registered beforehand.
+
+        Args:
+            name (str): Name of the job.
+            jitter (float, optional): Maximum random delay in seconds added to every sleep of the job. Defaults to 0.
+        """
+        job = self.__get_job(name)
+        job["jitter"] = jitter
+
+    def pause(self, name) -> None:
+        """Pauses a job. A paused job does not wake up from sleep() until it is resumed.
+
+        Args:
+            name (str): Name of the job.
+        """
+        self.__get_job(name)["resumed"].clear()
+        logger.debug(f"Paused the '{name}' job")
+
+    def resume(self, name) -> None:
+        """Resumes a paused job. If the job was due while it was paused, it wakes up immediately.
+
+        Args:
+            name (str): Name of the job.
+        """
+        self.__get_job(name)["resumed"].set()
+        logger.debug(f"Resumed the '{name}' job")
+
+    def is_paused(self, name) -> bool:
+        """Whether the job is paused.
+
+        Args:
+            name (str): Name of the job.
+        """
+        return not self.__get_job(name)["resumed"].is_set()
+
+    async def sleep(self, name, delay) -> None:
+        """Suspends the job for about delay seconds. The job is woken up at most resolution seconds early.
+
+        Args:
+            name (str): Name of the job.
+            delay (float): Time in seconds to sleep for.
+        """
+        job = self.__get_job(name)
+        loop = asyncio.get_running_loop()
+
+        if job["last_wakeup_time"] is not None:
+            run_time = loop.time() - job["last_wakeup_time"]
+            job["lastRunTime"] = run_time
+            job["totalRunTime"] += run_time
+            job["maxRunTime"] = max(job["maxRunTime"], run_time)
+
+        if job["jitter"]:
+            delay += random.uniform(0, job["jitter"])
+
+        try:
+            if delay > 0:
+                await self.__wait_for_tick(loop, loop.time() + delay)
+            else:
+                await asyncio.sleep(0)
+
+            await job["resumed"].wait()
+
+        finally:
+            # The job also resumes running if its sleep is cut short by cancellation.
+            job["last_wakeup_time"] = loop.time()
+            job["runs"] += 1
+
+    async def __wait_for_tick(self, loop, deadline):
+        # Waking up early is preferred over waking up late, as a polling job waking up late
+        # delays the detection of whatever it polls for.
+        tick = math.floor(deadline / self.resolution)
+        if tick * self.resolution <= loop.time():
+            tick += 1
+
+        future = loop.create_future()
+
+        slot = self.__slots.setdefault(tick, [])
+        slot.append(future)
+        if tick not in self.__timers:
+            self.__timers[tick] = loop.call_at(
+                tick * self.resolution, self.__wake_up, tick
+            )
+
+        try:
+            await future
+        finally:
+            # Only required if the job was cancelled while it was sleeping
+            slot = self.__slots.get(tick)
+            if slot is not None and future in slot:
+                slot.remove(future)
+                if not slot:
+                    del self.__slots[tick]
+                    self.__timers.pop(tick).cancel()
+
+    def __wake_up(self, tick):
+        self.__timers.pop(tick, None)
+        slot = self.__slots.pop(tick, [])
+
+        self.__wakeups_count += 1
+        for future in slot:
+            if not future.done():
+                future.set_result(None)
+                self.__jobs_woken_count += 1
+
+    def __get_job(self, name):
+        if name not in self.__jobs:
+            resumed = asyncio.Event()
+            resumed.set()
+            self.__jobs[name] = {
+                "jitter": 0.0,
+                "resumed": resumed,
+                "last_wakeup_time": None,
+                "runs": 0,
+                "lastRunTime": 0.0,
+                "totalRunTime": 0.0,
+                "maxRunTime": 0.0,
+            }
+
+        return self.__jobs[name]
+
+    def get_stats(self) -> dict:
+        """Returns statistics about the wake ups and the time spent running by each job.
+
+        Returns:
+            dict: Containing the number of times the event loop was woken up, the number of jobs woken up
+                and per job statistics. Times are in seconds.
+        """
+        return {
+            "resolution": self.resolution,
+            "wakeups": self.__wakeups_count,
+            "jobsWoken": self.__jobs_woken_count,
+            "jobs": {
+                name: {
+                    "jitter": job["jitter"],
+                    "paused": not job["resumed"].is_set(),
+                    "runs": job["runs"],
+                    "lastRunTime": job["lastRunTime"],
+                    "totalRunTime": job["totalRunTime"],
+                    "maxRunTime": job["maxRunTime"],
+                }
+                for name, job in self.__jobs.items()
+            },
+        }
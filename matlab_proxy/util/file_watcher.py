@@ -0,0 +1,130 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import asyncio
+import os
+from pathlib import Path
+
+from matlab_proxy.util import mwi
+
+logger = mwi.logger.get()
+
+
+class FileWatcher:
+    """Wakes up an asyncio task as soon as a file is created or modified.
+
+    Changes are detected through the filesystem notification API of the platform (inotify on Linux),
+    using a watchdog observer on the parent directory of the file. If the observer cannot be started,
+    for eg: when the directory does not exist yet or the limit on inotify watches has been reached,
+    wait() falls back to sleeping for the given timeout.
+    """
+
+    def __init__(self, path):
+        """Parameterized constructor for the FileWatcher class.
+
+        Args:
+            path (Path): Path to the file to watch.
+        """
+        self.path = Path(path)
+        self.__event = asyncio.Event()
+        self.__observer = None
+
+    @property
+    def is_watching(self) -> bool:
+        """Whether changes to the file are being watched for, instead of being polled for."""
+        return self.__observer is not None
+
+    def start(self) -> bool:
+        """Starts watching the parent directory of the file.
+
+        Returns:
+            bool: Whether the observer was started.
+        """
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.debug(f"watchdog is not available, polling for {self.path}")
+            return False
+
+        loop = asyncio.get_running_loop()
+        file_name = self.path.name
+        event = self.__event
+
+        class _EventHandler(FileSystemEventHandler):
+            def on_any_event(self, fs_event):
+                # Only the basename is compared, as the parent directory is watched non-recursively
+                # and some platforms report the resolved path of the directory.
+                paths = [fs_event.src_path, getattr(fs_event, "dest_path", "")]
+                if any(
+                    os.path.basename(os.fsdecode(path)) == file_name for path in paths
+                ):
+                    loop.call_soon_threadsafe(event.set)
+
+        observer = Observer()
+        try:
+            observer.schedule(_EventHandler(), str(self.path.parent), recursive=False)
+            observer.start()
+        except Exception as err:
+            logger.debug(
+                f"Unable to watch for changes to {self.path}, polling instead: {err}"
+            )
+            return False
+
+        self.__observer = observer
+        logger.debug(f"Watching for changes to {self.path}")
+        return True
+
+    async def wait(self, timeout) -> bool:
+        """Waits until the file is created or modified, or until timeout seconds have elapsed.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait for.
+
+        Returns:
+            bool: True if the file was changed, False if the wait timed out.
+        """
+        # asyncio.wait() is used instead of asyncio.wait_for(), as the latter swallows the cancellation
+        # of this task (on python < 3.12) if the event is set in the same iteration of the event loop.
+        waiter = asyncio.ensure_future(self.__event.wait())
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        finally:
+            waiter.cancel()
+
+        is_changed = self.__event.is_set()
+        self.__event.clear()
+        return is_changed
+
+    def stop(self) -> None:
+        """Stops watching the file. The observer thread is a daemon thread, so it is not joined."""
+        if self.__observer is not None:
+            self.__observer.stop()
+            self.__observer = None
+
+
+async def read_file_when_ready(path, poll_interval) -> str:
+    """Waits for a file to be created with non-empty contents and returns its contents.
+
+    Args:
+        path (Path): Path to the file.
+        poll_interval (float): Interval in seconds at which the existence of the file is checked,
+            as a fallback for when a change to the file is not notified.
+
+    Returns:
+        str: Contents of the file.
+    """
+    watcher = FileWatcher(path)
+    watcher.start()
+    try:
+        while True:
+            try:
+                contents = watcher.path.read_text().strip()
+                # The file may have been created, but its contents not yet written.
+                if contents:
+                    return contents
+            except FileNotFoundError:
+                pass
+
+            await watcher.wait(poll_interval)
+    finally:
+        watcher.stop()
@@ -1,11 +1,23 @@
 # Copyright 2020-2024 The MathWorks, Inc.
 
 import asyncio
+import contextlib
 import os
-import select
+import time
 import xml.etree.ElementTree as ET
+from collections import deque
+from datetime import datetime, timezone
 
 import aiohttp
+from matlab_proxy.constants import (
+    FATAL_STARTUP_ERROR_SIGNATURES,
+    MAX_MATLAB_LOG_LINES_IN_ERROR,
+    MHLM_ACCESS_TOKEN_DEFAULT_TTL_SECONDS,
+    MHLM_CACHE_REFRESH_MARGIN_SECONDS,
+    MHLM_CACHE_REFRESH_RETRY_SECONDS,
+    MHLM_ENTITLEMENTS_TTL_SECONDS,
+    MHLM_ERROR_DETAIL_LINES,
+)
 from matlab_proxy.default_configuration import config
 from matlab_proxy.util import mwi
 from matlab_proxy.settings import get_process_startup_timeout
@@ -29,7 +41,19 @@ def __get_licensing_url():
     return f"{config['doc_url']}blob/main/MATLAB-Licensing-Info.md"
 
 
-async def fetch_entitlements(mhlm_api_endpoint, access_token, matlab_release):
+@contextlib.asynccontextmanager
+async def _get_client_session(client_session=None):
+    """Yields the supplied client session, or a new one which is closed on exit if none is supplied."""
+    if client_session is not None:
+        yield client_session
+    else:
+        async with aiohttp.ClientSession(trust_env=True) as new_client_session:
+            yield new_client_session
+
+
+async def fetch_entitlements(
+    mhlm_api_endpoint, access_token, matlab_release, client_session=None
+):
     """Asynchronously fetch entitlements from MHLM endpoint. Used when licensing using MHLM.
 
     Args:
@@ -37,6 +61,7 @@ async def fetch_entitlements(mhlm_api_endpoint, access_token, matlab_release):
         access_token (String): An access token which was requested by the fetch_acces_token() method
         matlab_release (String): MATLAB Release version installed in the system.
         mhlm_context: Environment specific info sent to the mhlm_api_endpoint
+        client_session (aiohttp.ClientSession, optional): Session to send the request with. Defaults to a new session.
 
     Raises:
         OnlineLicensingError: Raised when unable to receive proper response from MHLM servers.
@@ -46,7 +71,7 @@ async def fetch_entitlements(mhlm_api_endpoint, access_token, matlab_release):
         list: Representing a list of Dicts containing the id, label and license_number.
     """
     # Get entitlements for token
-    async with aiohttp.ClientSession(trust_env=True) as client_session:
+    async with _get_client_session(client_session) as client_session:
         async with client_session.post(
             mhlm_api_endpoint,
             headers={"content-type": "application/x-www-form-urlencoded"},
@@ -85,13 +110,16 @@ async def fetch_entitlements(mhlm_api_endpoint, access_token, matlab_release):
             ]
 
 
-async def fetch_expand_token(mwa_api_endpoint, identity_token, source_id):
+async def fetch_expand_token(
+    mwa_api_endpoint, identity_token, source_id, client_session=None
+):
     """Asynchronously fetch tokens from MWA API endpoint.
 
     Args:
         mwa_api_endpoint (String): URL of the MWA API endpoint.
         identity_token (String): Identity token received from MHLM servers by the front end.
         source_id (String): Source ID received from MHLM servers by the front end.
+        client_session (aiohttp.ClientSession, optional): Session to send the request with. Defaults to a new session.
 
     Raises:
         OnlineLicensingError: When unable to contact MWA API endpoint.
@@ -99,7 +127,7 @@ async def fetch_expand_token(mwa_api_endpoint, identity_token, source_id):
     Returns:
         Dict: Containing User and License expiration details.
     """
-    async with aiohttp.ClientSession(trust_env=True) as client_session:
+    async with _get_client_session(client_session) as client_session:
         async with client_session.post(
             f"{mwa_api_endpoint}/tokens",
             headers={
@@ -132,21 +160,24 @@ async def fetch_expand_token(mwa_api_endpoint, identity_token, source_id):
             }
 
 
-async def fetch_access_token(mwa_api_endpoint, identity_token, source_id):
+async def fetch_access_token(
+    mwa_api_endpoint, identity_token, source_id, client_session=None
+):
     """Asynchronously fetch access token from MWA API endpoint.
 
     Args:
         mwa_api_endpoint (String): URL of the MWA API endpoint.
         identity_token (String): String representing unique identity
         source_id (String): []
+        client_session (aiohttp.ClientSession, optional): Session to send the request with. Defaults to a new session.
 
     Raises:
         OnlineLicensingError: When unable to contact MWA API endpoint.
 
     Returns:
-        Dict : Containing the Access token.
+        Dict : Containing the Access token and its expiration date, if sent by the server.
     """
-    async with aiohttp.ClientSession(trust_env=True) as client_session:
+    async with _get_client_session(client_session) as client_session:
         async with client_session.post(
             f"{mwa_api_endpoint}/tokens/access",
             headers={
@@ -171,9 +202,228 @@ async def fetch_access_token(mwa_api_endpoint, identity_token, source_id):
 
             return {
                 "token": data["accessTokenString"],
+                "expiry": data.get("expirationDate"),
             }
 
 
+def _seconds_until(expiry):
+    """Returns the number of seconds until an expiration date sent by MathWorks servers, or None if it cannot be parsed."""
+    try:
+        expiry_date = datetime.strptime(expiry, "%Y-%m-%dT%H:%M:%S.%f%z")
+    except (TypeError, ValueError):
+        return None
+    return (expiry_date - datetime.now(timezone.utc)).total_seconds()
+
+
+class _CacheEntry:
+    def __init__(self, value, expires_at):
+        self.value = value
+        # On the time.monotonic() clock
+        self.expires_at = expires_at
+
+
+class LicensingCache:
+    """Caches the tokens and entitlements fetched from MathWorks servers for online licensing (MHLM).
+
+    Tokens are kept until refresh_margin seconds before the expiration date sent by the server, and
+    entitlements for MHLM_ENTITLEMENTS_TTL_SECONDS. Concurrent requests for the same item share a single
+    request to the server, and all requests are sent over a single pooled client session.
+
+    Once start_refresh() is called, the access token is fetched again in the background before it
+    expires, so that starting MATLAB does not wait on a request to MathWorks servers.
+    """
+
+    def __init__(self, refresh_margin=MHLM_CACHE_REFRESH_MARGIN_SECONDS):
+        """Parameterized constructor for the LicensingCache class.
+
+        Args:
+            refresh_margin (float, optional): Time in seconds before the expiry of an item, after which it is fetched again.
+        """
+        self.refresh_margin = refresh_margin
+        self.__client_session = None
+        self.__entries = {}
+        self.__inflight = {}
+        # Incremented when the cache is cleared, so that requests in flight do not populate it afterwards.
+        self.__generation = 0
+        self.__refresh_task = None
+
+        self.__hits_count = 0
+        self.__misses_count = 0
+        self.__errors_count = 0
+        self.__refreshes_count = 0
+
+    async def fetch_access_token(self, mwa_api_endpoint, identity_token, source_id):
+        """Returns an access token, see fetch_access_token()."""
+        return await self.__get(
+            ("access_token", mwa_api_endpoint, identity_token, source_id),
+            lambda client_session: fetch_access_token(
+                mwa_api_endpoint,
+                identity_token,
+                source_id,
+                client_session=client_session,
+            ),
+            lambda token_data: _seconds_until(token_data.get("expiry"))
+            or MHLM_ACCESS_TOKEN_DEFAULT_TTL_SECONDS,
+        )
+
+    async def fetch_expand_token(self, mwa_api_endpoint, identity_token, source_id):
+        """Returns the details of the user and their license, see fetch_expand_token()."""
+        return await self.__get(
+            ("expand_token", mwa_api_endpoint, identity_token, source_id),
+            lambda client_session: fetch_expand_token(
+                mwa_api_endpoint,
+                identity_token,
+                source_id,
+                client_session=client_session,
+            ),
+            lambda token_data: _seconds_until(token_data.get("expiry"))
+            or MHLM_ACCESS_TOKEN_DEFAULT_TTL_SECONDS,
+        )
+
+    async def fetch_entitlements(
+        self,
+        mwa_api_endpoint,
+        mhlm_api_endpoint,
+        identity_token,
+        source_id,
+        matlab_release,
+    ):
+        """Returns the entitlements of the user, see fetch_entitlements().
+
+        The access token required to fetch them is served from the cache as well.
+        """
+
+        async def fetch(client_session):
+            access_token_data = await self.fetch_access_token(
+                mwa_api_endpoint, identity_token, source_id
+            )
+            return await fetch_entitlements(
+                mhlm_api_endpoint,
+                access_token_data["token"],
+                matlab_release,
+                client_session=client_session,
+            )
+
+        return await self.__get(
+            (
+                "entitlements",
+                mhlm_api_endpoint,
+                identity_token,
+                source_id,
+                matlab_release,
+            ),
+            fetch,
+            lambda _: MHLM_ENTITLEMENTS_TTL_SECONDS,
+        )
+
+    def start_refresh(self, mwa_api_endpoint, identity_token, source_id):
+        """Starts refreshing the access token of the user in the background before it expires.
+        Replaces the refresh of the access token of any other user.
+        """
+        self.stop_refresh()
+        self.__refresh_task = asyncio.create_task(
+            self.__refresh_access_token(mwa_api_endpoint, identity_token, source_id)
+        )
+
+    def stop_refresh(self):
+        """Stops refreshing the access token in the background."""
+        if self.__refresh_task is not None:
+            self.__refresh_task.cancel()
+            self.__refresh_task = None
+
+    def clear(self):
+        """Stops refreshing and discards all cached items, for eg: when the user signs out."""
+        self.stop_refresh()
+        self.__generation += 1
+        self.__entries.clear()
+
+    async def close(self):
+        """Discards all cached items and closes the client session."""
+        self.clear()
+        if self.__client_session is not None:
+            await self.__client_session.close()
+            self.__client_session = None
+
+    def get_stats(self) -> dict:
+        """Returns statistics about the usage of the cache.
+
+        Returns:
+            dict: Containing the number of cached items, the number of requests served from the cache and sent to
+                the server, the number of failed requests and the number of background refreshes.
+        """
+        return {
+            "entries": len(self.__entries),
+            "hits": self.__hits_count,
+            "misses": self.__misses_count,
+            "errors": self.__errors_count,
+            "refreshes": self.__refreshes_count,
+            "isRefreshing": self.__refresh_task is not None,
+        }
+
+    async def __get(self, key, fetch, get_expires_in):
+        entry = self.__entries.get(key)
+        if (
+            entry is not None
+            and entry.expires_at - self.refresh_margin > time.monotonic()
+        ):
+            self.__hits_count += 1
+            return entry.value
+
+        task = self.__inflight.get(key)
+        if task is None:
+            self.__misses_count += 1
+            task = asyncio.ensure_future(self.__fetch(key, fetch, get_expires_in))
+            self.__inflight[key] = task
+            task.add_done_callback(lambda _: self.__inflight.pop(key, None))
+
+        # Shielded, so that the request is not cancelled for other callers waiting on it when this caller is cancelled.
+        return await asyncio.shield(task)
+
+    async def __fetch(self, key, fetch, get_expires_in):
+        generation = self.__generation
+        try:
+            value = await fetch(self.__get_client_session())
+        except Exception:
+            self.__errors_count += 1
+            raise
+
+        if generation == self.__generation:
+            self.__entries[key] = _CacheEntry(
+                value, time.monotonic() + get_expires_in(value)
+            )
+        return value
+
+    def __get_client_session(self):
+        if self.__client_session is None or self.__client_session.closed:
+            self.__client_session = aiohttp.ClientSession(trust_env=True)
+        return self.__client_session
+
+    async def __refresh_access_token(self, mwa_api_endpoint, identity_token, source_id):
+        key = ("access_token", mwa_api_endpoint, identity_token, source_id)
+        while True:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                # Waits for at least the retry interval, so that a token which the server sends with a short
+                # lifetime does not cause it to be requested over and over.
+                await asyncio.sleep(
+                    max(
+                        entry.expires_at - self.refresh_margin - time.monotonic(),
+                        MHLM_CACHE_REFRESH_RETRY_SECONDS,
+                    )
+                )
+
+            try:
+                await self.fetch_access_token(
+                    mwa_api_endpoint, identity_token, source_id
+                )
+                self.__refreshes_count += 1
+            except Exception as err:
+                logger.warning(
+                    f"Failed to refresh the access token for online licensing, retrying in {MHLM_CACHE_REFRESH_RETRY_SECONDS} seconds: {err}"
+                )
+                await asyncio.sleep(MHLM_CACHE_REFRESH_RETRY_SECONDS)
+
+
 def range_matlab_connector_ports():
     """Generator of acceptable ports for MATLAB Connector.
         Allowed ports conform to the regex: [3,6]1[5-9][1-9][1-9]
@@ -189,6 +439,20 @@ def range_matlab_connector_ports():
                     yield int(f"{p1}{p2}{p3}{p4}{p5}")
 
 
+def _get_nlm_error(logs, conn_str):
+    return NetworkLicensingError(
+        f"License checkout from {conn_str} failed. For more details, see {__get_licensing_url()}.",
+        logs=logs,
+    )
+
+
+def _get_mhlm_error(logs):
+    return OnlineLicensingError(
+        f"Usage of MathWorks Online Licensing failed. For more details, see {__get_licensing_url()}.",
+        logs=logs,
+    )
+
+
 def parse_nlm_error(logs, conn_str):
     """Parses error logs and returns NLM specific errors
 
@@ -208,10 +472,7 @@ def parse_nlm_error(logs, conn_str):
                 nlm_logs.append(log)
         else:
             if "Diagnostic Information" in log:
-                return NetworkLicensingError(
-                    f"License checkout from {conn_str} failed. For more details, see {__get_licensing_url()}.",
-                    logs=nlm_logs,
-                )
+                return _get_nlm_error(nlm_logs, conn_str)
             nlm_logs.append(log)
     return None
 
@@ -236,10 +497,7 @@ def parse_mhlm_error(logs):
             mhlm_logs.append(log)
 
     if mhlm_logs is not None:
-        return OnlineLicensingError(
-            f"Usage of MathWorks Online Licensing failed. For more details, see {__get_licensing_url()}.",
-            logs=mhlm_logs,
-        )
+        return _get_mhlm_error(mhlm_logs)
     return None
 
 
@@ -258,6 +516,128 @@ def parse_other_error(logs):
     )
 
 
+class StartupErrorDetector:
+    """Matches the licensing and fatal startup errors of MATLAB line by line, as they are written to stderr.
+
+    Unlike parse_nlm_error() and parse_mhlm_error(), which run over the logs after MATLAB has exited,
+    this reports an error as soon as its signature is complete, so that MATLAB can be stopped
+    instead of waiting for it to exit or for the startup timeout to elapse.
+    """
+
+    def __init__(self, licensing):
+        """Parameterized constructor for the StartupErrorDetector class.
+
+        Args:
+            licensing (dict): Licensing information of MATLAB, containing the type of licensing and
+                for network licensing, the connection string.
+        """
+        self.licensing = licensing or {}
+        self.error = None
+        self.__nlm_logs = None
+        self.__mhlm_logs = None
+
+    def feed(self, line):
+        """Matches a line written by MATLAB to stderr.
+
+        Args:
+            line (str): The line, without the line ending.
+
+        Returns:
+            MatlabError: The error, if this line completes its signature. None otherwise,
+                including for the lines after an error has been reported.
+        """
+        if self.error is not None:
+            return None
+
+        licensing_type = self.licensing.get("type")
+
+        if licensing_type == "nlm":
+            if self.__nlm_logs is None:
+                if "License checkout failed" in line:
+                    self.__nlm_logs = [line]
+            elif "Diagnostic Information" in line:
+                self.error = _get_nlm_error(
+                    self.__nlm_logs, self.licensing.get("conn_str")
+                )
+            elif len(self.__nlm_logs) < MAX_MATLAB_LOG_LINES_IN_ERROR:
+                self.__nlm_logs.append(line)
+
+        if licensing_type == "mhlm":
+            if self.__mhlm_logs is None:
+                if "License Manager Error" in line:
+                    self.__mhlm_logs = [line]
+            else:
+                self.__mhlm_logs.append(line)
+
+            # The error is reported once its details have been written. If MATLAB exits before that,
+            # the error is found by parse_mhlm_error() instead.
+            if (
+                self.__mhlm_logs is not None
+                and len(self.__mhlm_logs) > MHLM_ERROR_DETAIL_LINES
+            ):
+                self.error = _get_mhlm_error(self.__mhlm_logs)
+
+        if (
+            self.error is None
+            and self.__mhlm_logs is None
+            and any(signature in line for signature in FATAL_STARTUP_ERROR_SIGNATURES)
+        ):
+            self.error = MatlabError(
+                "MATLAB encountered a fatal error while starting. For more details, see the log below.",
+                logs=[line],
+            )
+
+        return self.error
+
+
+class BoundedLogBuffer:
+    """Keeps the most recent lines written by a process, bounded by both the number of lines and their total size in bytes.
+
+    Lines longer than max_bytes are truncated to max_bytes.
+    """
+
+    def __init__(self, max_lines, max_bytes):
+        """Parameterized constructor for the BoundedLogBuffer class.
+
+        Args:
+            max_lines (int): Maximum number of lines to keep.
+            max_bytes (int): Maximum total size in bytes of the lines to keep.
+        """
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.__lines = deque()
+        self.__size = 0
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the lines in the buffer."""
+        return self.__size
+
+    def append(self, line: bytes) -> None:
+        """Appends a line, discarding the oldest lines as required to stay within the bounds.
+
+        Args:
+            line (bytes): The line.
+        """
+        line = line[: self.max_bytes]
+        self.__lines.append(line)
+        self.__size += len(line)
+
+        while len(self.__lines) > self.max_lines or self.__size > self.max_bytes:
+            self.__size -= len(self.__lines.popleft())
+
+    def clear(self) -> None:
+        """Discards all lines."""
+        self.__lines.clear()
+        self.__size = 0
+
+    def __len__(self):
+        return len(self.__lines)
+
+    def __iter__(self):
+        return iter(self.__lines)
+
+
 async def create_xvfb_process(xvfb_cmd, pipe, env=None):
     """Creates the Xvfb process.
 
@@ -266,10 +646,11 @@ async def create_xvfb_process(xvfb_cmd, pipe, env=None):
 
     We read this display number from the read descriptor.
     For this, we have 2 things to consider:
-        1. How many bytes to read from the read descriptor. This is handled by the variable number_of_bytes.
+        1. How many bytes to read from the read descriptor. Xvfb terminates the display number with a new line.
 
-        2. For how long to read from the read descriptor. We wait for atmost 10 seconds for Xvfb to write
-           the display number using the 'select' package.
+        2. For how long to read from the read descriptor. We wait for atmost the timeout specified by
+           matlab-proxy for launching processes, or until the Xvfb process exits. The read descriptor is
+           watched by the event loop, so other requests continue to be served in the meantime.
 
 
     Args:
@@ -288,23 +669,25 @@ async def create_xvfb_process(xvfb_cmd, pipe, env=None):
     )
 
     read_descriptor, write_descriptor = pipe
-    number_of_bytes = 200
 
     logger.debug("Waiting for XVFB process to initialize and provide Display Number")
 
-    # Wait for timeout specified by matlab-proxy for launching processes.
-    ready_descriptors, _, _ = select.select(
-        [read_descriptor], [], [], get_process_startup_timeout()
-    )
+    try:
+        # Wait for timeout specified by matlab-proxy for launching processes.
+        display_port = await _read_display_number(
+            read_descriptor, xvfb, get_process_startup_timeout()
+        )
 
-    # If read_descriptor is in ready_descriptors, read from it.
-    if read_descriptor in ready_descriptors:
-        logger.debug("Reading display number from the read descriptor.")
-        line = os.read(read_descriptor, number_of_bytes).decode("utf-8")
-        # Xvfb process writes the display number and adds a new line character ('\n') at the end. Removing it with .strip()
-        display_port = line.strip()
+    finally:
+        # Close the read and write descriptors.
+        os.close(read_descriptor)
+        os.close(write_descriptor)
+
+    if not display_port:
+        # Xvfb would still be running if it timed out, in which case its stderr pipe would never reach EOF.
+        if xvfb.returncode is None:
+            xvfb.terminate()
 
-    else:
         # Check for errors and raise exception.
         error = ""
         while not xvfb.stderr.at_eof():
@@ -314,8 +697,52 @@ async def create_xvfb_process(xvfb_cmd, pipe, env=None):
         await xvfb.wait()
         raise XvfbError(f"Unable to start the Xvfb process: \n {error}")
 
-    # Close the read and write descriptors.
-    os.close(read_descriptor)
-    os.close(write_descriptor)
-
     return xvfb, display_port
+
+
+async def _read_display_number(read_descriptor, xvfb, timeout):
+    """Reads the display number written by Xvfb into the read descriptor, without blocking the event loop.
+
+    Args:
+        read_descriptor (int): Non-blocking read descriptor of the pipe passed to Xvfb with the '-displayfd' flag.
+        xvfb (asyncio.subprocess.Process): The Xvfb process.
+        timeout (float): Time in seconds to wait for the display number for.
+
+    Returns:
+        str: The display number, or None if Xvfb exited or timed out before writing it.
+    """
+    loop = asyncio.get_running_loop()
+    display_number_future = loop.create_future()
+    data = bytearray()
+    number_of_bytes = 200
+
+    def on_readable():
+        try:
+            chunk = os.read(read_descriptor, number_of_bytes)
+        except BlockingIOError:
+            return
+
+        data.extend(chunk)
+        # Xvfb process writes the display number and adds a new line character ('\n') at the end.
+        if (not chunk or b"\n" in data) and not display_number_future.done():
+            display_number_future.set_result(data.decode("utf-8").strip())
+
+    loop.add_reader(read_descriptor, on_readable)
+    xvfb_exit = asyncio.ensure_future(xvfb.wait())
+    try:
+        await asyncio.wait(
+            {display_number_future, xvfb_exit},
+            timeout=timeout,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+
+    finally:
+        loop.remove_reader(read_descriptor)
+        xvfb_exit.cancel()
+
+    if display_number_future.done():
+        logger.debug("Read display number from the read descriptor.")
+        return display_number_future.result() or None
+
+    display_number_future.cancel()
+    return None
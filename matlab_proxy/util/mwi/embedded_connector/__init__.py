@@ -1,4 +1,6 @@
-# Copyright (c) 2020-2022 The MathWorks, Inc.
+# Copyright (c) 2020-2025 The MathWorks, Inc.
 
 from . import helpers
+from .health import HealthClient
+from .pool import ConnectionPool
 from .request import get_busy_state, send_request
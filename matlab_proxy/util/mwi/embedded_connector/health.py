@@ -0,0 +1,103 @@
+# Copyright 2025 The MathWorks, Inc.
+
+"""
+This file contains the client used by matlab-proxy to check the health of the embedded connector.
+"""
+
+import json
+
+import aiohttp
+
+from matlab_proxy import constants
+from matlab_proxy.util import mwi
+from matlab_proxy.util.mwi.exceptions import EmbeddedConnectorError
+
+from .helpers import get_data_for_matlab_busy_status_request, get_data_for_ping_request
+from .pool import ConnectionPool
+
+logger = mwi.logger.get()
+
+# Path of the endpoint which serves the state of the Embedded Connector
+STATE_ENDPOINT_PATH = "/messageservice/json/state"
+
+# The payloads never change, so they are encoded only once.
+PING_REQUEST_BODY = json.dumps(get_data_for_ping_request()).encode()
+BUSY_STATUS_REQUEST_BODY = json.dumps(
+    get_data_for_matlab_busy_status_request()
+).encode()
+
+
+class HealthClient:
+    """Sends health check requests directly to the Embedded Connector of a single MATLAB process.
+
+    Requests are sent to 127.0.0.1:<matlab_port><context_root> over a single persistent connection, instead of
+    being sent to matlab-proxy's own server to be proxied. So, health checks do not go through
+    token authentication, do not consume the server's request handling capacity and do not show up
+    in its access logs.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        context_root="",
+        mwapikey=None,
+        timeout=constants.EC_HEALTH_CHECK_TIMEOUT_SECONDS,
+    ):
+        """Parameterized constructor for the HealthClient class.
+
+        Args:
+            base_url (str): Origin at which the Embedded Connector is running at. Eg: http://127.0.0.1:31515
+            context_root (str, optional): Path under which the Embedded Connector serves its endpoints,
+                which is the value of MW_CONNECTOR_CONTEXT_ROOT that MATLAB was started with. Eg: /matlab
+            mwapikey (str, optional): API key which the Embedded Connector expects on every request.
+            timeout (float, optional): Time in seconds after which a health check request fails with asyncio.TimeoutError.
+                As only one request is sent at a time, a request which hangs would otherwise hold up all the later ones.
+        """
+        self.pool = ConnectionPool(
+            base_url,
+            limit_per_host=1,
+            # Retain the session cookie set by the Embedded Connector, so that a new session is not created for every request.
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        )
+        self.__state_path = f"{context_root.rstrip('/')}{STATE_ENDPOINT_PATH}"
+        self.__headers = {"Content-Type": "text/plain; charset=utf-8"}
+        if mwapikey:
+            self.__headers["mwapikey"] = mwapikey
+
+    async def ping(self) -> dict:
+        """Sends a Ping request to the Embedded Connector.
+
+        Raises:
+            EmbeddedConnectorError: When the Embedded Connector does not respond successfully.
+
+        Returns:
+            dict: The json response from Embedded connector
+        """
+        return await self.__send_state_request(PING_REQUEST_BODY)
+
+    async def get_matlab_status(self) -> dict:
+        """Sends a GetMatlabStatus request to the Embedded Connector.
+
+        Raises:
+            EmbeddedConnectorError: When the Embedded Connector does not respond successfully.
+
+        Returns:
+            dict: The json response from Embedded connector
+        """
+        return await self.__send_state_request(BUSY_STATUS_REQUEST_BODY)
+
+    async def __send_state_request(self, body):
+        async with self.pool.request(
+            "POST", self.__state_path, data=body, headers=self.__headers
+        ) as resp:
+            if not resp.ok:
+                raise EmbeddedConnectorError(
+                    f"Failed to communicate with Embedded Connector.\nHTTP Request details:\n{body.decode()}"
+                )
+
+            return await resp.json()
+
+    async def close(self):
+        """Closes the persistent connection to the Embedded Connector."""
+        await self.pool.close()
@@ -0,0 +1,166 @@
+# Copyright 2025 The MathWorks, Inc.
+
+"""
+This file contains the connection pool used to communicate with the embedded connector.
+"""
+
+import time
+
+import aiohttp
+
+from matlab_proxy import constants
+from matlab_proxy.util import mwi
+
+logger = mwi.logger.get()
+
+
+class ConnectionPool:
+    """A keep-alive pool of connections to the Embedded Connector of a single MATLAB process.
+
+    A single aiohttp.ClientSession (and its TCPConnector) is shared by all the requests proxied
+    to the Embedded Connector, so that connections are reused instead of being re-established for
+    every request. The pool has the same lifetime as the MATLAB process it communicates with.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        limit_per_host=constants.DEFAULT_EC_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=constants.DEFAULT_EC_POOL_KEEPALIVE_TIMEOUT_SECONDS,
+        cookie_jar=None,
+        timeout=None,
+    ):
+        """Parameterized constructor for the ConnectionPool class.
+
+        Args:
+            base_url (str): Origin at which the Embedded Connector is running at. Eg: http://127.0.0.1:31515
+            limit_per_host (int, optional): Max number of simultaneous connections to the Embedded Connector. 0 implies no limit.
+            keepalive_timeout (int, optional): Time in seconds for which an idle connection is kept open for reuse.
+            cookie_jar (aiohttp.abc.AbstractCookieJar, optional): Cookie jar of the pool. Defaults to a jar which does not store any cookies.
+            timeout (aiohttp.ClientTimeout, optional): Timeouts of the requests sent through the pool. Defaults to no timeout,
+                as requests like file downloads can take a long time.
+        """
+        self.base_url = base_url
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.created_at = time.time()
+        self.__cookie_jar = cookie_jar
+        self.__timeout = (
+            timeout if timeout is not None else aiohttp.ClientTimeout(total=None)
+        )
+
+        self.__session = None
+        self.__closed = False
+        self.__http_requests_count = 0
+        self.__websocket_connections_count = 0
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Returns the ClientSession shared by all requests to the Embedded Connector.
+        The session is created on first use, as it needs to be created within a running event loop.
+
+        Raises:
+            aiohttp.ClientConnectionError: When the pool has already been closed.
+        """
+        if self.__closed:
+            raise aiohttp.ClientConnectionError(
+                f"Connection pool to the Embedded Connector at {self.base_url} is closed."
+            )
+
+        if self.__session is None:
+            self.__session = aiohttp.ClientSession(
+                trust_env=True,
+                connector=aiohttp.TCPConnector(
+                    ssl=False,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                ),
+                # Cookies of proxied requests are managed by matlab-proxy's cookie jar (if enabled) and passed
+                # explicitly with each request. Do not let cookies from one request leak into the next.
+                cookie_jar=(
+                    self.__cookie_jar
+                    if self.__cookie_jar is not None
+                    else aiohttp.DummyCookieJar()
+                ),
+                timeout=self.__timeout,
+            )
+            logger.debug(
+                f"Created connection pool to the Embedded Connector at {self.base_url}"
+            )
+
+        return self.__session
+
+    @property
+    def closed(self) -> bool:
+        """Returns True if the pool has been closed."""
+        return self.__closed
+
+    def request(self, method, path, **kwargs):
+        """Sends a HTTP request to the Embedded Connector using a pooled connection.
+
+        Args:
+            method (str): HTTP Request type.
+            path (str): Path (including the query string) relative to the base_url, or a complete URL.
+            **kwargs: Passed through to aiohttp.ClientSession.request()
+
+        Returns:
+            aiohttp.client._RequestContextManager: To be used as an async context manager.
+        """
+        url = path if path.startswith(self.base_url) else f"{self.base_url}{path}"
+        self.__http_requests_count += 1
+        return self.session.request(method, url, **kwargs)
+
+    def ws_connect(self, path, **kwargs):
+        """Opens a WebSocket connection to the Embedded Connector through the pool.
+
+        Args:
+            path (str): Path (including the query string) relative to the base_url.
+            **kwargs: Passed through to aiohttp.ClientSession.ws_connect()
+
+        Returns:
+            aiohttp.client._WSRequestContextManager: To be used as an async context manager.
+        """
+        self.__websocket_connections_count += 1
+        return self.session.ws_connect(f"{self.base_url}{path}", **kwargs)
+
+    async def close(self):
+        """Closes all connections held by the pool. The pool cannot be used after it is closed."""
+        if self.__closed:
+            return
+
+        self.__closed = True
+        if self.__session is not None:
+            await self.__session.close()
+            logger.debug(
+                f"Closed connection pool to the Embedded Connector at {self.base_url}"
+            )
+        self.__session = None
+
+    def get_stats(self) -> dict:
+        """Returns statistics about the usage of the pool.
+
+        Returns:
+            dict: Containing the configuration of the pool, number of requests made through it
+            and the number of connections currently in use and idle.
+        """
+        active_connections, idle_connections = 0, 0
+
+        connector = self.__session.connector if self.__session is not None else None
+        if connector is not None:
+            # aiohttp does not expose these counts publicly, read them defensively.
+            active_connections = len(getattr(connector, "_acquired", ()))
+            idle_connections = sum(
+                len(conns) for conns in getattr(connector, "_conns", {}).values()
+            )
+
+        return {
+            "baseUrl": self.base_url,
+            "limitPerHost": self.limit_per_host,
+            "keepaliveTimeout": self.keepalive_timeout,
+            "uptime": round(time.time() - self.created_at, 3),
+            "closed": self.__closed,
+            "httpRequests": self.__http_requests_count,
+            "websocketConnections": self.__websocket_connections_count,
+            "activeConnections": active_connections,
+            "idleConnections": idle_connections,
+        }
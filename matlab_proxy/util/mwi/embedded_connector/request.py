@@ -4,6 +4,7 @@
 This file contains the methods to communicate with the embedded connector.
 """
 
+import asyncio
 import json
 
 from matlab_proxy.util.mwi.exceptions import EmbeddedConnectorError
@@ -68,25 +69,27 @@ async def send_request(url: str, data: dict, method: str, headers: dict = None)
         raise err
 
 
-async def get_state(mwi_server_url, headers=None):
+async def get_state(mwi_server_url, headers=None, health_client=None):
     """Returns the state of MATLAB's Embedded Connector.
 
     Args:
-        port (int): The port on which the embedded connector is running at
+        mwi_server_url (str): The complete origin where the matlab-proxy server is running at.
         headers: Headers to include with the request
+        health_client (HealthClient, optional): When supplied, the request is sent directly to the
+            Embedded Connector using this client instead of being sent to mwi_server_url.
     Returns:
         str: Either "up" or "down"
     """
-    data = get_data_for_ping_request()
-    url = get_ping_endpoint(mwi_server_url)
-
     try:
-        resp = await send_request(
-            url=url,
-            data=data,
-            method="POST",
-            headers=headers,
-        )
+        if health_client is not None:
+            resp = await health_client.ping()
+        else:
+            resp = await send_request(
+                url=get_ping_endpoint(mwi_server_url),
+                data=get_data_for_ping_request(),
+                method="POST",
+                headers=headers,
+            )
 
         # Any changes in response from embedded connector would be caught by KeyError
         if not resp["messages"]["PingResponse"][0]["messageFaults"]:
@@ -95,6 +98,9 @@ async def get_state(mwi_server_url, headers=None):
     except KeyError as key_err:
         logger.error(f"Invalid Key Usage Detected! Check key: {key_err}")
 
+    except asyncio.TimeoutError:
+        logger.debug("Embedded connector did not respond to the request in time.")
+
     except Exception as err:
         logger.debug(
             f"{err}: Embbeded connector is currently not responding to ping requests."
@@ -103,27 +109,29 @@ async def get_state(mwi_server_url, headers=None):
     return "down"
 
 
-async def get_busy_state(mwi_server_url, headers=None):
+async def get_busy_state(mwi_server_url, headers=None, health_client=None):
     """Returns the state of MATLAB's Embedded Connector.
 
     Args:
-        port (int): The port on which the embedded connector is running at
+        mwi_server_url (str): The complete origin where the matlab-proxy server is running at.
         headers: Headers to include with the request
+        health_client (HealthClient, optional): When supplied, the request is sent directly to the
+            Embedded Connector using this client instead of being sent to mwi_server_url.
     Returns:
         str: Either "idle" or "busy" when a valid response is received. Else None is returned.
     """
-    data = get_data_for_matlab_busy_status_request()
-    url = get_ping_endpoint(mwi_server_url)
-
     busy_status = None
 
     try:
-        resp = await send_request(
-            url=url,
-            data=data,
-            method="POST",
-            headers=headers,
-        )
+        if health_client is not None:
+            resp = await health_client.get_matlab_status()
+        else:
+            resp = await send_request(
+                url=get_ping_endpoint(mwi_server_url),
+                data=get_data_for_matlab_busy_status_request(),
+                method="POST",
+                headers=headers,
+            )
 
         busy_status = resp["messages"]["GetMatlabStatusResponse"][0]["status"].lower()
 
@@ -135,6 +143,9 @@ async def get_busy_state(mwi_server_url, headers=None):
     except KeyError as key_err:
         logger.error(f"Invalid Key Usage Detected! Check key: {key_err}")
 
+    except asyncio.TimeoutError:
+        logger.debug("Embedded connector did not respond to the request in time.")
+
     except Exception as err:
         logger.debug(
             f"{err}: Embedded connector is currently not responding to ping requests."
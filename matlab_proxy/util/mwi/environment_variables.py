@@ -132,6 +132,11 @@ def get_env_name_ssl_key_file():
     return "MWI_SSL_KEY_FILE"
 
 
+def get_env_name_ssl_key_type():
+    """Specifies the type of key of the self-signed certificate generated when no certificate is supplied, one of rsa/ecdsa."""
+    return "MWI_SSL_KEY_TYPE"
+
+
 def get_env_name_enable_mwi_auth_token():
     """Specifies whether the server should provide Token-Based Authentication"""
     return "MWI_ENABLE_TOKEN_AUTH"
@@ -177,6 +182,66 @@ def get_env_name_session_name():
     return "MWI_SESSION_NAME"
 
 
+def get_env_name_ec_pool_limit_per_host():
+    """Max number of simultaneous connections from matlab-proxy to MATLAB's Embedded Connector"""
+    return "MWI_EC_POOL_LIMIT_PER_HOST"
+
+
+def get_env_name_ec_pool_keepalive_timeout():
+    """Time in seconds for which an idle connection to MATLAB's Embedded Connector is kept open for reuse"""
+    return "MWI_EC_POOL_KEEPALIVE_TIMEOUT"
+
+
+def get_env_name_matlab_status_max_interval():
+    """Ceiling in seconds for the interval between queries of the status of MATLAB when no clients are connected"""
+    return "MWI_MATLAB_STATUS_MAX_INTERVAL"
+
+
+def get_env_name_ws_compression_min_size():
+    """Size in bytes below which websocket messages sent to the browser are not compressed"""
+    return "MWI_WS_COMPRESSION_MIN_SIZE"
+
+
+def get_env_name_ws_compression_level():
+    """zlib compression level from 0 to 9 of websocket messages sent to the browser, 0 disables compression"""
+    return "MWI_WS_COMPRESSION_LEVEL"
+
+
+def get_env_name_ws_compression_window_bits():
+    """Base 2 logarithm of the size of the window used to compress websocket messages sent to the browser, from 9 to 15"""
+    return "MWI_WS_COMPRESSION_WINDOW_BITS"
+
+
+def get_env_name_ws_compression_min_savings():
+    """Percentage of bytes which compression must save for it to continue on a websocket connection, 0 never stops it"""
+    return "MWI_WS_COMPRESSION_MIN_SAVINGS"
+
+
+def get_env_name_ws_memory_budget_per_connection():
+    """Memory in MB for websocket messages waiting to be relayed on a connection, which is also the max size of a message"""
+    return "MWI_WS_MEMORY_BUDGET_PER_CONNECTION"
+
+
+def get_env_name_ws_memory_budget():
+    """Memory in MB for websocket messages waiting to be relayed across all connections"""
+    return "MWI_WS_MEMORY_BUDGET"
+
+
+def get_env_name_xvfb_profile():
+    """Preset for the virtual screen created by Xvfb, one of default/lean"""
+    return "MWI_XVFB_PROFILE"
+
+
+def get_env_name_xvfb_screen():
+    """Size and depth of the virtual screen created by Xvfb, in the form WIDTHxHEIGHTxDEPTH"""
+    return "MWI_XVFB_SCREEN"
+
+
+def get_env_name_xvfb_options():
+    """Additional command line options to start Xvfb with"""
+    return "MWI_XVFB_OPTIONS"
+
+
 class Experimental:
     """This class houses functions which are undocumented APIs and Environment variables.
     Note: Never add any state to this class. Its only intended for use as an abstraction layer
@@ -193,6 +193,20 @@ class LockAcquisitionError(Exception):
     pass
 
 
+class WebSocketMemoryBudgetError(Exception):
+    """Exception raised when a websocket message cannot be relayed within the memory budget for websocket messages.
+
+    Args:
+        close_code (int): Code to close the websockets of the connection with.
+        message (str): Reason to close the websockets with.
+    """
+
+    def __init__(self, close_code, message):
+        super().__init__(message)
+        self.close_code = close_code
+        self.message = message
+
+
 def log_error(logger, err: Exception):
     """Logs any error to stdout.
 
@@ -4,13 +4,16 @@
 
 import os
 import secrets
+import time
+from collections import OrderedDict
 from hashlib import sha256
 from hmac import compare_digest
 from urllib.parse import parse_qs
 
 from aiohttp import web
-from aiohttp_session import get_session, new_session
+from aiohttp_session import STORAGE_KEY, get_session, new_session
 
+from matlab_proxy import constants
 from matlab_proxy.util.mwi import environment_variables as mwi_env
 from matlab_proxy.util.mwi import logger as mwi_logger
 
@@ -19,6 +22,109 @@ logger = mwi_logger.get()
 ## Module Public Methods:
 
 
+class AuthVerdictCache:
+    """Caches the session cookies which are known to contain a valid auth token.
+
+    Validating the session cookie of a request requires decrypting it, which is done for every
+    request to an endpoint that requires authentication, including every request proxied to MATLAB.
+    Cookies which were found to be valid are remembered by their raw value, so that subsequent
+    requests with the same cookie are authenticated without decrypting it again.
+
+    The cache holds at most max_entries cookies, evicting the least recently used one when full.
+    Entries expire after ttl seconds and all entries are evicted when the auth token changes.
+    """
+
+    def __init__(
+        self,
+        max_entries=constants.AUTH_VERDICT_CACHE_MAX_ENTRIES,
+        ttl=constants.AUTH_VERDICT_CACHE_TTL_SECONDS,
+    ):
+        """Parameterized constructor for the AuthVerdictCache class.
+
+        Args:
+            max_entries (int, optional): Maximum number of cookies to cache.
+            ttl (float, optional): Time in seconds for which a cookie is cached.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self.__entries = OrderedDict()
+        self.__token_hash = None
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def is_valid(self, cookie, token_hash) -> bool:
+        """Whether the cookie is known to contain the auth token whose hash is token_hash.
+
+        Args:
+            cookie (str): Raw value of the session cookie.
+            token_hash (str): Hash of the current auth token.
+
+        Returns:
+            bool: True if the cookie was cached for the current token and has not expired.
+        """
+        self.__evict_on_token_change(token_hash)
+
+        expiry = self.__entries.get(cookie)
+        if expiry is None:
+            self.__misses += 1
+            return False
+
+        if expiry <= time.monotonic():
+            del self.__entries[cookie]
+            self.__misses += 1
+            return False
+
+        self.__entries.move_to_end(cookie)
+        self.__hits += 1
+        return True
+
+    def add(self, cookie, token_hash) -> None:
+        """Remembers that the cookie contains the auth token whose hash is token_hash.
+
+        Args:
+            cookie (str): Raw value of the session cookie.
+            token_hash (str): Hash of the current auth token.
+        """
+        self.__evict_on_token_change(token_hash)
+
+        self.__entries[cookie] = time.monotonic() + self.ttl
+        self.__entries.move_to_end(cookie)
+        while len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
+
+    def clear(self) -> None:
+        """Evicts all the cookies from the cache."""
+        self.__evictions += len(self.__entries)
+        self.__entries.clear()
+
+    def get_stats(self) -> dict:
+        """Returns statistics about the usage of the cache.
+
+        Returns:
+            dict: Containing the number of cached cookies, hits, misses and evictions.
+        """
+        return {
+            "entries": len(self.__entries),
+            "maxEntries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+        }
+
+    def __evict_on_token_change(self, token_hash):
+        # Cookies which contain the previous token are no longer valid.
+        if token_hash != self.__token_hash:
+            if self.__entries:
+                logger.debug("Auth token changed, evicting cached session cookies.")
+                self.clear()
+            self.__token_hash = token_hash
+
+
 def generate_mwi_auth_token_and_hash():
     """
     Generate the MWI Token and a hash for that token to be used by the server,
@@ -226,18 +332,41 @@ async def _is_valid_token_in_session_cookie(request):
         Boolean : True if valid token is found
     """
     logger.debug("Checking for token in session cookie...")
+    cookie = _get_session_cookie(request)
+    cache = request.app.get("auth_verdict_cache")
+    token_hash = await _get_token_hash(request)
+    if cookie and cache is not None and cache.is_valid(cookie, token_hash):
+        logger.debug("Session cookie found in cache, skipping validation.")
+        return True
+
     session = await get_session(request)
     logger.debug(f"Got session cookie.")
     token_name = await _get_token_name(request)
     if token_name in session:
         stored_session_token = session[token_name]
         logger.debug(f"Found token in session cookie, validating...")
-        return await _is_valid_token(stored_session_token, request)
+        is_valid = await _is_valid_token(stored_session_token, request)
+        if is_valid and cookie and cache is not None:
+            cache.add(cookie, token_hash)
+        return is_valid
 
     logger.debug("Token not found in session cookie.")
     return False
 
 
+def _get_session_cookie(request):
+    """Gets the raw value of the session cookie sent with the request.
+
+    Args:
+        request (HTTPRequest) : Used to access the session storage
+
+    Returns:
+        str : Value of the session cookie, None if it is not present or sessions are not set up.
+    """
+    storage = request.get(STORAGE_KEY)
+    return storage.load_cookie(request) if storage is not None else None
+
+
 async def _is_valid_token_in_url_query(request):
     """Checks the url_query parameter for auth token
 
@@ -279,6 +408,8 @@ async def _is_valid_token_in_headers(request):
     if token_name in headers:
         logger.debug(f"Token found in headers: {token_name}")
         is_valid_token = await _is_valid_token(headers[token_name], request)
+        # Requests with a valid session cookie are authenticated before their headers are checked,
+        # so a session is only issued to requests without one.
         if is_valid_token:
             await _store_token_hash_into_session(request)
         return is_valid_token
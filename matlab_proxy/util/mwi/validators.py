@@ -14,13 +14,30 @@ Exceptions are thrown to signal failure.
 import errno
 import math
 import os
+import re
+import shlex
 import socket
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import matlab_proxy
 from matlab_proxy import util
-from matlab_proxy.constants import VERSION_INFO_FILE_NAME
+from matlab_proxy.constants import (
+    DEFAULT_CHECK_MATLAB_STATUS_MAX_INTERVAL_SECONDS,
+    DEFAULT_EC_POOL_KEEPALIVE_TIMEOUT_SECONDS,
+    DEFAULT_EC_POOL_LIMIT_PER_HOST,
+    DEFAULT_SSL_KEY_TYPE,
+    DEFAULT_WS_COMPRESSION_LEVEL,
+    DEFAULT_WS_COMPRESSION_MIN_SAVINGS_PERCENT,
+    DEFAULT_WS_COMPRESSION_MIN_SIZE,
+    DEFAULT_WS_COMPRESSION_WINDOW_BITS,
+    DEFAULT_WS_MEMORY_BUDGET,
+    DEFAULT_WS_MEMORY_BUDGET_PER_CONNECTION,
+    DEFAULT_XVFB_PROFILE,
+    SSL_KEY_TYPES,
+    VERSION_INFO_FILE_NAME,
+    XVFB_PROFILES,
+)
 from matlab_proxy.util import system
 
 from . import environment_variables as mwi_env
@@ -241,6 +258,29 @@ def validate_ssl_file(ssl_file, env_name):
     return ssl_file
 
 
+def validate_ssl_key_type(key_type):
+    """Validate the type of key of the generated self-signed certificate.
+
+    Args:
+        key_type (None | str): One of constants.SSL_KEY_TYPES.
+
+    Returns:
+        str: The validated key type or the default key type if the value supplied is invalid.
+    """
+    if key_type is None or key_type.strip() == "":
+        return DEFAULT_SSL_KEY_TYPE
+
+    key_type = key_type.strip().lower()
+    if key_type not in SSL_KEY_TYPES:
+        logger.warning(
+            f"Invalid value supplied for {mwi_env.get_env_name_ssl_key_type()}: {key_type}. "
+            f"Supported values are {', '.join(SSL_KEY_TYPES)}. Continuing with the default value of {DEFAULT_SSL_KEY_TYPE}."
+        )
+        return DEFAULT_SSL_KEY_TYPE
+
+    return key_type
+
+
 def validate_ssl_key_and_cert_file(ssl_key_file, ssl_cert_file):
     """Validates that provided SSL files are valid readable files"""
     env_name_ssl_cert_file = mwi_env.get_env_name_ssl_cert_file()
@@ -384,3 +424,249 @@ def validate_idle_timeout(timeout):
             f"Invalid value supplied for {mwi_env.get_env_name_shutdown_on_idle_timeout()}: {timeout}. Continuing without any IDLE timeout."
         )
         return None
+
+
+def _validate_non_negative_int(value, env_name, default):
+    """Validates that the value supplied for an environment variable is a non-negative integer.
+
+    Args:
+        value (None | str): Value supplied for the environment variable.
+        env_name (str): Name of the environment variable, used for logging.
+        default (int): Value to fall back to when the supplied value is not set or is invalid.
+
+    Returns:
+        int: The validated value or the default value.
+    """
+    if value is None or str(value).strip() == "":
+        return default
+
+    try:
+        value = int(value)
+
+        if value < 0:
+            raise ValueError
+
+        return value
+
+    except ValueError:
+        logger.warning(
+            f"Invalid value supplied for {env_name}: {value}. Continuing with the default value of {default}."
+        )
+        return default
+
+
+def _validate_int_in_range(value, env_name, default, minimum, maximum):
+    """Validates that the value supplied for an environment variable is an integer within a range.
+
+    Args:
+        value (None | str): Value supplied for the environment variable.
+        env_name (str): Name of the environment variable, used for logging.
+        default (int): Value to fall back to when the supplied value is not set or is invalid.
+        minimum (int): Smallest valid value.
+        maximum (int): Largest valid value.
+
+    Returns:
+        int: The validated value or the default value.
+    """
+    if value is None or str(value).strip() == "":
+        return default
+
+    try:
+        value = int(value)
+
+        if not minimum <= value <= maximum:
+            raise ValueError
+
+        return value
+
+    except ValueError:
+        logger.warning(
+            f"Invalid value supplied for {env_name}: {value}. Supported values are integers from {minimum} to {maximum}. "
+            f"Continuing with the default value of {default}."
+        )
+        return default
+
+
+def validate_ec_pool_limit_per_host(limit):
+    """Validate the max number of simultaneous connections to the Embedded Connector.
+
+    Args:
+        limit (None | str): Max number of connections. 0 implies no limit.
+
+    Returns:
+        int: The validated limit or the default limit if the value supplied is invalid.
+    """
+    return _validate_non_negative_int(
+        limit,
+        mwi_env.get_env_name_ec_pool_limit_per_host(),
+        DEFAULT_EC_POOL_LIMIT_PER_HOST,
+    )
+
+
+def validate_ec_pool_keepalive_timeout(timeout):
+    """Validate the keep-alive timeout for idle connections to the Embedded Connector.
+
+    Args:
+        timeout (None | str): Keep-alive timeout in seconds.
+
+    Returns:
+        int: The validated timeout or the default timeout if the value supplied is invalid.
+    """
+    return _validate_non_negative_int(
+        timeout,
+        mwi_env.get_env_name_ec_pool_keepalive_timeout(),
+        DEFAULT_EC_POOL_KEEPALIVE_TIMEOUT_SECONDS,
+    )
+
+
+def validate_matlab_status_max_interval(interval):
+    """Validate the ceiling for the interval between queries of the status of MATLAB.
+
+    Args:
+        interval (None | str): Interval in seconds.
+
+    Returns:
+        int: The validated interval or the default interval if the value supplied is invalid.
+    """
+    return _validate_non_negative_int(
+        interval,
+        mwi_env.get_env_name_matlab_status_max_interval(),
+        DEFAULT_CHECK_MATLAB_STATUS_MAX_INTERVAL_SECONDS,
+    )
+
+
+def validate_ws_compression_policy(
+    min_size=None, level=None, window_bits=None, min_savings=None
+) -> Optional[dict]:
+    """Validate the policy for compressing the websocket messages sent to the browser.
+
+    The policy is opt-in. When none of its settings are supplied, the messages are compressed by aiohttp.
+
+    Args:
+        min_size (None | str): Size in bytes below which messages are not compressed.
+        level (None | str): zlib compression level from 0 to 9, 0 disables compression.
+        window_bits (None | str): Base 2 logarithm of the size of the compression window, from 9 to 15.
+        min_savings (None | str): Percentage of bytes which compression must save for it to continue, 0 never stops it.
+
+    Returns:
+        None | dict: None if no setting is supplied. Otherwise, the validated policy, with the default value
+            for each setting which is not supplied or whose supplied value is invalid.
+    """
+    if all(value is None for value in (min_size, level, window_bits, min_savings)):
+        return None
+
+    return {
+        "min_size": _validate_non_negative_int(
+            min_size,
+            mwi_env.get_env_name_ws_compression_min_size(),
+            DEFAULT_WS_COMPRESSION_MIN_SIZE,
+        ),
+        "level": _validate_int_in_range(
+            level,
+            mwi_env.get_env_name_ws_compression_level(),
+            DEFAULT_WS_COMPRESSION_LEVEL,
+            0,
+            9,
+        ),
+        "window_bits": _validate_int_in_range(
+            window_bits,
+            mwi_env.get_env_name_ws_compression_window_bits(),
+            DEFAULT_WS_COMPRESSION_WINDOW_BITS,
+            9,
+            15,
+        ),
+        "min_savings": _validate_int_in_range(
+            min_savings,
+            mwi_env.get_env_name_ws_compression_min_savings(),
+            DEFAULT_WS_COMPRESSION_MIN_SAVINGS_PERCENT,
+            0,
+            100,
+        ),
+    }
+
+
+def validate_ws_memory_budgets(per_connection=None, total=None) -> dict:
+    """Validate the memory budgets of relayed websocket messages.
+
+    Args:
+        per_connection (None | str): Budget in MB of each connection.
+        total (None | str): Budget in MB across all connections.
+
+    Returns:
+        dict: The validated budgets in bytes, with the default value for each budget whose supplied value is invalid.
+    """
+    mb = 1_000_000
+    per_connection = _validate_int_in_range(
+        per_connection,
+        mwi_env.get_env_name_ws_memory_budget_per_connection(),
+        DEFAULT_WS_MEMORY_BUDGET_PER_CONNECTION // mb,
+        1,
+        math.inf,
+    )
+    total = _validate_int_in_range(
+        total,
+        mwi_env.get_env_name_ws_memory_budget(),
+        DEFAULT_WS_MEMORY_BUDGET // mb,
+        1,
+        math.inf,
+    )
+
+    # Every message which is accepted on a connection must fit into the budget of the process.
+    if total < per_connection:
+        logger.warning(
+            f"{mwi_env.get_env_name_ws_memory_budget()}: {total} is smaller than "
+            f"{mwi_env.get_env_name_ws_memory_budget_per_connection()}: {per_connection}. Continuing with {per_connection}."
+        )
+        total = per_connection
+
+    return {"per_connection": per_connection * mb, "total": total * mb}
+
+
+def validate_xvfb_options(profile, screen=None, options=None) -> List[str]:
+    """Validate the configuration of the virtual screen of Xvfb and build the options to start Xvfb with.
+
+    Args:
+        profile (None | str): Name of a preset in constants.XVFB_PROFILES.
+        screen (None | str): Size and depth of the screen in the form WIDTHxHEIGHTxDEPTH, overrides the one of the profile.
+        options (None | str): Additional command line options, appended to the ones of the profile.
+
+    Returns:
+        List[str]: The command line options for Xvfb, excluding the -displayfd option.
+    """
+    if profile is None or profile.strip() == "":
+        profile = DEFAULT_XVFB_PROFILE
+
+    profile = profile.strip().lower()
+    if profile not in XVFB_PROFILES:
+        logger.warning(
+            f"Invalid value supplied for {mwi_env.get_env_name_xvfb_profile()}: {profile}. "
+            f"Supported values are {', '.join(XVFB_PROFILES)}. Continuing with the {DEFAULT_XVFB_PROFILE} profile."
+        )
+        profile = DEFAULT_XVFB_PROFILE
+
+    preset = XVFB_PROFILES[profile]
+
+    if screen and screen.strip():
+        screen = screen.strip()
+        if not re.fullmatch(r"[1-9]\d*x[1-9]\d*x[1-9]\d*", screen):
+            logger.warning(
+                f"Invalid value supplied for {mwi_env.get_env_name_xvfb_screen()}: {screen}. "
+                f"Continuing with the screen of the {profile} profile: {preset['screen']}."
+            )
+            screen = preset["screen"]
+    else:
+        screen = preset["screen"]
+
+    extra_options = []
+    if options and options.strip():
+        try:
+            extra_options = shlex.split(options)
+        except ValueError as err:
+            logger.warning(
+                f"Invalid value supplied for {mwi_env.get_env_name_xvfb_options()}: {options}. "
+                f"Continuing without additional options. Error: {err}"
+            )
+
+    xvfb_options = ["-screen", "0", screen, *preset["options"], *extra_options]
+    logger.debug(f"Using Xvfb profile: {profile}, options: {xvfb_options}")
+    return xvfb_options
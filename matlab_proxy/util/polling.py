@@ -0,0 +1,161 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import asyncio
+
+from matlab_proxy.util import mwi
+
+logger = mwi.logger.get()
+
+
+class AdaptivePollingScheduler:
+    """Decides how long to wait between consecutive probes of the state of MATLAB.
+
+    The policy is:
+        1) MATLAB is starting: Probe every starting_interval seconds.
+        2) MATLAB is down or idle, its state has not changed since the last probe and no clients are connected:
+           Back off exponentially from base_interval up to max_interval seconds.
+        3) Otherwise: Probe every base_interval seconds.
+
+    The wait for the next probe can be cut short by calling probe_now(), for eg: when a request proxied to MATLAB fails.
+    """
+
+    # Name of the job which probes the state of MATLAB in the TimerWheel
+    JOB_NAME = "update_matlab_state"
+
+    def __init__(
+        self, base_interval, starting_interval, max_interval, timer_wheel=None
+    ):
+        """Parameterized constructor for the AdaptivePollingScheduler class.
+
+        Args:
+            base_interval (float): Interval in seconds between probes when not starting or backing off.
+            starting_interval (float): Interval in seconds between probes while MATLAB is starting.
+            max_interval (float): Ceiling in seconds for the interval when backing off.
+                A value less than or equal to base_interval disables backing off.
+            timer_wheel (TimerWheel, optional): Timer wheel to wait for the next probe on.
+                If not supplied, asyncio's own timers are used.
+        """
+        self.base_interval = base_interval
+        self.starting_interval = starting_interval
+        self.max_interval = max(max_interval, base_interval)
+        self.timer_wheel = timer_wheel
+
+        self.__mode = "base"
+        self.__interval = base_interval
+        self.__last_state = None
+        self.__probe_now_event = asyncio.Event()
+        self.__probe_now_reason = None
+
+        self.__probes_count = 0
+        self.__early_probes_count = 0
+
+    def next_interval(self, matlab_state, matlab_busy_state, has_clients) -> float:
+        """Computes the interval to wait for before the next probe, based on the result of the latest probe.
+
+        Args:
+            matlab_state (str): State of MATLAB, one of down/starting/up.
+            matlab_busy_state (str): Busy state of MATLAB, one of busy/idle or None.
+            has_clients (bool): Whether any clients are currently connected to the server.
+
+        Returns:
+            float: Interval in seconds.
+        """
+        state = (matlab_state, matlab_busy_state)
+        is_state_unchanged = state == self.__last_state
+        self.__last_state = state
+
+        if matlab_state == "starting":
+            mode, interval = "starting", self.starting_interval
+
+        elif (
+            is_state_unchanged
+            and not has_clients
+            and (matlab_state == "down" or matlab_busy_state == "idle")
+        ):
+            mode = "backoff"
+            interval = min(
+                (
+                    self.__interval * 2
+                    if self.__mode == "backoff"
+                    else self.base_interval * 2
+                ),
+                self.max_interval,
+            )
+
+        else:
+            mode, interval = "base", self.base_interval
+
+        if (mode, interval) != (self.__mode, self.__interval):
+            logger.debug(
+                f"Probing MATLAB state every {interval} seconds, mode: '{mode}'"
+            )
+
+        self.__mode, self.__interval = mode, interval
+        return interval
+
+    async def wait_for_next_probe(
+        self, matlab_state, matlab_busy_state, has_clients
+    ) -> None:
+        """Waits until the next probe is due, or until probe_now() is called.
+
+        Args:
+            matlab_state (str): State of MATLAB, one of down/starting/up.
+            matlab_busy_state (str): Busy state of MATLAB, one of busy/idle or None.
+            has_clients (bool): Whether any clients are currently connected to the server.
+        """
+        self.__probes_count += 1
+        interval = self.next_interval(matlab_state, matlab_busy_state, has_clients)
+
+        # asyncio.wait() is used instead of asyncio.wait_for(), as the latter swallows the cancellation
+        # of this task (on python < 3.12) if probe_now() is called in the same iteration of the event loop.
+        waiters = {asyncio.ensure_future(self.__probe_now_event.wait())}
+        timeout = interval
+        if self.timer_wheel:
+            waiters.add(
+                asyncio.ensure_future(self.timer_wheel.sleep(self.JOB_NAME, interval))
+            )
+            timeout = None
+
+        try:
+            await asyncio.wait(
+                waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+        if self.__probe_now_event.is_set():
+            self.__probe_now_event.clear()
+            self.__early_probes_count += 1
+            logger.debug(
+                f"Probing MATLAB state early, reason: {self.__probe_now_reason}"
+            )
+
+            # Events which cause an early probe usually signal a change in the state of MATLAB
+            self.__mode, self.__interval = "base", self.base_interval
+
+    def probe_now(self, reason) -> None:
+        """Cuts short the wait for the next probe.
+
+        Args:
+            reason (str): Reason for the early probe, used for logging and instrumentation.
+        """
+        self.__probe_now_reason = reason
+        self.__probe_now_event.set()
+
+    def get_stats(self) -> dict:
+        """Returns the current policy and statistics about the probes.
+
+        Returns:
+            dict: Containing the configuration, current mode and interval and the number of probes.
+        """
+        return {
+            "mode": self.__mode,
+            "currentInterval": self.__interval,
+            "baseInterval": self.base_interval,
+            "startingInterval": self.starting_interval,
+            "maxInterval": self.max_interval,
+            "probes": self.__probes_count,
+            "earlyProbes": self.__early_probes_count,
+            "lastEarlyProbeReason": self.__probe_now_reason,
+        }
@@ -0,0 +1,137 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import bisect
+import time
+
+from matlab_proxy.util import mwi
+
+logger = mwi.logger.get()
+
+
+class Histogram:
+    """Counts observed values into buckets with fixed upper bounds."""
+
+    def __init__(self, upper_bounds):
+        """Parameterized constructor for the Histogram class.
+
+        Args:
+            upper_bounds (List[float]): Inclusive upper bounds of the buckets in increasing order.
+                Values greater than the last bound are counted in an additional overflow bucket.
+        """
+        self.upper_bounds = list(upper_bounds)
+        self.__counts = [0] * (len(self.upper_bounds) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+
+    def observe(self, value) -> None:
+        """Counts a value into its bucket.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.__counts[bisect.bisect_left(self.upper_bounds, value)] += 1
+        self.__count += 1
+        self.__sum += value
+
+    def get_stats(self) -> dict:
+        """Returns the counts of the buckets.
+
+        Returns:
+            dict: Containing the upper bounds of the buckets, the count of values in each of them
+                (the last one being the overflow bucket) and the count and sum of all values.
+        """
+        return {
+            "bucketUpperBounds": self.upper_bounds,
+            "bucketCounts": list(self.__counts),
+            "count": self.__count,
+            "sum": round(self.__sum, 3),
+        }
+
+
+class StartupReport:
+    """Records the time at which each phase of starting MATLAB was completed, relative to the start.
+
+    The latest start is reported phase by phase, and the times of all starts are counted into
+    a histogram per phase, so that regressions in the startup time can be spotted across
+    MATLAB releases and hosts.
+    """
+
+    # Phases in the order in which they are usually completed.
+    PHASES = (
+        "xvfbReady",
+        "windowManagerReady",
+        "environmentPrepared",
+        "processSpawned",
+        "readyFileSeen",
+        "embeddedConnectorPinged",
+        "busyStatusAvailable",
+    )
+
+    # MATLAB is ready for use once its Embedded Connector responds.
+    READY_PHASE = "embeddedConnectorPinged"
+
+    def __init__(self, histogram_upper_bounds):
+        """Parameterized constructor for the StartupReport class.
+
+        Args:
+            histogram_upper_bounds (List[float]): Upper bounds in seconds of the buckets of the histograms.
+        """
+        self.__start_time = None
+        self.__phases = {}
+        self.__starts_count = 0
+        self.__histograms = {
+            phase: Histogram(histogram_upper_bounds) for phase in self.PHASES
+        }
+
+    def start(self) -> None:
+        """Starts recording a new start of MATLAB, discarding the phases of the previous one."""
+        self.__start_time = time.monotonic()
+        self.__phases = {}
+        self.__starts_count += 1
+
+    def mark(self, phase) -> None:
+        """Records that a phase of the current start of MATLAB was completed.
+
+        Only the first completion of a phase after start() is recorded. Phases completed before
+        start() is called, for eg: when the state of MATLAB is probed after it has exited, are ignored.
+
+        Args:
+            phase (str): One of PHASES.
+        """
+        if self.__start_time is None or phase in self.__phases:
+            return
+
+        elapsed = round(time.monotonic() - self.__start_time, 3)
+        self.__phases[phase] = elapsed
+        self.__histograms[phase].observe(elapsed)
+        logger.debug(
+            f"MATLAB startup phase '{phase}' completed after {elapsed} seconds"
+        )
+
+        if phase == self.READY_PHASE:
+            logger.info(
+                f"MATLAB is ready for use. Time in seconds at which each phase of starting MATLAB was completed: {self.__phases}"
+            )
+
+    def get_report(self) -> dict:
+        """Returns the phases completed by the latest start of MATLAB.
+
+        Returns:
+            dict: Time in seconds at which each phase was completed, relative to the start, by phase.
+        """
+        return dict(self.__phases)
+
+    def get_stats(self) -> dict:
+        """Returns the report of the latest start of MATLAB and the histograms of all starts.
+
+        Returns:
+            dict: Containing the number of starts, the report of the latest start and a histogram per phase.
+        """
+        return {
+            "starts": self.__starts_count,
+            "latest": self.get_report(),
+            "histograms": {
+                phase: histogram.get_stats()
+                for phase, histogram in self.__histograms.items()
+            },
+        }
@@ -0,0 +1,830 @@
+# Copyright 2025 The MathWorks, Inc.
+
+"""
+This file contains the functions used to relay messages between the two sides of a proxied websocket.
+"""
+
+import asyncio
+import inspect
+import itertools
+import os
+import struct
+import time
+import zlib
+
+import aiohttp
+from aiohttp import web
+
+from matlab_proxy.constants import (
+    WS_COMPRESSION_SAMPLE_BYTES,
+    WS_MESSAGE_SIZE_HISTOGRAM_BUCKETS_BYTES,
+    WS_RELAY_FRAGMENT_SIZE,
+    WS_RELAY_LATENCY_HISTOGRAM_BUCKETS_SECONDS,
+    WS_RELAY_QUEUE_MAX_MESSAGES,
+)
+from matlab_proxy.util import mwi
+from matlab_proxy.util.mwi.exceptions import WebSocketMemoryBudgetError
+from matlab_proxy.util.startup_report import Histogram
+
+try:
+    from aiohttp._websocket.helpers import websocket_mask as _websocket_mask
+except ImportError:  # pragma: no cover
+    _websocket_mask = None
+
+logger = mwi.logger.get()
+
+# Messages larger than this are compressed in a thread, same as aiohttp does.
+WEBSOCKET_MAX_SYNC_COMPRESS_SIZE = 16 * 1024
+
+# Trailing bytes of a flushed deflate block, which are not sent as part of a compressed message.
+_DEFLATE_TRAILING_BYTES = b"\x00\x00\xff\xff"
+
+# TEXT messages are relayed without being decoded and encoded again when the installed version of
+# aiohttp can receive them as bytes (decode_text) and send a frame of a given type (send_frame).
+IS_RAW_TEXT_RELAY_SUPPORTED = "decode_text" in inspect.signature(
+    web.WebSocketResponse
+).parameters and hasattr(web.WebSocketResponse, "send_frame")
+
+
+def get_websocket_options() -> dict:
+    """Returns the options to create both sides of a relayed websocket with.
+
+    These are to be passed to web.WebSocketResponse() and ws_connect(), in addition to the size
+    and compression options of each side.
+
+    Returns:
+        dict: Options which make the websockets receive TEXT messages as bytes, when supported.
+    """
+    return {"decode_text": False} if IS_RAW_TEXT_RELAY_SUPPORTED else {}
+
+
+def create_compressor(ws, policy):
+    """Creates a WebSocketCompressor to send the messages relayed to ws with.
+
+    Args:
+        ws (web.WebSocketResponse): Prepared websocket, to which messages are relayed.
+        policy (None | dict): Policy returned by validators.validate_ws_compression_policy().
+
+    Returns:
+        None | WebSocketCompressor: None if messages are to be sent by aiohttp as is, because no policy
+            is supplied, compression was not negotiated with the peer or aiohttp does not support it.
+    """
+    if not policy or not ws.compress:
+        return None
+
+    if not hasattr(getattr(ws, "_writer", None), "_write_websocket_frame"):
+        logger.debug(
+            "Installed version of aiohttp does not support a websocket compression policy."
+        )
+        return None
+
+    return WebSocketCompressor(ws, **policy)
+
+
+class WebSocketCompressor:
+    """Compresses the messages sent on a websocket according to a policy.
+
+    aiohttp compresses every message sent on a websocket for which permessage-deflate was negotiated,
+    at a fixed compression level. Instead, the messages sent through this class are:
+        1) Sent uncompressed if they are smaller than min_size, or if compression is disabled.
+        2) Compressed with the given zlib level and window size otherwise.
+
+    Compression is disabled when level is 0, or once compressing sample_bytes bytes in a row saves less
+    than min_savings percent of their size. As permessage-deflate allows each message to be sent either
+    compressed or not, the peer does not need to be notified of either.
+    """
+
+    def __init__(
+        self,
+        ws,
+        min_size,
+        level,
+        window_bits,
+        min_savings=0,
+        sample_bytes=WS_COMPRESSION_SAMPLE_BYTES,
+    ):
+        """Parameterized constructor for the WebSocketCompressor class.
+
+        Args:
+            ws (web.WebSocketResponse): Prepared websocket for which permessage-deflate was negotiated.
+            min_size (int): Size in bytes below which messages are sent uncompressed.
+            level (int): zlib compression level from 0 to 9. 0 disables compression.
+            window_bits (int): Base 2 logarithm of the size of the compression window.
+                Capped to the size negotiated with the peer.
+            min_savings (int, optional): Percentage of bytes which compression must save for it to continue.
+                Defaults to 0, which never disables compression.
+            sample_bytes (int, optional): Number of bytes over which the savings are measured.
+        """
+        self.min_size = min_size
+        self.level = level
+        self.window_bits = min(window_bits, ws.compress)
+        self.min_savings = min_savings
+        self.sample_bytes = sample_bytes
+
+        # Uses the writer of aiohttp directly, as its public API compresses either all or none of the messages.
+        self.__writer = ws._writer
+        self.__lock = asyncio.Lock()
+        self.__compressobj = zlib.compressobj(
+            max(level, 1), zlib.DEFLATED, -self.window_bits
+        )
+        # Each message is to be decompressible on its own, when the peer does not keep the context across messages.
+        self.__flush_mode = (
+            zlib.Z_FULL_FLUSH if self.__writer.notakeover else zlib.Z_SYNC_FLUSH
+        )
+
+        self.__disabled_reason = None if level > 0 else "level"
+        self.__sample_size = 0
+        self.__sample_compressed_size = 0
+
+        self.__compressed_messages = 0
+        self.__uncompressed_messages = 0
+        self.__bytes_before_compression = 0
+        self.__bytes_after_compression = 0
+        self.__uncompressed_bytes = 0
+        self.__compression_cpu_seconds = 0.0
+
+    @property
+    def is_enabled(self) -> bool:
+        """Whether messages of at least min_size bytes are compressed."""
+        return self.__disabled_reason is None
+
+    async def send(self, data, opcode) -> None:
+        """Sends a message, compressing it if the policy allows.
+
+        Args:
+            data (bytes): Payload of the message.
+            opcode (aiohttp.WSMsgType): Type of the message, one of TEXT/BINARY.
+        """
+        # The message is compressed and written in a task of its own, which is shielded from the cancellation
+        # of the caller. If the state of the compressor were advanced without the message being sent, or
+        # the message were only partially written, the peer would no longer be able to read the websocket.
+        await asyncio.shield(asyncio.ensure_future(self.__send(data, opcode)))
+
+    async def __send(self, data, opcode):
+        async with self.__lock:
+            if not self.is_enabled or len(data) < self.min_size:
+                await _write_message(self.__writer, data, opcode, 0)
+                self.__uncompressed_messages += 1
+                self.__uncompressed_bytes += len(data)
+
+            else:
+                if len(data) > WEBSOCKET_MAX_SYNC_COMPRESS_SIZE:
+                    # Large messages are compressed in a thread, so as to not block the event loop.
+                    loop = asyncio.get_running_loop()
+                    payload, cpu_seconds = await loop.run_in_executor(
+                        None, self.__compress, data
+                    )
+                else:
+                    payload, cpu_seconds = self.__compress(data)
+
+                # RSV1 (0x40) marks the message as compressed
+                self.__update_compression_stats(len(data), len(payload), cpu_seconds)
+                await _write_message(self.__writer, payload, opcode, 0x40)
+
+    def get_stats(self) -> dict:
+        """Returns the policy and statistics about the messages sent.
+
+        Returns:
+            dict: Containing the number of messages and bytes sent with and without compression,
+                the bytes saved by compression and the CPU time spent on it.
+        """
+        return {
+            "enabled": self.is_enabled,
+            "disabledReason": self.__disabled_reason,
+            "minSize": self.min_size,
+            "level": self.level,
+            "windowBits": self.window_bits,
+            "minSavings": self.min_savings,
+            "compressedMessages": self.__compressed_messages,
+            "uncompressedMessages": self.__uncompressed_messages,
+            "bytesBeforeCompression": self.__bytes_before_compression,
+            "bytesAfterCompression": self.__bytes_after_compression,
+            "bytesSaved": self.__bytes_before_compression
+            - self.__bytes_after_compression,
+            "uncompressedBytes": self.__uncompressed_bytes,
+            "compressionCpuSeconds": self.__compression_cpu_seconds,
+        }
+
+    def __compress(self, data):
+        start = time.thread_time()
+        payload = self.__compressobj.compress(data) + self.__compressobj.flush(
+            self.__flush_mode
+        )
+        # The trailing bytes of the flush are implied by permessage-deflate, see RFC 7692 section 7.2.1
+        if payload.endswith(_DEFLATE_TRAILING_BYTES):
+            payload = payload[: -len(_DEFLATE_TRAILING_BYTES)]
+        return payload, time.thread_time() - start
+
+    def __update_compression_stats(self, size, compressed_size, cpu_seconds):
+        self.__compressed_messages += 1
+        self.__bytes_before_compression += size
+        self.__bytes_after_compression += compressed_size
+        self.__compression_cpu_seconds += cpu_seconds
+
+        if not self.min_savings:
+            return
+
+        self.__sample_size += size
+        self.__sample_compressed_size += compressed_size
+        if self.__sample_size >= self.sample_bytes:
+            savings = 100 * (1 - self.__sample_compressed_size / self.__sample_size)
+            if savings < self.min_savings:
+                logger.debug(
+                    f"Disabling compression of websocket messages, as it saved only {savings:.1f}% of the last {self.__sample_size} bytes"
+                )
+                self.__disabled_reason = "savings"
+            self.__sample_size = self.__sample_compressed_size = 0
+
+
+class MemoryBudget:
+    """Limits the memory held by websocket messages which are waiting to be relayed.
+
+    A budget is acquired for each message when it is received, and released once it has been sent.
+    When a budget is used up, acquiring it waits for other messages to be sent, which stops the
+    websocket it is acquired for from being read. A budget can have a parent, for eg: the budget of
+    a connection can be a part of the budget of the process, in which case both are acquired.
+    """
+
+    def __init__(self, limit, parent=None, wait_timeout=None):
+        """Parameterized constructor for the MemoryBudget class.
+
+        Args:
+            limit (int): Max number of bytes held by the messages at any time.
+            parent (MemoryBudget, optional): Budget which is also acquired for each message. Defaults to None.
+            wait_timeout (float, optional): Max time in seconds to wait for the budget to free up.
+                Defaults to None, which waits indefinitely.
+        """
+        self.limit = limit
+        self.parent = parent
+        self.wait_timeout = wait_timeout
+
+        self.__used = 0
+        self.__released_event = asyncio.Event()
+
+        self.__peak = 0
+        self.__waits_count = 0
+        self.__refusals_count = 0
+
+    @property
+    def used(self) -> int:
+        """Number of bytes currently acquired from this budget."""
+        return self.__used
+
+    async def acquire(self, size) -> None:
+        """Acquires size bytes from this budget and its parent, waiting for them to free up if required.
+
+        Args:
+            size (int): Number of bytes to acquire.
+
+        Raises:
+            WebSocketMemoryBudgetError: With close code MESSAGE_TOO_BIG when size is larger than the limit,
+                or TRY_AGAIN_LATER when the budget did not free up within wait_timeout seconds.
+        """
+        if size > self.limit:
+            self.__refusals_count += 1
+            raise WebSocketMemoryBudgetError(
+                aiohttp.WSCloseCode.MESSAGE_TOO_BIG,
+                f"Message of {size} bytes is larger than the memory budget of {self.limit} bytes",
+            )
+
+        if self.__used + size > self.limit:
+            self.__waits_count += 1
+            await self.__wait_for(size)
+
+        self.__used += size
+        self.__peak = max(self.__peak, self.__used)
+
+        if self.parent is not None:
+            try:
+                await self.parent.acquire(size)
+            except BaseException:
+                # The parent did not acquire the bytes, so they are only returned to this budget.
+                self.__used -= size
+                self.__released_event.set()
+                raise
+
+    def release(self, size) -> None:
+        """Releases size bytes to this budget and its parent.
+
+        Args:
+            size (int): Number of bytes to release, as previously acquired.
+        """
+        self.__used -= size
+        self.__released_event.set()
+
+        if self.parent is not None:
+            self.parent.release(size)
+
+    def get_stats(self) -> dict:
+        """Returns the limit and usage of the budget.
+
+        Returns:
+            dict: Containing the bytes used currently and at peak, and the number of times
+                acquiring the budget had to wait or was refused.
+        """
+        return {
+            "limit": self.limit,
+            "used": self.__used,
+            "peak": self.__peak,
+            "waits": self.__waits_count,
+            "refusals": self.__refusals_count,
+        }
+
+    async def __wait_for(self, size):
+        loop = asyncio.get_running_loop()
+        deadline = (
+            loop.time() + self.wait_timeout if self.wait_timeout is not None else None
+        )
+
+        while self.__used + size > self.limit:
+            timeout = deadline - loop.time() if deadline is not None else None
+            if timeout is not None and timeout <= 0:
+                self.__refusals_count += 1
+                raise WebSocketMemoryBudgetError(
+                    aiohttp.WSCloseCode.TRY_AGAIN_LATER,
+                    f"Memory budget of {self.limit} bytes was not freed up within {self.wait_timeout} seconds",
+                )
+
+            # asyncio.wait() is used instead of asyncio.wait_for(), so as to not swallow the cancellation of this task.
+            self.__released_event.clear()
+            waiter = asyncio.ensure_future(self.__released_event.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=timeout)
+            finally:
+                waiter.cancel()
+
+
+def _get_frame_header(first_byte, length, use_mask) -> bytes:
+    # See RFC 6455 section 5.2 for the layout of the header
+    mask_bit = 0x80 if use_mask else 0
+    if length < 126:
+        return struct.pack("!BB", first_byte, length | mask_bit)
+    if length < 65536:
+        return struct.pack("!BBH", first_byte, 126 | mask_bit, length)
+    return struct.pack("!BBQ", first_byte, 127 | mask_bit, length)
+
+
+def _can_write_fragments(writer) -> bool:
+    return all(
+        hasattr(writer, attr)
+        for attr in ("transport", "protocol", "use_mask", "_output_size")
+    ) and (not writer.use_mask or _websocket_mask is not None)
+
+
+async def _drain(writer, force=False) -> None:
+    # Same flow control as aiohttp applies after sending a message.
+    if force or writer._output_size > writer._limit:
+        writer._output_size = 0
+        if writer.protocol._paused:
+            await writer.protocol._drain_helper()
+
+
+async def _write_message(writer, payload, opcode, rsv) -> None:
+    """Writes a message with the writer of an aiohttp websocket, as fragments if it is large.
+
+    aiohttp writes each message as a single frame, which is buffered in full by the transport when
+    the peer does not read it fast enough. Messages larger than WS_RELAY_FRAGMENT_SIZE are instead
+    split into fragments (RFC 6455 section 5.4), waiting for the transport to drain after each one.
+
+    Args:
+        writer (aiohttp WebSocketWriter): Writer of the websocket to send the message on.
+        payload (bytes): Payload of the message, compressed if rsv has RSV1 set.
+        opcode (aiohttp.WSMsgType): Type of the message, one of TEXT/BINARY.
+        rsv (int): Reserved bits of the first frame of the message.
+    """
+    if len(payload) <= WS_RELAY_FRAGMENT_SIZE or not _can_write_fragments(writer):
+        writer._write_websocket_frame(payload, opcode, rsv)
+        await _drain(writer)
+        return
+
+    view = memoryview(payload)
+    for start in range(0, len(payload), WS_RELAY_FRAGMENT_SIZE):
+        fragment = view[start : start + WS_RELAY_FRAGMENT_SIZE]
+        is_last = start + WS_RELAY_FRAGMENT_SIZE >= len(payload)
+
+        # Only the first frame carries the type of the message and its reserved bits, the rest are continuation
+        # frames (opcode 0). Only the last frame has FIN (0x80) set.
+        first_byte = (0x80 if is_last else 0) | ((rsv | opcode) if start == 0 else 0)
+        header = _get_frame_header(first_byte, len(fragment), writer.use_mask)
+
+        if writer.transport is None or writer.transport.is_closing():
+            raise ConnectionResetError("Cannot write to closing transport")
+
+        # Frames are written in full before yielding to the event loop, so that control frames
+        # sent by aiohttp in the meantime, such as pongs, can only be interleaved between them.
+        if writer.use_mask:
+            mask = os.urandom(4)
+            fragment = bytearray(fragment)
+            _websocket_mask(mask, fragment)
+            header += mask
+        writer.transport.write(header)
+        writer.transport.write(fragment)
+        writer._output_size += len(header) + len(fragment)
+
+        await _drain(writer, force=True)
+
+
+async def _send_message(ws_to, mt, md, compressor) -> None:
+    if mt == aiohttp.WSMsgType.PING:
+        await ws_to.ping()
+    elif mt == aiohttp.WSMsgType.PONG:
+        await ws_to.pong()
+    elif compressor is not None:
+        await compressor.send(md.encode() if isinstance(md, str) else md, mt)
+    elif (
+        len(md) > WS_RELAY_FRAGMENT_SIZE
+        and not ws_to.compress
+        and _can_write_fragments(getattr(ws_to, "_writer", None))
+    ):
+        # Messages which aiohttp would compress as a whole are sent through it instead.
+        await _write_message(
+            ws_to._writer, md.encode() if isinstance(md, str) else md, mt, 0
+        )
+    elif mt == aiohttp.WSMsgType.TEXT:
+        if isinstance(md, str):
+            await ws_to.send_str(md)
+        else:
+            await ws_to.send_frame(md, aiohttp.WSMsgType.TEXT)
+    else:
+        await ws_to.send_bytes(md)
+
+
+async def _send_queued_messages(
+    queue, ws_to, compressor, memory_budget, metrics, errors
+):
+    # Sends the messages in the queue until cancelled. Once sending fails, the remaining
+    # messages are discarded, so that their budget is released and the reader is not blocked.
+    loop = asyncio.get_running_loop()
+    while True:
+        mt, md, size, received_at = await queue.get()
+        try:
+            if not errors:
+                await _send_message(ws_to, mt, md, compressor)
+                if metrics is not None and mt in (
+                    aiohttp.WSMsgType.TEXT,
+                    aiohttp.WSMsgType.BINARY,
+                ):
+                    metrics.observe(size, loop.time() - received_at)
+        except Exception as err:
+            errors.append(err)
+        finally:
+            if memory_budget is not None:
+                memory_budget.release(size)
+            queue.task_done()
+
+
+def _release_queued_messages(queue, memory_budget):
+    while not queue.empty():
+        _, _, size, _ = queue.get_nowait()
+        queue.task_done()
+        if memory_budget is not None:
+            memory_budget.release(size)
+
+
+async def relay_messages(
+    ws_from, ws_to, log=logger, compressor=None, memory_budget=None, metrics=None
+) -> None:
+    """Forwards the messages received on ws_from to ws_to, until ws_from is closed.
+
+    TEXT messages received as bytes are sent as they were received, instead of being decoded into
+    a str and encoded back. Compression of the payload, if negotiated, is still done by aiohttp
+    when the message is sent, as the frames are decompressed when they are received.
+
+    Messages are sent from a queue of at most WS_RELAY_QUEUE_MAX_MESSAGES messages, and ws_from is not
+    read while the queue is full or memory_budget is used up. Large messages are sent as fragments.
+
+    Args:
+        ws_from (web.WebSocketResponse | aiohttp.ClientWebSocketResponse): Websocket to receive messages from.
+        ws_to (web.WebSocketResponse | aiohttp.ClientWebSocketResponse): Websocket to send messages to.
+        log (logging.Logger, optional): Logger to log errors with. Defaults to the logger of matlab-proxy.
+        compressor (WebSocketCompressor, optional): Compressor of ws_to, to send TEXT and BINARY messages with.
+            Defaults to None, which sends them with the compression negotiated by aiohttp.
+        memory_budget (MemoryBudget, optional): Budget for the messages waiting to be sent. When a message cannot
+            be relayed within it, both websockets are closed with the close code of the error. Defaults to None.
+        metrics (RelayMetrics, optional): Metrics to record the TEXT and BINARY messages sent in. Defaults to None.
+
+    Raises:
+        ValueError: When an unexpected type of message is received.
+    """
+    queue = asyncio.Queue(maxsize=WS_RELAY_QUEUE_MAX_MESSAGES)
+    errors = []
+    sender = asyncio.create_task(
+        _send_queued_messages(queue, ws_to, compressor, memory_budget, metrics, errors)
+    )
+    loop = asyncio.get_running_loop()
+
+    try:
+        async for msg in ws_from:
+            received_at = loop.time()
+            mt = msg.type
+            md = msg.data
+
+            # When a websocket is closed by the MATLAB JSD, it sends out a few http requests to the Embedded Connector about the events
+            # that had occured (figureWindowClosed etc.)
+            # The Embedded Connector responds by sending a message of type 'Error' with close code as Abnormal closure.
+            # When this happens, matlab-proxy can safely exit out of the loop
+            # and close the websocket connection it has with the Embedded Connector (ws_client)
+            if (
+                mt == aiohttp.WSMsgType.ERROR
+                and ws_from.close_code == aiohttp.WSCloseCode.ABNORMAL_CLOSURE
+            ):
+                log.debug(
+                    "Src: %s, msg_type= %s, ws_src.close_code= %s",
+                    ws_from,
+                    mt,
+                    ws_from.close_code,
+                )
+                break
+
+            if mt in (
+                aiohttp.WSMsgType.TEXT,
+                aiohttp.WSMsgType.BINARY,
+                aiohttp.WSMsgType.PING,
+                aiohttp.WSMsgType.PONG,
+            ):
+                size = (
+                    len(md)
+                    if mt in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY)
+                    else 0
+                )
+                if memory_budget is not None:
+                    await memory_budget.acquire(size)
+                # Waits while the queue is full, which stops ws_from from being read.
+                await queue.put((mt, md, size, received_at))
+                if errors:
+                    break
+            elif ws_to.closed:
+                log.debug("Destination: %s closed", ws_to)
+                await ws_to.close(code=ws_to.close_code, message=msg.extra)
+            elif mt == aiohttp.WSMsgType.ERROR:
+                log.error(f"WebSocket error received: {msg}")
+                if "exceeds limit" in str(md):
+                    log.error(
+                        f"Message too large: {md}. Please refresh browser tab to reconnect."
+                    )
+                    await ws_to.close(
+                        code=aiohttp.WSCloseCode.MESSAGE_TOO_BIG,
+                        message=b"Message too large",
+                    )
+                break
+            else:
+                raise ValueError(f"Unexpected message type: {msg}")
+
+        # Messages received before ws_from was closed are still sent.
+        if not errors:
+            await queue.join()
+
+    except WebSocketMemoryBudgetError as err:
+        log.warning(f"Closing websocket connection: {err.message}")
+        for ws in (ws_from, ws_to):
+            await ws.close(code=err.close_code, message=err.message.encode("utf-8"))
+
+    finally:
+        sender.cancel()
+        _release_queued_messages(queue, memory_budget)
+
+    if errors:
+        raise errors[0]
+
+
+class RelayMetrics:
+    """Counts the messages relayed in one direction of a websocket connection."""
+
+    def __init__(self):
+        self.__messages_count = 0
+        self.__bytes_count = 0
+        self.__last_message_time = None
+        self.__message_sizes = Histogram(WS_MESSAGE_SIZE_HISTOGRAM_BUCKETS_BYTES)
+        self.__relay_latencies = Histogram(WS_RELAY_LATENCY_HISTOGRAM_BUCKETS_SECONDS)
+
+    @property
+    def last_message_time(self):
+        """Monotonic time at which the latest message was sent, or None if no message was sent."""
+        return self.__last_message_time
+
+    def observe(self, size, latency) -> None:
+        """Counts a message which was sent.
+
+        Args:
+            size (int): Size of the message in bytes.
+            latency (float): Time in seconds from the receipt of the message to it being sent.
+        """
+        self.__messages_count += 1
+        self.__bytes_count += size
+        self.__last_message_time = time.monotonic()
+        self.__message_sizes.observe(size)
+        self.__relay_latencies.observe(latency)
+
+    def get_stats(self) -> dict:
+        """Returns the number of messages and bytes relayed and the histograms of their sizes and latencies.
+
+        Returns:
+            dict: Containing the counts of messages and bytes and a histogram of each of their sizes and latencies.
+        """
+        return {
+            "messages": self.__messages_count,
+            "bytes": self.__bytes_count,
+            "messageSizes": self.__message_sizes.get_stats(),
+            "relayLatencySeconds": self.__relay_latencies.get_stats(),
+        }
+
+
+class RelayedWebSocket:
+    """A websocket connection from the browser which is relayed to a websocket of the backend server.
+
+    The messages of each direction are relayed by a task of their own. As soon as either task completes,
+    for eg: when either side closes its websocket, the other task is cancelled and both websockets are closed.
+    """
+
+    def __init__(self, connection_id, path, ws_server, ws_client):
+        """Parameterized constructor for the RelayedWebSocket class.
+
+        Args:
+            connection_id (int): Identifier of the connection in its registry.
+            path (str): Path of the websocket request.
+            ws_server (web.WebSocketResponse): Websocket with the browser.
+            ws_client (aiohttp.ClientWebSocketResponse): Websocket with the backend server.
+        """
+        self.connection_id = connection_id
+        self.path = path
+        self.ws_server = ws_server
+        self.ws_client = ws_client
+
+        self.from_browser = RelayMetrics()
+        self.to_browser = RelayMetrics()
+
+        self.__opened_at = time.monotonic()
+        self.__tasks = []
+        self.__close_future = None
+
+    async def relay(self, log=logger, compressor=None, memory_budget=None) -> None:
+        """Relays messages in both directions until either websocket is closed, then closes both of them.
+
+        Args:
+            log (logging.Logger, optional): Logger to log errors with. Defaults to the logger of matlab-proxy.
+            compressor (WebSocketCompressor, optional): Compressor of the websocket with the browser. Defaults to None.
+            memory_budget (MemoryBudget, optional): Budget for the messages waiting to be sent in either direction.
+                Defaults to None.
+        """
+        self.__tasks = [
+            asyncio.create_task(
+                relay_messages(
+                    self.ws_server,
+                    self.ws_client,
+                    log,
+                    memory_budget=memory_budget,
+                    metrics=self.from_browser,
+                )
+            ),
+            asyncio.create_task(
+                relay_messages(
+                    self.ws_client,
+                    self.ws_server,
+                    log,
+                    compressor=compressor,
+                    memory_budget=memory_budget,
+                    metrics=self.to_browser,
+                )
+            ),
+        ]
+
+        try:
+            done, _ = await asyncio.wait(
+                self.__tasks, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    log.debug(
+                        f"Stopped relaying websocket connection {self.connection_id} with error: {task.exception()}"
+                    )
+        finally:
+            await self.close()
+
+    async def close(self, code=aiohttp.WSCloseCode.OK, message=b"") -> None:
+        """Cancels the relay of both directions and closes both websockets.
+
+        Args:
+            code (int, optional): Close code for the websockets which are still open. Defaults to OK.
+            message (bytes, optional): Close reason for the websockets which are still open. Defaults to b"".
+        """
+        # Concurrent callers wait for the same close, instead of closing the websockets again.
+        if self.__close_future is None:
+            self.__close_future = asyncio.ensure_future(self.__close(code, message))
+        await asyncio.shield(self.__close_future)
+
+    def get_stats(self) -> dict:
+        """Returns the age of the connection and the metrics of the messages relayed in each direction.
+
+        Returns:
+            dict: Containing the identifier, path, age and idle time of the connection and the metrics of each direction.
+        """
+        now = time.monotonic()
+        last_activity = max(
+            [self.__opened_at]
+            + [
+                metrics.last_message_time
+                for metrics in (self.from_browser, self.to_browser)
+                if metrics.last_message_time is not None
+            ]
+        )
+        return {
+            "id": self.connection_id,
+            "path": self.path,
+            "ageSeconds": round(now - self.__opened_at, 3),
+            "idleSeconds": round(now - last_activity, 3),
+            "closing": self.__close_future is not None,
+            "fromBrowser": self.from_browser.get_stats(),
+            "toBrowser": self.to_browser.get_stats(),
+        }
+
+    async def __close(self, code, message):
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+
+        for ws in (self.ws_client, self.ws_server):
+            if not ws.closed:
+                try:
+                    await ws.close(code=code, message=message)
+                except Exception as err:
+                    logger.debug(
+                        f"Failed to close websocket of connection {self.connection_id} with error: {err}"
+                    )
+
+
+class WebSocketRegistry:
+    """Keeps track of the websocket connections which are being relayed."""
+
+    def __init__(self):
+        self.__connections = {}
+        self.__connection_ids = itertools.count(1)
+        self.__opened_count = 0
+        self.__closed_count = 0
+
+    @property
+    def connections(self) -> list:
+        """Connections which are currently being relayed."""
+        return list(self.__connections.values())
+
+    async def relay(
+        self,
+        path,
+        ws_server,
+        ws_client,
+        log=logger,
+        compressor=None,
+        memory_budget=None,
+    ) -> RelayedWebSocket:
+        """Registers a connection and relays it until either of its websockets is closed.
+
+        Args:
+            path (str): Path of the websocket request.
+            ws_server (web.WebSocketResponse): Websocket with the browser.
+            ws_client (aiohttp.ClientWebSocketResponse): Websocket with the backend server.
+            log (logging.Logger, optional): Logger to log errors with. Defaults to the logger of matlab-proxy.
+            compressor (WebSocketCompressor, optional): Compressor of the websocket with the browser. Defaults to None.
+            memory_budget (MemoryBudget, optional): Budget for the messages waiting to be sent in either direction.
+                Defaults to None.
+
+        Returns:
+            RelayedWebSocket: The connection, which is no longer registered.
+        """
+        connection = RelayedWebSocket(
+            next(self.__connection_ids), path, ws_server, ws_client
+        )
+        self.__connections[connection.connection_id] = connection
+        self.__opened_count += 1
+
+        try:
+            await connection.relay(log, compressor, memory_budget)
+        finally:
+            del self.__connections[connection.connection_id]
+            self.__closed_count += 1
+
+        return connection
+
+    async def close_all(
+        self, code=aiohttp.WSCloseCode.GOING_AWAY, message=b"Server is shutting down"
+    ) -> None:
+        """Closes all the connections which are being relayed.
+
+        Args:
+            code (int, optional): Close code for the websockets. Defaults to GOING_AWAY.
+            message (bytes, optional): Close reason for the websockets.
+        """
+        await asyncio.gather(
+            *(connection.close(code, message) for connection in self.connections)
+        )
+
+    def get_stats(self) -> dict:
+        """Returns the number of connections and the statistics of each connection which is being relayed.
+
+        Returns:
+            dict: Containing the number of connections opened, closed and currently being relayed, and their statistics.
+        """
+        return {
+            "active": len(self.__connections),
+            "opened": self.__opened_count,
+            "closed": self.__closed_count,
+            "connections": [connection.get_stats() for connection in self.connections],
+        }
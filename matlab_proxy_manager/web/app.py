@@ -13,6 +13,7 @@ from aiohttp import ClientSession, client_exceptions, web
 
 import matlab_proxy.util.mwi.environment_variables as mwi_env
 import matlab_proxy.util.system as mwi_sys
+import matlab_proxy.util.websocket_relay as websocket_relay
 import matlab_proxy_manager.lib.api as mpm_lib
 import matlab_proxy.constants as mp_constants
 from matlab_proxy_manager.utils import constants, helpers, logger
@@ -48,6 +49,15 @@ def init_app() -> web.Application:
     # Tracks whether default matlab proxy is started or not
     app["has_default_matlab_proxy_started"] = False
 
+    # Websocket connections which are being relayed to the matlab proxy servers.
+    app["ws_registry"] = websocket_relay.WebSocketRegistry()
+
+    # Memory budget shared by the websocket messages waiting to be relayed on all connections.
+    app["ws_memory_budget"] = websocket_relay.MemoryBudget(
+        mp_constants.DEFAULT_WS_MEMORY_BUDGET,
+        wait_timeout=mp_constants.WS_MEMORY_BUDGET_WAIT_SECONDS,
+    )
+
     # Create and get the proxy manager data directory
     try:
         data_dir = helpers.create_and_get_proxy_manager_data_dir()
@@ -85,6 +95,10 @@ def init_app() -> web.Application:
             except asyncio.CancelledError:
                 pass
 
+    async def close_websocket_connections(app):
+        """Close the relayed websocket connections, as the server waits for their handlers to return."""
+        await app["ws_registry"].close_all()
+
     async def cleanup_watcher(app):
         """Cleanup the filesystem watcher."""
         if "observer" in app:
@@ -100,6 +114,7 @@ def init_app() -> web.Application:
 
     app.on_startup.append(start_idle_monitor)
     app.on_startup.append(create_client_session)
+    app.on_shutdown.append(close_websocket_connections)
     app.on_cleanup.append(helpers.delete_dangling_servers)
     app.on_cleanup.append(cleanup_client_session)
     app.on_cleanup.append(cleanup_monitor)
@@ -343,8 +358,18 @@ async def _forward_websocket_request(
     Returns:
         web.WebSocketResponse: The response from the backend server
     """
+    # Messages waiting to be relayed in either direction share the memory budget of the connection,
+    # which is also the size of the largest message accepted from either side.
+    ws_memory_budget = websocket_relay.MemoryBudget(
+        mp_constants.DEFAULT_WS_MEMORY_BUDGET_PER_CONNECTION,
+        parent=req.app["ws_memory_budget"],
+        wait_timeout=mp_constants.WS_MEMORY_BUDGET_WAIT_SECONDS,
+    )
+
     ws_server = web.WebSocketResponse(
-        max_msg_size=mp_constants.MAX_WEBSOCKET_MESSAGE_SIZE_IN_MB, compress=True
+        max_msg_size=ws_memory_budget.limit,
+        compress=True,
+        **websocket_relay.get_websocket_options(),
     )
     await ws_server.prepare(req)
 
@@ -356,62 +381,19 @@ async def _forward_websocket_request(
         try:
             async with client_session.ws_connect(
                 proxy_url,
-                max_msg_size=mp_constants.MAX_WEBSOCKET_MESSAGE_SIZE_IN_MB,  # max websocket message size from MATLAB to browser
+                max_msg_size=ws_memory_budget.limit,  # max websocket message size from MATLAB to browser
                 compress=12,  # enable websocket messages compression
+                **websocket_relay.get_websocket_options(),
             ) as ws_client:
 
-                async def ws_forward(ws_src, ws_dest):
-                    async for msg in ws_src:
-                        msg_type = msg.type
-                        msg_data = msg.data
-
-                        # When a websocket is closed by the MATLAB JSD, it sends out a few
-                        # http requests to the Embedded Connector about the events that had occurred
-                        # (figureWindowClosed etc.) The Embedded Connector responds by sending a
-                        # message of type 'Error' with close code as Abnormal closure. When this
-                        # happens, matlab-proxy can safely exit out of the loop and close the
-                        # websocket connection it has with the Embedded Connector (ws_client)
-                        if (
-                            msg_type == aiohttp.WSMsgType.ERROR
-                            and ws_src.close_code
-                            == aiohttp.WSCloseCode.ABNORMAL_CLOSURE
-                        ):
-                            log.debug(
-                                "Src: %s, msg_type= %s, ws_src.close_code= %s",
-                                ws_src,
-                                msg_type,
-                                ws_src.close_code,
-                            )
-                            break
-                        if msg_type == aiohttp.WSMsgType.TEXT:
-                            await ws_dest.send_str(msg_data)
-                        elif msg_type == aiohttp.WSMsgType.BINARY:
-                            await ws_dest.send_bytes(msg_data)
-                        elif msg_type == aiohttp.WSMsgType.PING:
-                            await ws_dest.ping()
-                        elif msg_type == aiohttp.WSMsgType.PONG:
-                            await ws_dest.pong()
-                        elif ws_dest.closed:
-                            log.debug("Destination: %s closed", ws_dest)
-                            await ws_dest.close(
-                                code=ws_dest.close_code, message=msg.extra
-                            )
-                        elif msg_type == aiohttp.WSMsgType.ERROR:
-                            log.error(f"WebSocket error received: {msg}")
-                            if "exceeds limit" in str(msg.data):
-                                log.error(
-                                    f"Message too large: {msg.data}. Please refresh browser tab to reconnect."
-                                )
-                            break
-                        else:
-                            raise ValueError(f"Unexpected message type: {msg}")
-
-                await asyncio.wait(
-                    [
-                        asyncio.create_task(ws_forward(ws_server, ws_client)),
-                        asyncio.create_task(ws_forward(ws_client, ws_server)),
-                    ],
-                    return_when=asyncio.FIRST_COMPLETED,
+                # Relays messages in both directions until either side closes its websocket, after which
+                # the relay of the other direction is cancelled and both websockets are closed.
+                await req.app["ws_registry"].relay(
+                    req.path,
+                    ws_server,
+                    ws_client,
+                    log,
+                    memory_budget=ws_memory_budget,
                 )
 
                 return ws_server
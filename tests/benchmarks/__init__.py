@@ -0,0 +1 @@
+# Copyright 2025 The MathWorks, Inc.
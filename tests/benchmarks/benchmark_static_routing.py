@@ -0,0 +1,93 @@
+# Copyright 2025 The MathWorks, Inc.
+
+"""Benchmarks the cost of resolving routes in matlab-proxy's router for the two
+ways of registering static files:
+
+1) "per-file": One aiohttp GET route per static file (the previous layout).
+2) "single": A single StaticFilesResource which looks up the static route table.
+
+For each layout, the time taken to resolve a request for a static file and a
+request proxied to the MATLAB Embedded Connector (catch-all route) is reported.
+
+Usage:
+    python -m tests.benchmarks.benchmark_static_routing [--files 50 500 2000] [--iterations 20000]
+"""
+
+import argparse
+import asyncio
+import time
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+
+from matlab_proxy import app as mwi_app
+
+BASE_URL = "/matlab"
+PROXIED_PATH = f"{BASE_URL}/messageservice/json/secure"
+
+
+async def _handler(req):
+    return web.Response()
+
+
+def _make_route_table(num_files):
+    table = {}
+    for i in range(num_files):
+        table[f"{BASE_URL}/static/js/chunk-{i}.0123abcd.js"] = {}
+    table[f"{BASE_URL}/index.html"] = {}
+    return table
+
+
+def _make_app(layout, route_table):
+    app = web.Application()
+
+    if layout == "per-file":
+        for path in route_table.keys():
+            app.router.add_route("GET", path, _handler)
+    else:
+        app.router.register_resource(
+            mwi_app.StaticFilesResource(BASE_URL, route_table, _handler)
+        )
+
+    app.router.add_route("GET", f"{BASE_URL}/get_status", _handler)
+    app.router.add_route("*", f"{BASE_URL}/{{proxyPath:.*}}", _handler)
+    app.router.freeze()
+    return app
+
+
+async def _time_resolve(router, path, iterations):
+    req = make_mocked_request("GET", path)
+
+    # Warm up
+    for _ in range(iterations // 10):
+        await router.resolve(req)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await router.resolve(req)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main(files, iterations):
+    print(f"aiohttp {aiohttp.__version__}, {iterations} iterations per measurement")
+    print(f"{'files':>8} {'layout':>10} {'static (us)':>12} {'proxied (us)':>13}")
+
+    for num_files in files:
+        route_table = _make_route_table(num_files)
+        static_path = f"{BASE_URL}/static/js/chunk-{num_files // 2}.0123abcd.js"
+
+        for layout in ("per-file", "single"):
+            router = _make_app(layout, route_table).router
+            static_us = await _time_resolve(router, static_path, iterations)
+            proxied_us = await _time_resolve(router, PROXIED_PATH, iterations)
+            print(f"{num_files:>8} {layout:>10} {static_us:>12.2f} {proxied_us:>13.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.files, args.iterations))
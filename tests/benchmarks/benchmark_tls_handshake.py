@@ -0,0 +1,148 @@
+# Copyright 2025 The MathWorks, Inc.
+
+"""Benchmarks the cost of the self-signed certificates used when SSL is enabled without a certificate, for each type of key:
+
+1) Time taken to generate the certificate, which used to happen on every start of matlab-proxy,
+   vs. the time taken to load and validate the certificate generated by a previous start.
+2) Time taken by a full TLS handshake vs. a handshake which resumes the session of a previous
+   connection, against a server using the SSL context created by matlab-proxy.
+
+Usage:
+    python -m tests.benchmarks.benchmark_tls_handshake [--key-types rsa ecdsa] [--iterations 200] [--tls-version 1.2 1.3]
+"""
+
+import argparse
+import os
+import socket
+import ssl
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from matlab_proxy import settings
+from matlab_proxy.constants import SSL_KEY_TYPES
+from matlab_proxy.util import mwi
+from matlab_proxy.util.mwi import environment_variables as mwi_env
+
+TLS_VERSIONS = {"1.2": ssl.TLSVersion.TLSv1_2, "1.3": ssl.TLSVersion.TLSv1_3}
+
+
+def _time_cert_setup(certs_dir, key_type, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        settings.generate_new_self_signed_certs(certs_dir, key_type)
+    generate_ms = (time.perf_counter() - start) / iterations * 1e3
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        assert settings.get_reusable_self_signed_certs(certs_dir, key_type)[0]
+    reuse_ms = (time.perf_counter() - start) / iterations * 1e3
+
+    return generate_ms, reuse_ms
+
+
+def _serve(server_socket, server_context):
+    """Accepts connections and sends a byte on each, so that the client receives the session tickets of TLS 1.3."""
+    while True:
+        try:
+            conn, _ = server_socket.accept()
+        except OSError:
+            return
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            with server_context.wrap_socket(conn, server_side=True) as tls_conn:
+                tls_conn.sendall(b"x")
+                tls_conn.recv(1)
+        except (OSError, ssl.SSLError):
+            pass
+
+
+def _time_handshakes(port, client_context, iterations, resume):
+    session = None
+    elapsed = 0.0
+    resumed_count = 0
+
+    for i in range(iterations + 1):
+        with socket.create_connection(("127.0.0.1", port)) as sock:
+            # Otherwise, delayed acknowledgements dominate the time taken by the handshakes.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            start = time.perf_counter()
+            with client_context.wrap_socket(
+                sock, server_hostname="localhost", session=session if resume else None
+            ) as tls_sock:
+                tls_sock.recv(1)
+                handshake_time = time.perf_counter() - start
+                resumed = tls_sock.session_reused
+                session = tls_sock.session
+                tls_sock.sendall(b"x")
+
+        # The first connection always performs a full handshake
+        if i > 0:
+            elapsed += handshake_time
+            resumed_count += resumed
+
+    return elapsed / iterations * 1e3, resumed_count
+
+
+def main(key_types, iterations, tls_versions):
+    print(
+        f"{'key':>6} {'TLS':>4} {'generate cert (ms)':>19} {'reuse cert (ms)':>16} {'full handshake (ms)':>20} {'resumed handshake (ms)':>23} {'resumed':>8}"
+    )
+
+    for key_type in key_types:
+        with tempfile.TemporaryDirectory() as config_dir:
+            certs_dir = Path(config_dir) / "certs"
+            certs_dir.mkdir()
+            generate_ms, reuse_ms = _time_cert_setup(
+                certs_dir, key_type, max(iterations // 20, 1)
+            )
+
+            os.environ[mwi_env.get_env_name_enable_ssl()] = "True"
+            os.environ[mwi_env.get_env_name_ssl_key_type()] = key_type
+            server_context = settings._validate_ssl_files_and_get_ssl_context(
+                Path(config_dir)
+            )
+
+            server_socket = socket.create_server(("127.0.0.1", 0))
+            port = server_socket.getsockname()[1]
+            threading.Thread(
+                target=_serve, args=(server_socket, server_context), daemon=True
+            ).start()
+
+            for tls_version in tls_versions:
+                client_context = ssl.create_default_context()
+                client_context.check_hostname = False
+                client_context.verify_mode = ssl.CERT_NONE
+                client_context.minimum_version = client_context.maximum_version = (
+                    TLS_VERSIONS[tls_version]
+                )
+
+                full_ms, _ = _time_handshakes(
+                    port, client_context, iterations, resume=False
+                )
+                resumed_ms, resumed_count = _time_handshakes(
+                    port, client_context, iterations, resume=True
+                )
+                print(
+                    f"{key_type:>6} {tls_version:>4} {generate_ms:>19.2f} {reuse_ms:>16.2f} {full_ms:>20.2f} {resumed_ms:>23.2f} {resumed_count:>4}/{iterations}"
+                )
+
+            server_socket.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--key-types", nargs="+", choices=SSL_KEY_TYPES, default=list(SSL_KEY_TYPES)
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--tls-version", nargs="+", choices=list(TLS_VERSIONS), default=["1.2", "1.3"]
+    )
+    args = parser.parse_args()
+
+    # Only the cost of the handshakes is of interest, not that of logging.
+    mwi.logger.get().setLevel("INFO")
+
+    main(args.key_types, args.iterations, args.tls_version)
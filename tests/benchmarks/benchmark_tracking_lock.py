@@ -0,0 +1,92 @@
+# Copyright 2025 The MathWorks, Inc.
+
+"""Benchmarks the cost of acquiring, validating and releasing a TrackingLock, which
+happens whenever the state of MATLAB or the IDLE timer is updated, for the two ways of
+tracking the owner of the lock:
+
+1) "stack": The owner is looked up with inspect.stack() on acquire and on every
+   validation (the previous implementation).
+2) "task": The owner is the current asyncio task. The name of the function which
+   acquired the lock is only read from its frame when debug logs are enabled.
+
+Each measurement is taken at a few depths of the call stack, as the cost of
+inspect.stack() grows with the number of frames above the caller.
+
+Usage:
+    python -m tests.benchmarks.benchmark_tracking_lock [--depths 5 25 50] [--iterations 20000]
+"""
+
+import argparse
+import asyncio
+import inspect
+import time
+
+from matlab_proxy import util
+
+
+class _StackTrackingLock(util.TrackingLock):
+    """TrackingLock which identifies its owner with inspect.stack(), as it used to."""
+
+    async def acquire(self):
+        await self._lock.acquire()
+        self._acquired_by = inspect.stack()[1][3]
+
+    def validate_lock_for_caller(self, caller):
+        return self._lock.locked() and self._acquired_by == caller
+
+
+def _set_state_using_stack(lock):
+    caller = inspect.stack()[1][3]
+    return lock.validate_lock_for_caller(caller)
+
+
+def _set_state_using_task(lock):
+    return lock.validate_lock_for_current_task()
+
+
+async def _update_state(lock, set_state):
+    await lock.acquire()
+    assert set_state(lock)
+    await lock.release()
+
+
+async def _time_at_depth(depth, lock, set_state, iterations):
+    if depth > 0:
+        return await _time_at_depth(depth - 1, lock, set_state, iterations)
+
+    # Warm up
+    for _ in range(iterations // 10):
+        await _update_state(lock, set_state)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await _update_state(lock, set_state)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main(depths, iterations):
+    print(f"{iterations} iterations per measurement")
+    print(f"{'depth':>6} {'stack (us)':>11} {'task (us)':>10} {'speedup':>8}")
+
+    for depth in depths:
+        stack_us = await _time_at_depth(
+            depth, _StackTrackingLock("benchmark"), _set_state_using_stack, iterations
+        )
+        task_us = await _time_at_depth(
+            depth, util.TrackingLock("benchmark"), _set_state_using_task, iterations
+        )
+        print(
+            f"{depth:>6} {stack_us:>11.2f} {task_us:>10.2f} {stack_us / task_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depths", type=int, nargs="+", default=[5, 25, 50])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    # Only the cost of tracking the owner is of interest, not that of logging it.
+    util.mwi.logger.get().setLevel("INFO")
+
+    asyncio.run(main(args.depths, args.iterations))
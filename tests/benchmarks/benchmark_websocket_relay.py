@@ -0,0 +1,157 @@
+# Copyright 2025 The MathWorks, Inc.
+
+"""Benchmarks the throughput of the websocket relay of matlab-proxy, against the echo endpoint of the fake
+Embedded Connector in devel.py.
+
+A client sends messages through a relay, which forwards them to the fake Embedded Connector and forwards
+its echoes back, the same way as matlab_view() does. Each configuration is measured with:
+
+1) decoded: TEXT messages are decoded into str on receipt and encoded back when sent.
+2) raw: TEXT messages are forwarded as the bytes they were received as, when supported by aiohttp.
+3) policy: As raw, but messages to the fake Embedded Connector are not compressed and messages to the client
+   are compressed according to the default compression policy.
+
+Usage:
+    python -m tests.benchmarks.benchmark_websocket_relay [--messages 2000] [--sizes 128 4096 65536] [--no-compress]
+"""
+
+import argparse
+import asyncio
+import time
+
+import aiohttp
+from aiohttp import web
+
+from matlab_proxy import constants, devel
+from matlab_proxy.util import websocket_relay
+from matlab_proxy.util.mwi import validators
+
+WS_PATH = "/http_ws_request.html/"
+MODES = ("decoded", "raw", "policy")
+
+
+async def _start_site(app):
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _make_relay_app(ec_url, mode, compress):
+    ws_options = websocket_relay.get_websocket_options() if mode != "decoded" else {}
+    policy = (
+        validators.validate_ws_compression_policy(
+            level=str(constants.DEFAULT_WS_COMPRESSION_LEVEL)
+        )
+        if mode == "policy"
+        else None
+    )
+
+    async def relay(req):
+        ws_server = web.WebSocketResponse(
+            max_msg_size=constants.MAX_WEBSOCKET_MESSAGE_SIZE_IN_MB,
+            compress=compress,
+            **ws_options,
+        )
+        await ws_server.prepare(req)
+        compressor = websocket_relay.create_compressor(ws_server, policy)
+
+        async with req.app["session"].ws_connect(
+            f"{ec_url}{WS_PATH}",
+            max_msg_size=constants.MAX_WEBSOCKET_MESSAGE_SIZE_IN_MB,
+            compress=12 if compress and policy is None else 0,
+            **ws_options,
+        ) as ws_client:
+            tasks = [
+                asyncio.create_task(
+                    websocket_relay.relay_messages(ws_server, ws_client)
+                ),
+                asyncio.create_task(
+                    websocket_relay.relay_messages(
+                        ws_client, ws_server, compressor=compressor
+                    )
+                ),
+            ]
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                task.cancel()
+
+        return ws_server
+
+    async def on_startup(app):
+        app["session"] = aiohttp.ClientSession()
+
+    async def on_cleanup(app):
+        await app["session"].close()
+
+    app = web.Application()
+    app.router.add_get(WS_PATH, relay)
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+
+async def _time_relay(relay_url, messages, size, compress):
+    # Text which compresses about as well as the JSON exchanged with the MATLAB desktop.
+    payload = ('{"type":"update","value":' + "0123456789" * size)[:size]
+
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(
+            f"{relay_url}{WS_PATH}", max_msg_size=0, compress=15 if compress else 0
+        ) as ws:
+            # Greeting from the fake Embedded Connector
+            await ws.receive()
+
+            start, cpu_start = time.perf_counter(), time.process_time()
+            for _ in range(messages):
+                await ws.send_str(payload)
+                msg = await ws.receive()
+                assert msg.type == aiohttp.WSMsgType.TEXT and len(msg.data) == size
+            elapsed = time.perf_counter() - start
+            cpu_elapsed = time.process_time() - cpu_start
+
+    return messages / elapsed, cpu_elapsed / messages * 1e6
+
+
+async def main(messages, sizes, compress):
+    ec_app = web.Application()
+    ec_app.router.add_get(WS_PATH, devel.web_socket_handler)
+    ec_runner, ec_url = await _start_site(ec_app)
+
+    print(f"Raw TEXT relay supported: {websocket_relay.IS_RAW_TEXT_RELAY_SUPPORTED}")
+    print(f"Compression: {'on' if compress else 'off'}")
+    print(
+        f"{'size (B)':>9} {'mode':>8} {'round trips/s':>14} {'CPU/round trip (us)':>20}"
+    )
+
+    try:
+        for mode in MODES:
+            relay_runner, relay_url = await _start_site(
+                _make_relay_app(ec_url, mode, compress)
+            )
+            try:
+                for size in sizes:
+                    rate, cpu_us = await _time_relay(
+                        relay_url, messages, size, compress
+                    )
+                    print(f"{size:>9} {mode:>8} {rate:>14.0f} {cpu_us:>20.1f}")
+            finally:
+                await relay_runner.cleanup()
+    finally:
+        await ec_runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[128, 4096, 65536])
+    parser.add_argument(
+        "--no-compress",
+        dest="compress",
+        action="store_false",
+        help="Disable compression on both sides of the relay",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.messages, args.sizes, args.compress))
@@ -0,0 +1,94 @@
+# Copyright 2025 The MathWorks, Inc.
+
+"""Benchmarks the memory used by Xvfb for each of the profiles in constants.XVFB_PROFILES.
+
+For each profile, Xvfb is started with the same command as the one used by matlab-proxy,
+the screen is painted over with xwd (when available) so that the pages of the framebuffer
+are touched, and the resident set size (VmRSS) and peak resident set size (VmHWM) of the
+Xvfb process are read from /proc/<pid>/status.
+
+Requires Xvfb to be on the system PATH. Linux only.
+
+Usage:
+    python -m tests.benchmarks.benchmark_xvfb_memory [--profiles default lean] [--settle 1.0]
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+
+from matlab_proxy import constants, settings
+from matlab_proxy.util import mw, mwi
+
+
+def _read_memory_kib(pid):
+    memory = {}
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "VmHWM"):
+                memory[key] = int(value.split()[0])
+    return memory
+
+
+async def _measure(profile, settle):
+    xvfb_options = mwi.validators.validate_xvfb_options(profile)
+    xvfb_cmd, dpipe = settings.create_xvfb_cmd(xvfb_options)
+    xvfb, display_port = await mw.create_xvfb_process(xvfb_cmd, dpipe, {})
+
+    try:
+        await asyncio.sleep(settle)
+        idle = _read_memory_kib(xvfb.pid)
+
+        # Dumping the root window reads the whole framebuffer, like a full screen MATLAB window would.
+        if shutil.which("xwd"):
+            xwd = await asyncio.create_subprocess_exec(
+                "xwd",
+                "-root",
+                "-silent",
+                env={**os.environ, "DISPLAY": f":{display_port}"},
+                stdout=asyncio.subprocess.DEVNULL,
+            )
+            await xwd.wait()
+        touched = _read_memory_kib(xvfb.pid)
+
+        return xvfb_options[2], idle["VmRSS"], touched["VmRSS"], touched["VmHWM"]
+
+    finally:
+        xvfb.terminate()
+        await xvfb.wait()
+
+
+async def main(profiles, settle):
+    print(
+        f"{'profile':>8} {'screen':>14} {'idle RSS (MiB)':>15} {'RSS (MiB)':>10} {'peak RSS (MiB)':>15}"
+    )
+
+    for profile in profiles:
+        screen, idle_rss, rss, peak_rss = await _measure(profile, settle)
+        print(
+            f"{profile:>8} {screen:>14} {idle_rss / 1024:>15.1f} {rss / 1024:>10.1f} {peak_rss / 1024:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        choices=list(constants.XVFB_PROFILES),
+        default=list(constants.XVFB_PROFILES),
+    )
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=1.0,
+        help="Time in seconds to wait after Xvfb has started, before its memory is measured.",
+    )
+    args = parser.parse_args()
+
+    if not shutil.which("Xvfb"):
+        parser.error("Xvfb was not found on the system PATH.")
+
+    asyncio.run(main(args.profiles, args.settle))
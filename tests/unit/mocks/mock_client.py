@@ -22,6 +22,8 @@ class MockWebSocketClient:
         self.headers = headers
         self.messages = messages or []
         self._message_iter = iter(self.messages)
+        self.closed = False
+        self.close_code = None
 
     def __aiter__(self):
         return self
@@ -35,6 +37,10 @@ class MockWebSocketClient:
     async def text(self):
         return self._text
 
+    async def close(self, code=None, message=b""):
+        self.closed = True
+        self.close_code = code
+
     async def __aexit__(self, *args) -> None:
         pass
 
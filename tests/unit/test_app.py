@@ -2,6 +2,7 @@
 
 import asyncio
 import datetime
+import gzip
 import json
 import platform
 import random
@@ -17,7 +18,9 @@ from multidict import CIMultiDict
 import tests.unit.test_constants as test_constants
 from matlab_proxy import app, util
 from matlab_proxy.app import matlab_view
+from matlab_proxy.util import websocket_relay
 from matlab_proxy.util.mwi import environment_variables as mwi_env
+from matlab_proxy.util.mwi.embedded_connector import ConnectionPool
 from matlab_proxy.util.mwi.exceptions import EntitlementError, MatlabInstallError
 from tests.unit.fixtures.fixture_auth import (
     patch_authenticate_access_decorator,  # noqa: F401
@@ -252,6 +255,7 @@ async def async_configure_and_start(app_instance):
             f, cookie_name="matlab-proxy-session-" + uniqify_session_cookie
         ),
     )
+    app_instance["auth_verdict_cache"] = app.token_auth.AuthVerdictCache()
 
     # Setup runner
     runner = app.web.AppRunner(app_instance, access_log=web_logger)
@@ -319,7 +323,10 @@ def mock_request(mocker):
             "matlab_protocol": "http",
             "mwapikey": "test-key",
             "cookie_jar": None,
+            "mwi_ws_memory_budgets": {"per_connection": 1000, "total": 2000},
         },
+        "ws_memory_budget": websocket_relay.MemoryBudget(2000),
+        "ws_registry": websocket_relay.WebSocketRegistry(),
     }
     req.headers = CIMultiDict()
     req.cookies = {}
@@ -383,6 +390,36 @@ async def test_get_status_route(test_server):
     assert resp.status == HTTPStatus.OK
 
 
+async def test_status_stream_route(test_server):
+    """Test to check that endpoint : "/status_stream" sends the status on connection and whenever it changes.
+
+    Args:
+        test_server (aiohttp_client): A aiohttp_client server for sending GET request.
+    """
+    state = test_server.server.app["state"]
+
+    resp = await test_server.get("/status_stream")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Type"] == "text/event-stream"
+
+    async def read_event():
+        line = await asyncio.wait_for(resp.content.readline(), timeout=5)
+        # Skip keep-alive comments
+        while not line.startswith(b"data: "):
+            line = await asyncio.wait_for(resp.content.readline(), timeout=5)
+        return json.loads(line[len(b"data: ") :])
+
+    initial_status = await read_event()
+    assert "matlab" in initial_status
+    assert "licensing" in initial_status
+
+    state.warnings = ["mock warning"]
+    updated_status = await read_event()
+    assert updated_status["warnings"] == ["mock warning"]
+
+    resp.close()
+
+
 async def test_clear_client_id_route(test_server):
     """Test to check endpoint: "/clear_client_id"
 
@@ -426,6 +463,48 @@ async def test_get_env_config(test_server):
     assert set(expected_json_structure.keys()) == set(text.keys())
 
 
+async def test_get_env_config_does_not_modify_settings(test_server):
+    """Test to check that endpoint : "/get_env_config" does not modify the env_config in settings
+    and supports conditional requests.
+
+    Args:
+        test_server (aiohttp_client): A aiohttp_client server for sending GET request.
+    """
+    env_config = test_server.server.app["settings"]["env_config"]
+    env_config_before = dict(env_config)
+
+    resp = await test_server.get("/get_env_config")
+    assert resp.status == HTTPStatus.OK
+    assert env_config == env_config_before
+
+    resp = await test_server.get(
+        "/get_env_config", headers={"If-None-Match": resp.headers["ETag"]}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+
+async def test_get_status_conditional_request(test_server):
+    """Test to check that endpoint : "/get_status" responds with 304 until the status changes.
+
+    Args:
+        test_server (aiohttp_client): A aiohttp_client server for sending GET request.
+    """
+    state = test_server.server.app["state"]
+
+    resp = await test_server.get("/get_status")
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    resp = await test_server.get("/get_status", headers={"If-None-Match": etag})
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    state.warnings = ["mock warning"]
+    resp = await test_server.get("/get_status", headers={"If-None-Match": etag})
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+    assert (await resp.json())["warnings"] == ["mock warning"]
+
+
 async def test_start_matlab_route(test_server):
     """Test to check endpoint : "/start_matlab"
 
@@ -591,6 +670,215 @@ async def test_matlab_proxy_http_get_request(proxy_payload, test_server):
             raise ConnectionError
 
 
+async def test_matlab_proxy_http_requests_reuse_pooled_connections(
+    proxy_payload, test_server
+):
+    """Test to check that HTTP requests proxied to the fake matlab server are sent through
+    the connection pool to the Embedded Connector, and that the pool statistics are available.
+
+    Args:
+        proxy_payload (Dict): Pytest fixture which returns a Dict representing payload for the HTTP request
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    await __check_for_matlab_status(test_server, "up", sleep_interval=2)
+
+    # Act
+    for _ in range(3):
+        resp = await test_server.get(
+            "/http_get_request.html", data=json.dumps(proxy_payload)
+        )
+        assert resp.status == HTTPStatus.OK
+
+    resp = await test_server.get("/get_embedded_connector_pool_stats")
+    stats = (await resp.json())["embeddedConnectorPool"]
+
+    # Assert
+    assert stats["httpRequests"] >= 3
+    assert stats["activeConnections"] == 0
+    assert stats["idleConnections"] >= 1
+
+
+async def test_get_embedded_connector_pool_stats_after_stop_matlab(test_server):
+    """Test to check that the connection pool is torn down when MATLAB is stopped.
+
+    Args:
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    await __check_for_matlab_status(test_server, "up", sleep_interval=2)
+
+    # Act
+    resp = await test_server.delete("/stop_matlab")
+    assert resp.status == HTTPStatus.OK
+
+    resp = await test_server.get("/get_embedded_connector_pool_stats")
+
+    # Assert
+    assert resp.status == HTTPStatus.OK
+    assert (await resp.json())["embeddedConnectorPool"] is None
+    assert test_server.server.app["state"].embedded_connector_health_client is None
+
+
+async def test_get_matlab_state_polling_stats(test_server):
+    """Test to check endpoint : "/get_matlab_state_polling_stats"
+
+    Args:
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    await __check_for_matlab_status(test_server, "up", sleep_interval=2)
+
+    # Act
+    resp = await test_server.get("/get_matlab_state_polling_stats")
+    stats = (await resp.json())["matlabStatePolling"]
+
+    # Assert
+    assert resp.status == HTTPStatus.OK
+    assert stats["probes"] >= 1
+    assert stats["mode"] in ("base", "starting", "backoff")
+
+
+async def test_get_background_task_stats(test_server):
+    """Test to check endpoint : "/get_background_task_stats"
+
+    Args:
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    await __check_for_matlab_status(test_server, "up", sleep_interval=2)
+
+    # Act
+    resp = await test_server.get("/get_background_task_stats")
+    stats = (await resp.json())["backgroundTasks"]
+
+    # Assert
+    assert resp.status == HTTPStatus.OK
+    assert stats["wakeups"] >= 1
+    assert stats["jobs"]["update_matlab_state"]["runs"] >= 1
+
+
+async def test_get_websocket_connections(test_server):
+    """Test to check endpoint : "/get_websocket_connections" while a websocket is relayed and after it is closed
+
+    Args:
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    await wait_for_matlab_to_be_up(test_server, test_constants.ONE_SECOND_DELAY)
+
+    # Act
+    async with test_server.ws_connect("/http_ws_request.html/") as ws:
+        await ws.receive_str()
+        await ws.send_str("hello")
+        await ws.receive_str()
+
+        resp = await test_server.get("/get_websocket_connections")
+        open_stats = (await resp.json())["websocketConnections"]
+
+    # The connection is unregistered once the server has closed both of its websockets
+    for _ in range(50):
+        resp = await test_server.get("/get_websocket_connections")
+        closed_stats = (await resp.json())["websocketConnections"]
+        if not closed_stats["active"]:
+            break
+        await asyncio.sleep(0.1)
+
+    # Assert
+    assert resp.status == HTTPStatus.OK
+    assert open_stats["active"] == 1
+    connection = open_stats["connections"][0]
+    assert connection["path"] == "/http_ws_request.html/"
+    assert connection["fromBrowser"]["messages"] == 1
+    assert connection["fromBrowser"]["bytes"] == len("hello")
+    assert connection["toBrowser"]["messages"] == 2
+    assert connection["toBrowser"]["relayLatencySeconds"]["count"] == 2
+    assert closed_stats["active"] == 0
+    assert closed_stats["closed"] == closed_stats["opened"]
+
+
+async def test_get_matlab_startup_report(test_server):
+    """Test to check endpoint : "/get_matlab_startup_report"
+
+    Args:
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    await __check_for_matlab_status(test_server, "up", sleep_interval=2)
+
+    # Act
+    resp = await test_server.get("/get_matlab_startup_report")
+    report = (await resp.json())["matlabStartup"]
+
+    # Assert
+    assert resp.status == HTTPStatus.OK
+    assert report["starts"] >= 1
+    assert (
+        report["latest"]["processSpawned"]
+        <= report["latest"]["readyFileSeen"]
+        <= report["latest"]["embeddedConnectorPinged"]
+    )
+    assert report["histograms"]["embeddedConnectorPinged"]["count"] >= 1
+    assert "total" in report["phaseDurations"]
+
+
+# Pytest construct to set the environment variable `MWI_BASE_URL` to a non-empty value
+# before initializing the test_server.
+@pytest.mark.parametrize(
+    "test_server",
+    [
+        [(mwi_env.get_env_name_base_url(), "/matlab")],
+    ],
+    indirect=True,
+)
+async def test_matlab_state_checked_under_base_url(test_server):
+    """Test to check that the health of the Embedded Connector is checked under the base_url,
+    at which MATLAB serves the Embedded Connector.
+
+    Args:
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    count = 0
+
+    # Act
+    while True:
+        resp = await test_server.get("/matlab/get_status")
+        assert resp.status == HTTPStatus.OK
+        resp_json = json.loads(await resp.text())
+        if resp_json["matlab"]["status"] == "up":
+            break
+        count += 1
+        await asyncio.sleep(2)
+        if count > test_constants.FIVE_MAX_TRIES:
+            raise ConnectionError
+
+    # Assert
+    state = test_server.server.app["state"]
+    assert state.embedded_connector_health_client.pool.get_stats()["httpRequests"] >= 1
+
+
+async def test_matlab_state_checked_directly_with_embedded_connector(test_server):
+    """Test to check that the health of the Embedded Connector is checked directly,
+    without sending requests to matlab-proxy's own server.
+
+    Args:
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    await __check_for_matlab_status(test_server, "up", sleep_interval=2)
+    state = test_server.server.app["state"]
+
+    # Act
+    health_client_stats = state.embedded_connector_health_client.pool.get_stats()
+    pool_stats = state.embedded_connector_pool.get_stats()
+
+    # Assert
+    assert health_client_stats["httpRequests"] >= 1
+    assert health_client_stats["limitPerHost"] == 1
+    assert pool_stats["httpRequests"] == 0
+
+
 async def test_matlab_proxy_http_put_request(proxy_payload, test_server):
     """Test to check if test_server proxies a HTTP request to fake matlab server and returns
     the response back
@@ -624,6 +912,73 @@ async def test_matlab_proxy_http_put_request(proxy_payload, test_server):
             raise ConnectionError
 
 
+async def test_matlab_proxy_http_streamed_request_body(test_server):
+    """Test to check if a request body sent with chunked transfer encoding is streamed
+    to the fake matlab server and its response is streamed back.
+
+    Args:
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    await __check_for_matlab_status(test_server, "up", sleep_interval=2)
+    chunks = [b"a" * 65536, b"b" * 65536, b"c" * 10]
+
+    async def body_generator():
+        for chunk in chunks:
+            yield chunk
+
+    # Act
+    resp = await test_server.put("/http_put_request.html", data=body_generator())
+
+    # Assert
+    assert resp.status == HTTPStatus.OK
+    assert (await resp.read()) == b"".join(chunks)
+
+
+async def test_matlab_proxy_http_request_too_large(mocker, test_server):
+    """Test to check that requests whose body exceeds the max request size are rejected
+    without being proxied to the fake matlab server.
+
+    Args:
+        mocker : Built in pytest fixture
+        test_server (aiohttp_client): Test server to send HTTP requests.
+    """
+    # Arrange
+    await __check_for_matlab_status(test_server, "up", sleep_interval=2)
+    mocker.patch("matlab_proxy.app.constants.MAX_HTTP_REQUEST_SIZE", 10)
+
+    # Act
+    resp = await test_server.put("/http_put_request.html", data=b"a" * 11)
+
+    # Assert
+    assert resp.status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+
+@pytest.mark.parametrize(
+    "method, path, is_transform_required",
+    [
+        ("POST", "/messageservice/json/secure", True),
+        ("GET", "/messageservice/json/secure", False),
+        ("POST", "/messageservice/json/state", False),
+        ("PUT", "/http_put_request.html", False),
+    ],
+    ids=[
+        "POST to secure endpoint",
+        "GET to secure endpoint",
+        "POST to state endpoint",
+        "PUT to other endpoint",
+    ],
+)
+def test_is_body_transform_required(mocker, method, path, is_transform_required):
+    """Test to check that only requests to the secure messageservice endpoint are buffered for rewriting"""
+    # Arrange
+    req = mocker.MagicMock(method=method)
+    req.rel_url.path = path
+
+    # Act & Assert
+    assert app._is_body_transform_required(req) == is_transform_required
+
+
 async def test_matlab_proxy_http_delete_request(proxy_payload, test_server):
     """Test to check if test_server proxies a HTTP request to fake matlab server and returns
     the response back
@@ -767,6 +1122,9 @@ async def test_matlab_view_websocket_success(
     mock_request.headers = headers
     mock_request.method = "GET"
     mock_request.path_qs = "/test"
+    mock_request.app["state"].embedded_connector_pool = ConnectionPool(
+        base_url="http://127.0.0.1:8000"
+    )
 
     # Mock WebSocket setup
     mock_ws_server = mocker.MagicMock(spec=WebSocketResponse)
@@ -789,6 +1147,14 @@ async def test_matlab_view_websocket_success(
     assert mock_ws_server.send_bytes.call_count == 1
     assert mock_ws_server.ping.call_count == 1
     assert mock_ws_server.pong.call_count == 1
+    assert (
+        mock_request.app["state"].embedded_connector_pool.get_stats()[
+            "websocketConnections"
+        ]
+        == 1
+    )
+
+    await mock_request.app["state"].embedded_connector_pool.close()
 
 
 async def test_set_licensing_info_put_mhlm(
@@ -1374,3 +1740,140 @@ async def test_cookie_jar_web_socket(proxy_payload, test_server):
         ]
         # Assert
         assert actual_custom_cookie == expected_custom_cookie
+
+
+async def test_matlab_view_relays_websocket_messages(test_server):
+    """Test to check that messages are relayed both ways between the browser and the Embedded Connector
+
+    Args:
+        test_server (aiohttp_client): A aiohttp_client server to open the websocket with.
+    """
+    # Arrange
+    await wait_for_matlab_to_be_up(test_server, test_constants.ONE_SECOND_DELAY)
+
+    # Act
+    # Browsers offer to compress messages, with a window of 2^15 bytes
+    async with test_server.ws_connect("/http_ws_request.html/", compress=15) as ws:
+        greeting = await ws.receive_str()
+        await ws.send_str('{"messages": "text"}')
+        text_echo = await ws.receive_str()
+        await ws.send_bytes(b"\x00binary")
+        binary_echo = await ws.receive_bytes()
+        # Large enough to be compressed on its way to the browser
+        await ws.send_str("matlab " * 1000)
+        large_echo = await ws.receive_str()
+
+    # Assert
+    assert greeting == "Hello world"
+    assert text_echo == '{"messages": "text"}'
+    assert binary_echo == b"\x00binary"
+    assert large_echo == "matlab " * 1000
+
+
+def test_make_static_variants_compresses_text_files():
+    """Test to check that large text based static files are precompressed with gzip and have distinct ETags"""
+    # Arrange
+    body = b"console.log('hello world');" * 100
+
+    # Act
+    variants = app._make_static_variants(body, "text/javascript")
+
+    # Assert
+    assert variants["identity"]["body"] == body
+    assert gzip.decompress(variants["gzip"]["body"]) == body
+    assert variants["identity"]["etag"] != variants["gzip"]["etag"]
+
+
+@pytest.mark.parametrize(
+    "body, content_type",
+    [
+        (b"console.log('hello world');", "text/javascript"),
+        (bytes(range(256)) * 100, "image/png"),
+    ],
+    ids=["Small text file", "Binary file"],
+)
+def test_make_static_variants_skips_compression(body, content_type):
+    """Test to check that small or binary static files are only served as is"""
+    # Act
+    variants = app._make_static_variants(body, content_type)
+
+    # Assert
+    assert list(variants.keys()) == ["identity"]
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected_encoding",
+    [
+        (None, "identity"),
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0, deflate", "identity"),
+        ("*", "gzip"),
+        ("deflate", "identity"),
+    ],
+    ids=[
+        "No Accept-Encoding header",
+        "gzip accepted",
+        "gzip explicitly not acceptable",
+        "Wildcard",
+        "No supported encoding",
+    ],
+)
+def test_select_static_encoding(accept_encoding, expected_encoding):
+    """Test to check the encoding of a static file chosen based on the Accept-Encoding header"""
+    # Arrange
+    variants = {"identity": {}, "gzip": {}}
+
+    # Act & Assert
+    assert app._select_static_encoding(accept_encoding, variants) == expected_encoding
+
+
+async def test_static_files_resource_resolve():
+    """Test to check that the StaticFilesResource only matches GET requests for files in the static route table"""
+    from aiohttp.test_utils import make_mocked_request
+
+    # Arrange
+    route_table = {"/matlab/index.html": {}, "/matlab/static/js/index.js": {}}
+    resource = app.StaticFilesResource("/matlab", route_table, app.static_get)
+
+    # Act
+    match_info, allowed = await resource.resolve(
+        make_mocked_request("GET", "/matlab/static/js/index.js")
+    )
+    no_match_info, not_found_allowed = await resource.resolve(
+        make_mocked_request("GET", "/matlab/messageservice/json/state")
+    )
+    post_match_info, post_allowed = await resource.resolve(
+        make_mocked_request("POST", "/matlab/index.html")
+    )
+
+    # Assert
+    assert match_info.handler is app.static_get
+    assert allowed == {"GET"}
+    assert no_match_info is None and not_found_allowed == set()
+    assert post_match_info is None and post_allowed == {"GET"}
+    assert str(resource.url_for(filename="index.html")) == "/matlab/index.html"
+
+
+async def test_static_files_resource_add_prefix():
+    """Test to check that the StaticFilesResource serves its files under the prefix of a parent application"""
+    from aiohttp.test_utils import make_mocked_request
+
+    # Arrange
+    route_table = {"/matlab/index.html": {}}
+    resource = app.StaticFilesResource("/matlab", route_table, app.static_get)
+
+    # Act
+    resource.add_prefix("/parent")
+    match_info, _ = await resource.resolve(
+        make_mocked_request("GET", "/parent/matlab/index.html")
+    )
+    no_match_info, _ = await resource.resolve(
+        make_mocked_request("GET", "/matlab/index.html")
+    )
+
+    # Assert
+    assert route_table == {"/parent/matlab/index.html": {}}
+    assert match_info.handler is app.static_get
+    assert no_match_info is None
+    assert resource.canonical == "/parent/matlab/"
+    assert str(resource.url_for(filename="index.html")) == "/parent/matlab/index.html"
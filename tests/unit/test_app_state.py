@@ -5,6 +5,7 @@ import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 
 import pytest
@@ -17,6 +18,7 @@ from matlab_proxy.util.mwi.exceptions import (
     LicensingError,
     MatlabError,
     MatlabInstallError,
+    NetworkLicensingError,
 )
 from matlab_proxy.constants import (
     CONNECTOR_SECUREPORT_FILENAME,
@@ -613,6 +615,329 @@ async def test_start_matlab_without_xvfb(app_state_fixture, mocker):
     assert app_state_fixture.processes["matlab"] is mock_matlab
 
 
+@pytest.mark.parametrize("platform", ["linux"])
+async def test_start_matlab_fetches_access_token_while_starting_xvfb(
+    mocker_os_patching_fixture, app_state_fixture
+):
+    """Test to check that the access token for online licensing is fetched concurrently with starting Xvfb,
+    and that the time taken by each phase of starting MATLAB is recorded.
+
+    Args:
+        mocker_os_patching_fixture (mocker): Custom pytest fixture for mocking
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    # Arrange
+    mocker = mocker_os_patching_fixture
+    delay = 0.5
+    app_state_fixture.settings["is_windowmanager_available"] = False
+    app_state_fixture.settings["mwa_api_endpoint"] = "https://mwa.example.com"
+    app_state_fixture.licensing = {
+        "type": "mhlm",
+        "identity_token": "abc",
+        "source_id": "def",
+        "entitlement_id": "123",
+    }
+
+    async def start_xvfb(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return Mock_xvfb(None, 1)
+
+    async def fetch_access_token(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return {"token": "mock-token"}
+
+    mocker.patch.object(
+        AppState, "_AppState__start_xvfb_process", side_effect=start_xvfb
+    )
+    mocker.patch(
+        "matlab_proxy.app_state.mw.fetch_access_token", side_effect=fetch_access_token
+    )
+    start_matlab_process = mocker.patch.object(
+        AppState, "_AppState__start_matlab_process", return_value=Mock_matlab(None, 1)
+    )
+    mocker.patch.object(
+        AppState, "_AppState__matlab_stderr_reader_posix", return_value=None
+    )
+    mocker.patch.object(
+        AppState, "_AppState__track_embedded_connector_state", return_value=None
+    )
+    mocker.patch.object(AppState, "_AppState__update_matlab_port", return_value=None)
+
+    # Act
+    await app_state_fixture.start_matlab()
+
+    # Assert
+    timings = app_state_fixture.matlab_startup_timings
+    assert timings["xvfb"] >= delay
+    assert timings["licensing"] >= delay
+    assert timings["total"] < 2 * delay
+    assert start_matlab_process.call_args.args[0]["MLM_WEB_USER_CRED"] == "mock-token"
+    assert not app_state_fixture.matlab_state_updater_lock.locked()
+
+
+async def test_restart_matlab_reuses_access_token(mocker, app_state_fixture):
+    """Test to check that the access token for online licensing is fetched only once across starts of MATLAB
+
+    Args:
+        mocker : Built in pytest fixture
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    # Arrange
+    app_state_fixture.settings["mwa_api_endpoint"] = "https://login.mathworks.com"
+    app_state_fixture.licensing = {
+        "type": "mhlm",
+        "identity_token": "abc",
+        "source_id": "def",
+        "entitlement_id": "123",
+    }
+    fetch_access_token = mocker.patch(
+        "matlab_proxy.app_state.mw.fetch_access_token",
+        return_value={"token": "mock-token", "expiry": None},
+    )
+
+    # Act
+    licensing_envs = [
+        await app_state_fixture._AppState__get_licensing_env_for_matlab()
+        for _ in range(2)
+    ]
+
+    # Assert
+    assert [env["MLM_WEB_USER_CRED"] for env in licensing_envs] == ["mock-token"] * 2
+    fetch_access_token.assert_called_once()
+
+
+class Mock_display_process:
+    """Represents a mocked Xvfb or window manager process, which can be terminated"""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.returncode = None
+
+    def terminate(self):
+        self.returncode = -15
+
+    async def wait(self):
+        return self.returncode
+
+
+@pytest.mark.parametrize("platform", ["linux"])
+async def test_restart_matlab_reuses_display(
+    mocker_os_patching_fixture, app_state_fixture
+):
+    """Test to check that the Xvfb and window manager processes are reused when MATLAB is restarted,
+    are started again only if they have exited, and are terminated when MATLAB is stopped.
+
+    Args:
+        mocker_os_patching_fixture (mocker): Custom pytest fixture for mocking
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    # Arrange
+    mocker = mocker_os_patching_fixture
+    xvfb_processes = [Mock_display_process(1), Mock_display_process(2)]
+    window_manager_processes = [Mock_display_process(3), Mock_display_process(4)]
+
+    start_xvfb = mocker.patch.object(
+        AppState, "_AppState__start_xvfb_process", side_effect=xvfb_processes
+    )
+    start_window_manager = mocker.patch.object(
+        AppState,
+        "_AppState__start_window_manager",
+        side_effect=window_manager_processes,
+    )
+    # MATLAB has already exited when it is stopped, so that it does not have to be terminated.
+    mocker.patch.object(
+        AppState, "_AppState__start_matlab_process", return_value=Mock_matlab(0, 5)
+    )
+    mocker.patch.object(
+        AppState, "_AppState__matlab_stderr_reader_posix", return_value=None
+    )
+    mocker.patch.object(
+        AppState, "_AppState__track_embedded_connector_state", return_value=None
+    )
+    mocker.patch.object(AppState, "_AppState__update_matlab_port", return_value=None)
+
+    # Act & Assert
+    await app_state_fixture.start_matlab()
+    await app_state_fixture.start_matlab(restart_matlab=True)
+
+    assert start_xvfb.call_count == 1
+    assert start_window_manager.call_count == 1
+    assert "xvfb" not in app_state_fixture.matlab_startup_timings
+
+    # Only the window manager which exited is started again
+    window_manager_processes[0].returncode = 1
+    await app_state_fixture.start_matlab(restart_matlab=True)
+
+    assert start_xvfb.call_count == 1
+    assert start_window_manager.call_count == 2
+    assert app_state_fixture.processes["window_manager"] is window_manager_processes[1]
+
+    await app_state_fixture.stop_matlab()
+
+    assert xvfb_processes[0].returncode is not None
+    assert window_manager_processes[1].returncode is not None
+    assert app_state_fixture.processes["xvfb"] is None
+    assert app_state_fixture.processes["window_manager"] is None
+
+
+async def test_start_window_manager_discards_output(mocker, app_state_fixture):
+    """Test to check that the output of the window manager is discarded, as nothing reads it.
+
+    Args:
+        mocker (mocker): Built in pytest fixture which can be used to mock functions.
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    # Arrange
+    create_subprocess_exec = mocker.patch(
+        "matlab_proxy.app_state.asyncio.create_subprocess_exec",
+        new_callable=mocker.AsyncMock,
+    )
+
+    # Act
+    await app_state_fixture._AppState__start_window_manager(display=":1")
+
+    # Assert
+    create_subprocess_exec.assert_awaited_once()
+    assert (
+        create_subprocess_exec.await_args.kwargs["stderr"] == asyncio.subprocess.DEVNULL
+    )
+
+
+@pytest.mark.parametrize("platform", ["linux"])
+async def test_start_matlab_when_xvfb_fails_to_start(
+    mocker_os_patching_fixture, app_state_fixture
+):
+    """Test to check that MATLAB is not started and the startup is torn down when Xvfb fails to start
+
+    Args:
+        mocker_os_patching_fixture (mocker): Custom pytest fixture for mocking
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    # Arrange
+    mocker = mocker_os_patching_fixture
+    mocker.patch.object(AppState, "_AppState__start_xvfb_process", return_value=None)
+    start_matlab_process = mocker.patch.object(
+        AppState, "_AppState__start_matlab_process"
+    )
+
+    # Act
+    await app_state_fixture.start_matlab()
+
+    # Assert
+    start_matlab_process.assert_not_called()
+    assert app_state_fixture.get_matlab_state() != "starting"
+    assert not app_state_fixture.matlab_state_updater_lock.locked()
+
+
+@pytest.mark.parametrize("platform", ["linux"])
+async def test_start_matlab_when_logs_dir_cannot_be_created(
+    mocker_os_patching_fixture, app_state_fixture
+):
+    """Test to check that fetching the licensing environment is cancelled and awaited, when the
+    logs directory for MATLAB cannot be created
+
+    Args:
+        mocker_os_patching_fixture (mocker): Custom pytest fixture for mocking
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    # Arrange
+    mocker = mocker_os_patching_fixture
+    app_state_fixture.settings["is_windowmanager_available"] = False
+    licensing_env_states = []
+
+    async def get_licensing_env(*args, **kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            licensing_env_states.append("cancelled")
+            raise
+
+    async def start_xvfb(*args, **kwargs):
+        # Lets fetching the licensing environment start while Xvfb is starting
+        await asyncio.sleep(0.1)
+        return Mock_xvfb(None, 1)
+
+    mocker.patch.object(
+        AppState, "_AppState__start_xvfb_process", side_effect=start_xvfb
+    )
+    mocker.patch.object(
+        AppState,
+        "_AppState__get_licensing_env_for_matlab",
+        side_effect=get_licensing_env,
+    )
+    mocker.patch.object(
+        AppState,
+        "create_logs_dir_for_MATLAB",
+        side_effect=OSError("Permission denied"),
+    )
+    start_matlab_process = mocker.patch.object(
+        AppState, "_AppState__start_matlab_process"
+    )
+    stop_matlab = mocker.patch.object(
+        app_state_fixture, "stop_matlab", new_callable=mocker.AsyncMock
+    )
+
+    # Act
+    await app_state_fixture.start_matlab()
+
+    # Assert
+    start_matlab_process.assert_not_called()
+    stop_matlab.assert_awaited()
+    assert licensing_env_states == ["cancelled"]
+    assert isinstance(app_state_fixture.error, OSError)
+    assert not app_state_fixture.matlab_state_updater_lock.locked()
+
+
+@pytest.mark.parametrize("platform", ["linux"])
+async def test_matlab_stderr_reader_stops_matlab_on_licensing_error(
+    mocker_os_patching_fixture, app_state_fixture
+):
+    """Test to check that MATLAB is stopped as soon as a licensing error is written to its stderr pipe
+    while it is starting, without waiting for MATLAB to exit.
+
+    Args:
+        mocker_os_patching_fixture (mocker): Custom pytest fixture for mocking
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    # Arrange
+    mocker = mocker_os_patching_fixture
+    stop_matlab = mocker.patch.object(
+        app_state_fixture, "stop_matlab", new_callable=mocker.AsyncMock
+    )
+    stderr = asyncio.StreamReader()
+    stderr.feed_data(
+        b"License checkout failed\nInvalid NLM Connection String\nDiagnostic Information\n"
+    )
+    # The stderr pipe is left open, as MATLAB does not exit on its own.
+    app_state_fixture.processes["matlab"] = SimpleNamespace(stderr=stderr)
+    app_state_fixture.licensing = {"type": "nlm", "conn_str": "123@brokenhost"}
+    await app_state_fixture.matlab_state_updater_lock.acquire()
+    app_state_fixture.set_matlab_state("starting")
+    await app_state_fixture.matlab_state_updater_lock.release()
+
+    # Act
+    reader = asyncio.create_task(
+        app_state_fixture._AppState__matlab_stderr_reader_posix()
+    )
+    for _ in range(10):
+        if stop_matlab.await_count:
+            break
+        await asyncio.sleep(0)
+
+    # Assert
+    stop_matlab.assert_awaited_once_with(force_quit=True)
+    assert isinstance(app_state_fixture.error, NetworkLicensingError)
+    assert app_state_fixture.error.logs == [
+        "License checkout failed",
+        "Invalid NLM Connection String",
+    ]
+    assert len(app_state_fixture.logs["matlab"]) == 3
+
+    reader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await reader
+
+
 async def test_start_matlab_without_xvfb_and_matlab(app_state_fixture):
     """Test to check if MATLAB doesn't start and sets the error variable to MatlabInstallError when
     there is not MATLAB on system PATH
@@ -714,6 +1039,88 @@ async def test_detect_active_client_status_can_reset_active_client(app_state_fix
     ), f"Expected the active_client to be None"
 
 
+async def test_detect_active_client_status_with_open_status_stream(
+    app_state_fixture,
+):
+    """Test to check that the active client is not reset while it has an open status stream.
+
+    Args:
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    app_state_fixture.active_client = "mock_id"
+    app_state_fixture.add_status_stream_client("mock_id")
+
+    task = asyncio.create_task(
+        app_state_fixture.detect_active_client_status(
+            sleep_time=0, max_inactive_count=0
+        )
+    )
+    await asyncio.sleep(0.1)
+    assert app_state_fixture.active_client == "mock_id"
+
+    app_state_fixture.remove_status_stream_client("mock_id")
+    await asyncio.wait_for(task, timeout=5)
+    assert app_state_fixture.active_client is None
+
+
+async def test_wait_for_status_change(app_state_fixture):
+    """Test to check that waiters are woken up when a field which is part of the status changes.
+
+    Args:
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    version = app_state_fixture.status_version
+
+    # Times out when the status does not change
+    assert (
+        await app_state_fixture.wait_for_status_change(version, timeout=0.01) == version
+    )
+
+    waiter = asyncio.create_task(app_state_fixture.wait_for_status_change(version))
+    await asyncio.sleep(0)
+    app_state_fixture.error = Exception("mock error")
+
+    assert await asyncio.wait_for(waiter, timeout=5) > version
+
+
+async def test_status_version_unchanged_when_value_is_unchanged(app_state_fixture):
+    """Test to check that assigning an unchanged value does not wake up waiters.
+
+    Args:
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    app_state_fixture.active_client = "mock_id"
+    version = app_state_fixture.status_version
+
+    app_state_fixture.active_client = "mock_id"
+    app_state_fixture.matlab_busy_state = app_state_fixture.matlab_busy_state
+
+    assert app_state_fixture.status_version == version
+
+
+def test_get_status_snapshot_is_cached_until_status_changes(app_state_fixture, mocker):
+    """Test to check that the status is serialized again only after it changes.
+
+    Args:
+        app_state_fixture (AppState): Object of AppState class with defaults set
+        mocker : Built in pytest fixture
+    """
+    marshal = mocker.MagicMock(return_value={"warnings": []})
+
+    etag, body = app_state_fixture.get_status_snapshot(None, marshal)
+    assert json.loads(body) == {"warnings": []}
+    assert app_state_fixture.get_status_snapshot(None, marshal) == (etag, body)
+    marshal.assert_called_once()
+
+    marshal.return_value = {"warnings": ["mock warning"]}
+    app_state_fixture.warnings = ["mock warning"]
+
+    new_etag, new_body = app_state_fixture.get_status_snapshot(None, marshal)
+    assert new_etag != etag
+    assert json.loads(new_body) == {"warnings": ["mock warning"]}
+    assert marshal.call_count == 2
+
+
 @pytest.mark.parametrize(
     "session_file_count, has_custom_code_to_execute", [(2, True), (1, False)]
 )
@@ -755,7 +1162,7 @@ async def test_check_idle_timer_started(app_state_fixture):
 
     # Assert
     assert app_state_fixture.is_idle_timeout_enabled is True
-    assert "decrement_idle_timer" in app_state_fixture.server_tasks
+    assert "idle_timer" in app_state_fixture.server_tasks
     assert app_state_fixture.idle_timeout_lock is not None
 
 
@@ -804,6 +1211,35 @@ async def test_decrement_timer(app_state_fixture):
     )
 
 
+async def test_idle_timer_is_not_decremented_while_matlab_is_busy(
+    app_state_fixture, mocker
+):
+    """Test to check that the IDLE timer restarts from the moment MATLAB stops being busy
+
+    Args:
+        app_state_fixture (AppState): Object of AppState class with defaults set
+    """
+    # Arrange
+    idle_timeout = app_state_fixture.settings["mwi_idle_timeout"]
+    mock_time = mocker.patch(
+        "matlab_proxy.app_state.time.monotonic", return_value=10000.0
+    )
+    await app_state_fixture.reset_timer()
+    app_state_fixture.matlab_busy_state = "busy"
+
+    # Act
+    mock_time.return_value += idle_timeout * 2
+    remaining_while_busy = app_state_fixture.get_remaining_idle_timeout()
+
+    app_state_fixture.matlab_busy_state = "idle"
+    mock_time.return_value += 10
+    remaining_while_idle = app_state_fixture.get_remaining_idle_timeout()
+
+    # Assert
+    assert remaining_while_busy == idle_timeout
+    assert remaining_while_idle == idle_timeout - 10
+
+
 async def test_decrement_timer_runs_out(sample_settings_fixture, mocker):
     """Test to check if the IDLE timer eventually runs out.
 
@@ -165,3 +165,62 @@ async def test_non_dev(test_server):
     assert resp.status == 200
 
     assert test_server.app["static_route_table"] is not None
+
+
+async def test_static_file_cache_headers(test_server):
+    """Tests that hashed static files are marked as immutable and other files must be revalidated.
+
+    Args:
+        test_server (aiohttp_client): A aiohttp server to send HTTP requests to.
+    """
+    resp = await test_server.get("/static/js/index.js")
+    assert resp.status == 200
+    assert "immutable" in resp.headers["Cache-Control"]
+    assert resp.headers["ETag"]
+    assert await resp.text() == "import React from 'react';'"
+
+    resp = await test_server.get("/index.html")
+    assert resp.status == 200
+    assert resp.headers["Cache-Control"] == "no-cache"
+
+
+async def test_static_file_not_modified(test_server):
+    """Tests that a static file is not sent again when the client's cached copy is up to date.
+
+    Args:
+        test_server (aiohttp_client): A aiohttp server to send HTTP requests to.
+    """
+    resp = await test_server.get("/static/css/index.css")
+    etag = resp.headers["ETag"]
+
+    resp = await test_server.get(
+        "/static/css/index.css", headers={"If-None-Match": etag}
+    )
+    assert resp.status == 304
+    assert resp.headers["ETag"] == etag
+    assert await resp.read() == b""
+
+    resp = await test_server.get(
+        "/static/css/index.css", headers={"If-None-Match": '"stale-etag"'}
+    )
+    assert resp.status == 200
+
+
+async def test_static_files_served_by_single_resource(test_server):
+    """Tests that all static files are served by a single resource registered before the catch-all route.
+
+    Args:
+        test_server (aiohttp_client): A aiohttp server to send HTTP requests to.
+    """
+    from matlab_proxy.app import StaticFilesResource
+
+    static_resources = [
+        resource
+        for resource in test_server.app.router.resources()
+        if isinstance(resource, StaticFilesResource)
+    ]
+    assert len(static_resources) == 1
+
+    for path in test_server.app["static_route_table"].keys():
+        resp = await test_server.get(path)
+        assert resp.status == 200
@@ -9,7 +9,11 @@ import pytest
 
 import matlab_proxy
 import matlab_proxy.settings as settings
-from matlab_proxy.constants import DEFAULT_PROCESS_START_TIMEOUT, VERSION_INFO_FILE_NAME
+from matlab_proxy.constants import (
+    DEFAULT_PROCESS_START_TIMEOUT,
+    VERSION_INFO_FILE_NAME,
+)
+from matlab_proxy.util import system
 from matlab_proxy.util.cookie_jar import HttpOnlyCookieJar
 from matlab_proxy.util.mwi import environment_variables as mwi_env
 from matlab_proxy.util.mwi.exceptions import MatlabInstallError
@@ -417,6 +421,76 @@ def test_get_ssl_context_with_invalid_self_signed_certs_returns_none(mocker, tmp
     assert settings._validate_ssl_files_and_get_ssl_context(mwi_certs_dir) is None
 
 
+def test_get_ssl_context_reuses_self_signed_ecdsa_certs(monkeypatch, tmp_path):
+    """Test to check that a generated ECDSA certificate is reused by the next run"""
+    # Arrange
+    monkeypatch.setenv(mwi_env.get_env_name_enable_ssl(), "True")
+    monkeypatch.setenv(mwi_env.get_env_name_ssl_key_type(), "ecdsa")
+    key_file = tmp_path / "certs" / "key.pem"
+
+    # Act
+    ssl_context = settings._validate_ssl_files_and_get_ssl_context(tmp_path)
+    generated_key = key_file.read_bytes()
+    reused_ssl_context = settings._validate_ssl_files_and_get_ssl_context(tmp_path)
+
+    # Assert
+    assert ssl_context is not None and reused_ssl_context is not None
+    assert b"EC PRIVATE KEY" in generated_key
+    assert key_file.read_bytes() == generated_key
+
+
+@pytest.mark.parametrize(
+    "key_type, renewal_margin_days, is_reused",
+    [
+        ("ecdsa", 7, True),
+        ("rsa", 7, False),
+        ("ecdsa", 400, False),
+    ],
+    ids=[
+        "Valid certificate",
+        "Different type of key",
+        "Certificate expiring within the renewal margin",
+    ],
+)
+def test_get_reusable_self_signed_certs(
+    mocker, tmp_path, key_type, renewal_margin_days, is_reused
+):
+    """Test to check that a generated certificate is reused only if it has the same type of key and is not about to expire"""
+    # Arrange
+    mocker.patch(
+        "matlab_proxy.settings.constants.SELF_SIGNED_CERT_RENEWAL_MARGIN_DAYS",
+        renewal_margin_days,
+    )
+    cert_file, key_file = settings.generate_new_self_signed_certs(tmp_path, "ecdsa")
+
+    # Act
+    reusable_certs = settings.get_reusable_self_signed_certs(tmp_path, key_type)
+
+    # Assert
+    assert reusable_certs == ((cert_file, key_file) if is_reused else (None, None))
+
+
+@pytest.mark.skipif(
+    system.is_windows(), reason="File permission bits do not apply on Windows"
+)
+def test_get_reusable_self_signed_certs_with_accessible_private_key(tmp_path):
+    """Test to check that a private key which other users can access is not reused, and that the key generated
+    in its place is accessible only by the user"""
+    # Arrange
+    settings.generate_new_self_signed_certs(tmp_path, "ecdsa")
+    key_file = tmp_path / "key.pem"
+    key_file.chmod(0o644)
+
+    # Act
+    reusable_certs = settings.get_reusable_self_signed_certs(tmp_path, "ecdsa")
+    settings.generate_new_self_signed_certs(tmp_path, "ecdsa")
+
+    # Assert
+    assert reusable_certs == (None, None)
+    assert key_file.stat().st_mode & 0o777 == 0o600
+    assert settings.get_reusable_self_signed_certs(tmp_path, "ecdsa") != (None, None)
+
+
 def test_get_ssl_context_with_valid_custom_ssl_files(monkeypatch, mocker, tmpdir):
     # Sets up the SUT
     monkeypatch.setenv(mwi_env.get_env_name_enable_ssl(), "True")
@@ -706,3 +780,26 @@ def test_get_cookie_jar(monkeypatch):
         ],
         HttpOnlyCookieJar,
     )
+
+
+def test_create_xvfb_cmd_with_lean_profile(monkeypatch):
+    """Test to check that the Xvfb command is built from the profile selected in server settings"""
+    # Arrange
+    monkeypatch.setenv(mwi_env.get_env_name_xvfb_profile(), "lean")
+    xvfb_options = settings.get_server_settings(matlab_proxy.get_default_config_name())[
+        "mwi_xvfb_options"
+    ]
+
+    # Act
+    default_cmd, default_pipe = settings.create_xvfb_cmd()
+    lean_cmd, lean_pipe = settings.create_xvfb_cmd(xvfb_options)
+
+    # Assert
+    assert default_cmd[:3] == ["Xvfb", "-displayfd", str(default_pipe[1])]
+    assert default_cmd[3:6] == ["-screen", "0", "3840x2160x24"]
+    assert lean_cmd[3:] == xvfb_options
+    assert lean_cmd[5] == "1920x1080x24"
+    assert "-nolisten" in lean_cmd
+
+    for fd in (*default_pipe, *lean_pipe):
+        os.close(fd)
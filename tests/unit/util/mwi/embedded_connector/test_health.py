@@ -0,0 +1,150 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from matlab_proxy.util.mwi import embedded_connector
+from matlab_proxy.util.mwi.embedded_connector import HealthClient
+from matlab_proxy.util.mwi.exceptions import EmbeddedConnectorError
+
+
+@pytest.fixture(name="ec_server")
+async def ec_server_fixture(aiohttp_server):
+    """Starts a stand-in for the Embedded Connector which records the requests sent to its state endpoint."""
+
+    async def state(req):
+        body = json.loads(await req.read())
+        req.app["requests"].append({"headers": req.headers, "body": body})
+
+        if req.app["hang"]:
+            await asyncio.sleep(10)
+
+        if req.headers.get("mwapikey") != "test-api-key":
+            return web.Response(status=403)
+
+        if "Ping" in body["messages"]:
+            messages = {"PingResponse": [{"messageFaults": []}]}
+        else:
+            messages = {"GetMatlabStatusResponse": [{"status": "Idle"}]}
+
+        response = web.json_response({"messages": messages})
+        response.set_cookie("JSESSIONID", "test-session")
+        return response
+
+    app = web.Application()
+    app["requests"] = []
+    app["hang"] = False
+    app.router.add_post("/messageservice/json/state", state)
+    app.router.add_post("/matlab/messageservice/json/state", state)
+    return await aiohttp_server(app)
+
+
+@pytest.fixture(name="health_client")
+async def health_client_fixture(ec_server):
+    """Returns a HealthClient connected to the stand-in Embedded Connector."""
+    client = HealthClient(
+        base_url=str(ec_server.make_url("")).rstrip("/"), mwapikey="test-api-key"
+    )
+    yield client
+    await client.close()
+
+
+async def test_get_state_using_health_client(ec_server, health_client):
+    """Test to check that the state is fetched directly from the Embedded Connector over a single connection"""
+    # Act
+    states = [
+        await embedded_connector.request.get_state(
+            mwi_server_url=None, health_client=health_client
+        )
+        for _ in range(3)
+    ]
+    busy_state = await embedded_connector.request.get_busy_state(
+        mwi_server_url=None, health_client=health_client
+    )
+
+    # Assert
+    assert states == ["up"] * 3
+    assert busy_state == "idle"
+
+    requests = ec_server.app["requests"]
+    assert requests[0]["body"] == {"messages": {"Ping": [{}]}}
+    assert requests[-1]["body"] == {"messages": {"GetMatlabStatus": [{}]}}
+
+    # The session cookie set by the Embedded Connector is sent back on subsequent requests
+    assert "Cookie" not in requests[0]["headers"]
+    assert requests[1]["headers"]["Cookie"] == "JSESSIONID=test-session"
+
+    stats = health_client.pool.get_stats()
+    assert stats["httpRequests"] == 4
+    assert stats["idleConnections"] == 1
+
+
+@pytest.mark.parametrize("context_root", ["/matlab", "/matlab/"])
+async def test_health_client_uses_context_root(ec_server, context_root):
+    """Test to check that health checks are sent to the state endpoint under the context root of the Embedded Connector"""
+    # Arrange
+    client = HealthClient(
+        base_url=str(ec_server.make_url("")).rstrip("/"),
+        context_root=context_root,
+        mwapikey="test-api-key",
+    )
+
+    # Act
+    state = await embedded_connector.request.get_state(
+        mwi_server_url=None, health_client=client
+    )
+
+    # Assert
+    assert state == "up"
+    assert len(ec_server.app["requests"]) == 1
+
+    await client.close()
+
+
+async def test_health_client_raises_on_error_response(ec_server):
+    """Test to check that an error response from the Embedded Connector raises an EmbeddedConnectorError"""
+    # Arrange
+    client = HealthClient(base_url=str(ec_server.make_url("")).rstrip("/"))
+
+    # Act & Assert
+    with pytest.raises(EmbeddedConnectorError):
+        await client.ping()
+
+    assert (
+        await embedded_connector.request.get_state(
+            mwi_server_url=None, health_client=client
+        )
+        == "down"
+    )
+
+    await client.close()
+
+
+async def test_health_client_times_out(ec_server):
+    """Test to check that a health check which gets no response is reported as down once it times out"""
+    # Arrange
+    ec_server.app["hang"] = True
+    client = HealthClient(
+        base_url=str(ec_server.make_url("")).rstrip("/"),
+        mwapikey="test-api-key",
+        timeout=0.1,
+    )
+
+    # Act
+    with pytest.raises(asyncio.TimeoutError):
+        await client.ping()
+    state = await embedded_connector.request.get_state(
+        mwi_server_url=None, health_client=client
+    )
+    busy_state = await embedded_connector.request.get_busy_state(
+        mwi_server_url=None, health_client=client
+    )
+
+    # Assert
+    assert state == "down"
+    assert busy_state is None
+
+    await client.close()
@@ -0,0 +1,72 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from matlab_proxy.util.mwi.embedded_connector import ConnectionPool
+
+
+@pytest.fixture(name="ec_server")
+async def ec_server_fixture(aiohttp_server):
+    """Starts a stand-in for the Embedded Connector which echoes the request path."""
+
+    async def echo(req):
+        return web.json_response({"path": req.path_qs})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", echo)
+    return await aiohttp_server(app)
+
+
+async def test_pool_reuses_connections(ec_server):
+    """Test to check that subsequent requests through the pool reuse the same connection"""
+    # Arrange
+    pool = ConnectionPool(base_url=str(ec_server.make_url("")).rstrip("/"))
+
+    # Act
+    for _ in range(3):
+        async with pool.request("GET", "/messageservice/json/state?a=1") as resp:
+            assert (await resp.json())["path"] == "/messageservice/json/state?a=1"
+
+    stats = pool.get_stats()
+
+    # Assert
+    assert stats["httpRequests"] == 3
+    assert stats["activeConnections"] == 0
+    assert stats["idleConnections"] == 1
+
+    await pool.close()
+
+
+async def test_pool_uses_configured_limits():
+    """Test to check that the pool's connector is created with the supplied limits"""
+    # Arrange
+    pool = ConnectionPool(
+        base_url="http://127.0.0.1:31515", limit_per_host=5, keepalive_timeout=7
+    )
+
+    # Act
+    connector = pool.session.connector
+
+    # Assert
+    assert connector.limit_per_host == 5
+    assert pool.get_stats()["keepaliveTimeout"] == 7
+
+    await pool.close()
+
+
+async def test_closed_pool_raises_connection_error():
+    """Test to check that a closed pool cannot be used to send requests"""
+    # Arrange
+    pool = ConnectionPool(base_url="http://127.0.0.1:31515")
+    _ = pool.session
+
+    # Act
+    await pool.close()
+
+    # Assert
+    assert pool.closed
+    assert pool.get_stats()["closed"]
+    with pytest.raises(aiohttp.ClientConnectionError):
+        pool.request("GET", "/")
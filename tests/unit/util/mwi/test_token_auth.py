@@ -120,6 +120,7 @@ async def fake_server_with_auth_enabled(
     aiohttp_session_setup(
         app, EncryptedCookieStorage(f, cookie_name="matlab-proxy-session")
     )
+    app["auth_verdict_cache"] = token_auth.AuthVerdictCache()
     return await aiohttp_client(app)
 
 
@@ -187,6 +188,84 @@ async def test_set_value_with_token_hash(
     assert fake_server_with_auth_enabled.server.app["value"] == "foobar1"
 
 
+async def test_session_cookie_is_not_decrypted_again(
+    fake_server_with_auth_enabled, get_custom_auth_token_str, mocker
+):
+    """Test to check that a valid session cookie is only decrypted once and that a session is not issued again"""
+    # Arrange
+    fake_server_with_auth_enabled.server.app["value"] = "bar"
+    get_session_spy = mocker.spy(token_auth, "get_session")
+    resp = await fake_server_with_auth_enabled.get(
+        "/", headers={MWI_AUTH_TOKEN_NAME_FOR_HTTP: get_custom_auth_token_str}
+    )
+    assert "matlab-proxy-session" in resp.cookies
+    get_session_spy.reset_mock()
+
+    # Act
+    responses = [
+        await fake_server_with_auth_enabled.get(
+            "/",
+            headers={MWI_AUTH_TOKEN_NAME_FOR_HTTP: get_custom_auth_token_str},
+            cookies=resp.cookies,
+        )
+        for _ in range(3)
+    ]
+
+    # Assert
+    assert [r.status for r in responses] == [web.HTTPOk.status_code] * 3
+    assert all("matlab-proxy-session" not in r.cookies for r in responses)
+    assert get_session_spy.call_count == 1
+
+    stats = fake_server_with_auth_enabled.server.app["auth_verdict_cache"].get_stats()
+    assert stats["entries"] == 1
+    assert stats["hits"] == 2
+
+
+def test_auth_verdict_cache_evicts_least_recently_used():
+    """Test to check that the cache holds at most max_entries cookies"""
+    # Arrange
+    cache = token_auth.AuthVerdictCache(max_entries=2)
+    cache.add("cookie1", "hash")
+    cache.add("cookie2", "hash")
+
+    # Act
+    assert cache.is_valid("cookie1", "hash")
+    cache.add("cookie3", "hash")
+
+    # Assert
+    assert cache.is_valid("cookie1", "hash")
+    assert not cache.is_valid("cookie2", "hash")
+    assert cache.is_valid("cookie3", "hash")
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_auth_verdict_cache_expires_entries(mocker):
+    """Test to check that cached cookies are validated again once their entry expires"""
+    # Arrange
+    mock_monotonic = mocker.patch.object(token_auth.time, "monotonic", return_value=100)
+    cache = token_auth.AuthVerdictCache(ttl=10)
+    cache.add("cookie", "hash")
+
+    # Act & Assert
+    mock_monotonic.return_value = 109
+    assert cache.is_valid("cookie", "hash")
+    mock_monotonic.return_value = 110
+    assert not cache.is_valid("cookie", "hash")
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_auth_verdict_cache_evicts_on_token_change():
+    """Test to check that cached cookies are evicted when the auth token changes"""
+    # Arrange
+    cache = token_auth.AuthVerdictCache()
+    cache.add("cookie", "old-hash")
+
+    # Act & Assert
+    assert not cache.is_valid("cookie", "new-hash")
+    assert not cache.is_valid("cookie", "old-hash")
+    assert cache.get_stats()["evictions"] == 1
+
+
 async def test_set_value_without_token(fake_server_with_auth_enabled):
     resp2 = await fake_server_with_auth_enabled.post(
         "/",
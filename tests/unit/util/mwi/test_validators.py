@@ -362,3 +362,199 @@ def test_validate_idle_timeout(timeout, validated_timeout):
 
     # Assert
     assert actual_timeout == validated_timeout
+
+
+@pytest.mark.parametrize(
+    "validator, value, validated_value",
+    [
+        (
+            validators.validate_ec_pool_limit_per_host,
+            None,
+            constants.DEFAULT_EC_POOL_LIMIT_PER_HOST,
+        ),
+        (validators.validate_ec_pool_limit_per_host, "0", 0),
+        (validators.validate_ec_pool_limit_per_host, "25", 25),
+        (
+            validators.validate_ec_pool_limit_per_host,
+            "-1",
+            constants.DEFAULT_EC_POOL_LIMIT_PER_HOST,
+        ),
+        (
+            validators.validate_ec_pool_keepalive_timeout,
+            "abc",
+            constants.DEFAULT_EC_POOL_KEEPALIVE_TIMEOUT_SECONDS,
+        ),
+        (validators.validate_ec_pool_keepalive_timeout, "60", 60),
+    ],
+    ids=[
+        "No limit specified",
+        "Zero limit specified",
+        "Valid limit specified",
+        "Negative limit specified",
+        "Invalid keep-alive timeout specified",
+        "Valid keep-alive timeout specified",
+    ],
+)
+def test_validate_ec_pool_settings(validator, value, validated_value):
+    # Act
+    actual_value = validator(value)
+
+    # Assert
+    assert actual_value == validated_value
+
+
+@pytest.mark.parametrize(
+    "interval, validated_interval",
+    [
+        (None, constants.DEFAULT_CHECK_MATLAB_STATUS_MAX_INTERVAL_SECONDS),
+        ("30", 30),
+        ("-5", constants.DEFAULT_CHECK_MATLAB_STATUS_MAX_INTERVAL_SECONDS),
+    ],
+    ids=["No interval specified", "Valid interval specified", "Negative interval"],
+)
+def test_validate_matlab_status_max_interval(interval, validated_interval):
+    # Act
+    actual_interval = validators.validate_matlab_status_max_interval(interval)
+
+    # Assert
+    assert actual_interval == validated_interval
+
+
+@pytest.mark.parametrize(
+    "profile, screen, options, expected_options",
+    [
+        (
+            None,
+            None,
+            None,
+            ["-screen", "0", "3840x2160x24", "-dpi", "100", "-extension", "RANDR"],
+        ),
+        (
+            "lean",
+            None,
+            None,
+            ["-screen", "0", "1920x1080x24"]
+            + constants.XVFB_PROFILES["lean"]["options"],
+        ),
+        (
+            "LEAN",
+            "1280x1024x16",
+            "-nocursor -fp 'built-ins'",
+            ["-screen", "0", "1280x1024x16"]
+            + constants.XVFB_PROFILES["lean"]["options"]
+            + ["-nocursor", "-fp", "built-ins"],
+        ),
+        (
+            "tiny",
+            "1280x1024",
+            "-fp 'unterminated",
+            ["-screen", "0", "3840x2160x24", "-dpi", "100", "-extension", "RANDR"],
+        ),
+    ],
+    ids=[
+        "No profile specified",
+        "Lean profile",
+        "Screen and options override the profile",
+        "Invalid profile, screen and options",
+    ],
+)
+def test_validate_xvfb_options(profile, screen, options, expected_options):
+    # Act
+    actual_options = validators.validate_xvfb_options(profile, screen, options)
+
+    # Assert
+    assert actual_options == expected_options
+
+
+@pytest.mark.parametrize(
+    "key_type, validated_key_type",
+    [
+        (None, constants.DEFAULT_SSL_KEY_TYPE),
+        ("ECDSA", "ecdsa"),
+        ("dsa", constants.DEFAULT_SSL_KEY_TYPE),
+    ],
+    ids=["No key type specified", "Valid key type specified", "Invalid key type"],
+)
+def test_validate_ssl_key_type(key_type, validated_key_type):
+    # Act
+    actual_key_type = validators.validate_ssl_key_type(key_type)
+
+    # Assert
+    assert actual_key_type == validated_key_type
+
+
+@pytest.mark.parametrize(
+    "args, expected_policy",
+    [
+        ((None, None, None, None), None),
+        (
+            (None, "6", None, None),
+            {
+                "min_size": constants.DEFAULT_WS_COMPRESSION_MIN_SIZE,
+                "level": 6,
+                "window_bits": constants.DEFAULT_WS_COMPRESSION_WINDOW_BITS,
+                "min_savings": constants.DEFAULT_WS_COMPRESSION_MIN_SAVINGS_PERCENT,
+            },
+        ),
+        (
+            ("1024", "6", "10", "20"),
+            {"min_size": 1024, "level": 6, "window_bits": 10, "min_savings": 20},
+        ),
+        (
+            ("-1", "10", "8", "abc"),
+            {
+                "min_size": constants.DEFAULT_WS_COMPRESSION_MIN_SIZE,
+                "level": constants.DEFAULT_WS_COMPRESSION_LEVEL,
+                "window_bits": constants.DEFAULT_WS_COMPRESSION_WINDOW_BITS,
+                "min_savings": constants.DEFAULT_WS_COMPRESSION_MIN_SAVINGS_PERCENT,
+            },
+        ),
+    ],
+    ids=[
+        "No policy specified",
+        "Partial policy specified",
+        "Valid policy specified",
+        "Out of range values",
+    ],
+)
+def test_validate_ws_compression_policy(args, expected_policy):
+    # Act
+    actual_policy = validators.validate_ws_compression_policy(*args)
+
+    # Assert
+    assert actual_policy == expected_policy
+
+
+@pytest.mark.parametrize(
+    "args, expected_budgets",
+    [
+        (
+            (None, None),
+            {
+                "per_connection": constants.DEFAULT_WS_MEMORY_BUDGET_PER_CONNECTION,
+                "total": constants.DEFAULT_WS_MEMORY_BUDGET,
+            },
+        ),
+        (("50", "200"), {"per_connection": 50_000_000, "total": 200_000_000}),
+        (("100", "20"), {"per_connection": 100_000_000, "total": 100_000_000}),
+        (
+            ("0", "abc"),
+            {
+                "per_connection": constants.DEFAULT_WS_MEMORY_BUDGET_PER_CONNECTION,
+                "total": constants.DEFAULT_WS_MEMORY_BUDGET,
+            },
+        ),
+    ],
+    ids=[
+        "No budgets specified",
+        "Valid budgets specified",
+        "Total budget smaller than budget per connection",
+        "Invalid values",
+    ],
+)
+def test_validate_ws_memory_budgets(args, expected_budgets):
+    # Act
+    actual_budgets = validators.validate_ws_memory_budgets(*args)
+
+    # Assert
+    assert actual_budgets == expected_budgets
@@ -0,0 +1,77 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import asyncio
+
+import pytest
+
+from matlab_proxy.util import TimerWheel
+
+
+@pytest.fixture(name="timer_wheel")
+def timer_wheel_fixture():
+    """Returns a TimerWheel with a resolution of 0.1 seconds."""
+    return TimerWheel(resolution=0.1)
+
+
+async def test_timer_wheel_coalesces_wakeups(timer_wheel):
+    """Test to check that jobs which are due within the same tick are woken up together"""
+    # Arrange
+    delays = [0.21, 0.23, 0.25, 0.29]
+
+    # Act
+    await asyncio.gather(
+        *[timer_wheel.sleep(f"job-{i}", delay) for i, delay in enumerate(delays)]
+    )
+
+    # Assert
+    stats = timer_wheel.get_stats()
+    assert stats["jobsWoken"] == len(delays)
+    # Allow for the deadlines to straddle a tick boundary
+    assert stats["wakeups"] <= 2
+    assert all(job["runs"] == 1 for job in stats["jobs"].values())
+
+
+async def test_timer_wheel_reports_run_time(timer_wheel):
+    """Test to check that the time spent running between sleeps is reported per job"""
+    # Act
+    await timer_wheel.sleep("job", 0)
+    await asyncio.sleep(0.2)
+    await timer_wheel.sleep("job", 0)
+
+    # Assert
+    job_stats = timer_wheel.get_stats()["jobs"]["job"]
+    assert job_stats["runs"] == 2
+    assert job_stats["lastRunTime"] >= 0.15
+    assert job_stats["maxRunTime"] == job_stats["lastRunTime"]
+
+
+async def test_timer_wheel_pause_and_resume(timer_wheel):
+    """Test to check that a paused job does not wake up until it is resumed"""
+    # Arrange
+    timer_wheel.pause("job")
+    task = asyncio.create_task(timer_wheel.sleep("job", 0.1))
+
+    # Act & Assert
+    await asyncio.sleep(0.4)
+    assert not task.done()
+    assert timer_wheel.get_stats()["jobs"]["job"]["paused"]
+
+    timer_wheel.resume("job")
+    await asyncio.wait_for(task, timeout=1)
+    assert not timer_wheel.is_paused("job")
+
+
+async def test_timer_wheel_cancelled_sleep(timer_wheel):
+    """Test to check that the timer of a tick is cancelled when all the jobs due at it are cancelled"""
+    # Arrange
+    task = asyncio.create_task(timer_wheel.sleep("job", 0.2))
+    await asyncio.sleep(0)
+
+    # Act
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0.4)
+
+    # Assert
+    assert timer_wheel.get_stats()["wakeups"] == 0
@@ -0,0 +1,51 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import asyncio
+import time
+
+from matlab_proxy.util.file_watcher import FileWatcher, read_file_when_ready
+
+
+async def test_read_file_when_ready_is_notified_of_changes(tmp_path):
+    """Test to check that the contents of the file are read as soon as they are written,
+    without waiting for the poll interval to elapse"""
+    # Arrange
+    ready_file = tmp_path / "connector.securePort"
+
+    async def write_ready_file():
+        await asyncio.sleep(0.1)
+        # The file is created before its contents are written
+        ready_file.touch()
+        await asyncio.sleep(0.1)
+        ready_file.write_text("31515")
+
+    # Act
+    start = time.monotonic()
+    writer = asyncio.create_task(write_ready_file())
+    contents = await asyncio.wait_for(
+        read_file_when_ready(ready_file, poll_interval=30), timeout=5
+    )
+    await writer
+
+    # Assert
+    assert contents == "31515"
+    assert time.monotonic() - start < 5
+
+
+async def test_file_watcher_falls_back_to_polling(tmp_path):
+    """Test to check that the file is polled for when its parent directory cannot be watched"""
+    # Arrange
+    ready_file = tmp_path / "does_not_exist_yet" / "connector.securePort"
+    watcher = FileWatcher(ready_file)
+
+    # Act
+    is_started = watcher.start()
+    ready_file.parent.mkdir()
+    ready_file.write_text("31515")
+    contents = await read_file_when_ready(ready_file, poll_interval=0.1)
+
+    # Assert
+    assert not is_started
+    assert not watcher.is_watching
+    assert not await watcher.wait(0.01)
+    assert contents == "31515"
@@ -1,15 +1,20 @@
 # Copyright 2020-2025 The MathWorks, Inc.
 
+import asyncio
 import datetime
 import random
 import re
 import secrets
+import sys
+import time
 from collections import namedtuple
 from datetime import timedelta, timezone
 from http import HTTPStatus
 
 import pytest
-from matlab_proxy import settings
+from aiohttp import web
+
+from matlab_proxy import constants, settings
 from matlab_proxy.util import mw, system
 from matlab_proxy.util.mwi import exceptions
 
@@ -504,6 +509,113 @@ def test_parse_other_error():
     assert isinstance(actual_output, expected_output)
 
 
+@pytest.mark.parametrize(
+    "licensing, lines, expected_error, expected_line_number",
+    [
+        (
+            {"type": "nlm", "conn_str": "123@nlm"},
+            [
+                "Starting MATLAB proxy-app",
+                "License checkout failed",
+                "Error parsing config, resetting.",
+                "Diagnostic Information",
+                "Feature: MATLAB",
+            ],
+            exceptions.NetworkLicensingError,
+            3,
+        ),
+        (
+            {"type": "mhlm"},
+            ["Starting MATLAB proxy-app", "License Manager Error -9"]
+            + [f"Details {i}" for i in range(constants.MHLM_ERROR_DETAIL_LINES + 1)],
+            exceptions.OnlineLicensingError,
+            1 + constants.MHLM_ERROR_DETAIL_LINES,
+        ),
+        (
+            {"type": "existing_license"},
+            ["Fatal Startup Error", "MATLAB is exiting because of fatal error"],
+            exceptions.MatlabError,
+            0,
+        ),
+        (
+            {"type": "existing_license"},
+            ["License checkout failed", "Diagnostic Information"],
+            None,
+            None,
+        ),
+    ],
+    ids=[
+        "NLM error",
+        "MHLM error",
+        "Fatal startup error",
+        "Licensing error for other type of licensing",
+    ],
+)
+def test_startup_error_detector(licensing, lines, expected_error, expected_line_number):
+    """Test to check that mw.StartupErrorDetector reports an error on the line which completes its signature, and only once."""
+    # Arrange
+    detector = mw.StartupErrorDetector(licensing)
+
+    # Act
+    errors = [detector.feed(line) for line in lines]
+
+    # Assert
+    reported = [(i, err) for i, err in enumerate(errors) if err is not None]
+    if expected_error is None:
+        assert reported == []
+    else:
+        assert len(reported) == 1
+        line_number, err = reported[0]
+        assert line_number == expected_line_number
+        assert type(err) is expected_error
+        assert detector.error is err
+
+
+def test_startup_error_detector_reports_mhlm_error_details():
+    """Test to check that the lines following the heading of an MHLM error are reported as part of its logs."""
+    # Arrange
+    detector = mw.StartupErrorDetector({"type": "mhlm"})
+    lines = [
+        "License Manager Error -9",
+        "Your username does not match the username on this license.",
+    ] + ["More details"] * constants.MHLM_ERROR_DETAIL_LINES
+
+    # Act
+    for line in lines:
+        detector.feed(line)
+
+    # Assert
+    assert isinstance(detector.error, exceptions.OnlineLicensingError)
+    assert (
+        "Your username does not match the username on this license."
+        in detector.error.logs
+    )
+
+
+def test_bounded_log_buffer():
+    """Test to check that mw.BoundedLogBuffer is bounded by both the number of lines and their size in bytes."""
+    # Arrange
+    buffer = mw.BoundedLogBuffer(max_lines=3, max_bytes=10)
+
+    # Act & Assert
+    for line in (b"a", b"b", b"c", b"d"):
+        buffer.append(line)
+    assert list(buffer) == [b"b", b"c", b"d"]
+
+    buffer.append(b"123456")
+    assert list(buffer) == [b"c", b"d", b"123456"]
+    assert buffer.size == 8
+
+    buffer.append(b"1234")
+    assert list(buffer) == [b"123456", b"1234"]
+
+    buffer.append(b"x" * 20)
+    assert list(buffer) == [b"x" * 10]
+
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.size == 0
+
+
 def test_range_matlab_connector_ports():
     """This test checks if the generator mw.range _matlab_connector_ports()
     yields consecutive port numbers.
@@ -515,6 +627,85 @@ def test_range_matlab_connector_ports():
     assert first_port + 1 == second_port
 
 
+# Stands in for Xvfb: writes the display number into the descriptor passed with '-displayfd'
+# after a delay, then keeps running until it is terminated.
+FAKE_XVFB_SCRIPT = """
+import os, sys, time
+delay, display, displayfd = float(sys.argv[1]), sys.argv[2], int(sys.argv[4])
+time.sleep(delay)
+if display:
+    os.write(displayfd, (display + "\\n").encode())
+    time.sleep(60)
+else:
+    sys.stderr.write("Fatal server error")
+"""
+
+
+def _create_fake_xvfb_cmd(delay, display):
+    """Returns the command to run the fake Xvfb along with its pipe, similar to settings.create_xvfb_cmd()"""
+    _, dpipe = settings.create_xvfb_cmd()
+    return [
+        sys.executable,
+        "-c",
+        FAKE_XVFB_SCRIPT,
+        str(delay),
+        display,
+        "-displayfd",
+        str(dpipe[1]),
+    ], dpipe
+
+
+@pytest.mark.skipif(
+    not system.is_linux(),
+    reason="Xvfb is only required on linux based operating systems",
+)
+async def test_create_xvfb_process_does_not_block_event_loop():
+    """Test to check that the event loop keeps running while waiting for Xvfb to write its display number"""
+    # Arrange
+    delay = 1
+    xvfb_cmd, pipe = _create_fake_xvfb_cmd(delay, "99")
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+
+    # Act
+    xvfb, display_port = await mw.create_xvfb_process(xvfb_cmd, pipe, {})
+    ticker.cancel()
+
+    # Assert
+    assert display_port == "99"
+    # The ticker would not have run at all had the event loop been blocked for the delay
+    assert ticks >= (delay / 0.05) / 2
+
+    # Clean up
+    xvfb.terminate()
+    await xvfb.wait()
+
+
+@pytest.mark.skipif(
+    not system.is_linux(),
+    reason="Xvfb is only required on linux based operating systems",
+)
+async def test_create_xvfb_process_exits_without_display_number():
+    """Test to check that an XvfbError is raised as soon as Xvfb exits without writing its display number"""
+    # Arrange
+    xvfb_cmd, pipe = _create_fake_xvfb_cmd(0.2, "")
+    start_time = time.monotonic()
+
+    # Act & Assert
+    with pytest.raises(exceptions.XvfbError, match="Fatal server error"):
+        await mw.create_xvfb_process(xvfb_cmd, pipe, {})
+
+    # Fails fast instead of waiting for the process startup timeout
+    assert time.monotonic() - start_time < 10
+
+
 @pytest.mark.skipif(
     not system.is_linux(),
     reason="Xvfb is only required on linux based operating systems",
@@ -548,3 +739,145 @@ async def test_create_xvfb_process():
 
     xvfb_2.terminate()
     await xvfb_2.wait()
+
+
+def _format_expiry(seconds_from_now):
+    return (
+        datetime.datetime.now(timezone.utc) + timedelta(seconds=seconds_from_now)
+    ).strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+@pytest.fixture(name="licensing_server")
+async def licensing_server_fixture(aiohttp_server):
+    """Starts a stand-in for the MathWorks licensing servers which counts the requests sent to each endpoint.
+    The lifetime of the access tokens it issues is read from app["access_token_lifetime"].
+    """
+
+    async def expand_token(req):
+        req.app["requests"]["expand_token"] += 1
+        return web.json_response(
+            {
+                "expirationDate": _format_expiry(24 * 60 * 60),
+                "referenceDetail": {
+                    "firstName": "abc",
+                    "lastName": "def",
+                    "displayName": "abc",
+                    "userId": "mwa123",
+                    "referenceId": "456",
+                },
+            }
+        )
+
+    async def access_token(req):
+        req.app["requests"]["access_token"] += 1
+        return web.json_response(
+            {
+                "accessTokenString": f"token-{req.app['requests']['access_token']}",
+                "expirationDate": _format_expiry(req.app["access_token_lifetime"]),
+            }
+        )
+
+    async def entitlements(req):
+        req.app["requests"]["entitlements"] += 1
+        data = await req.post()
+        assert data["token"].startswith("token-")
+        return web.Response(
+            text="<root><entitlements><entitlement><id>1</id><label>MATLAB</label>"
+            "<license_number>123</license_number></entitlement></entitlements></root>"
+        )
+
+    app = web.Application()
+    app["requests"] = {"expand_token": 0, "access_token": 0, "entitlements": 0}
+    app["access_token_lifetime"] = 60 * 60
+    app.router.add_post("/mwa/tokens", expand_token)
+    app.router.add_post("/mwa/tokens/access", access_token)
+    app.router.add_post("/mhlm/entitlements", entitlements)
+    return await aiohttp_server(app)
+
+
+@pytest.fixture(name="licensing_cache")
+async def licensing_cache_fixture():
+    """Returns a LicensingCache which is closed after the test."""
+    cache = mw.LicensingCache()
+    yield cache
+    await cache.close()
+
+
+async def test_licensing_cache_serves_items_from_cache(
+    licensing_server, licensing_cache
+):
+    """Test to check that tokens and entitlements are fetched once, concurrently, and then served from the cache"""
+    # Arrange
+    mwa_api_endpoint = str(licensing_server.make_url("/mwa"))
+    mhlm_api_endpoint = str(licensing_server.make_url("/mhlm/entitlements"))
+
+    # Act
+    for _ in range(2):
+        token_data, entitlements = await asyncio.gather(
+            licensing_cache.fetch_expand_token(mwa_api_endpoint, "identity", "source"),
+            licensing_cache.fetch_entitlements(
+                mwa_api_endpoint, mhlm_api_endpoint, "identity", "source", "R2024b"
+            ),
+        )
+    access_token_data = await licensing_cache.fetch_access_token(
+        mwa_api_endpoint, "identity", "source"
+    )
+
+    # Assert
+    assert token_data["user_id"] == "mwa123"
+    assert entitlements == [{"id": "1", "label": "MATLAB", "license_number": "123"}]
+    assert access_token_data["token"] == "token-1"
+    assert licensing_server.app["requests"] == {
+        "expand_token": 1,
+        "access_token": 1,
+        "entitlements": 1,
+    }
+    stats = licensing_cache.get_stats()
+    assert stats["misses"] == 3
+    assert stats["hits"] == 3
+
+
+async def test_licensing_cache_fetches_expiring_token_again(
+    licensing_server, licensing_cache
+):
+    """Test to check that an access token which expires within the refresh margin is not served from the cache"""
+    # Arrange
+    mwa_api_endpoint = str(licensing_server.make_url("/mwa"))
+    licensing_server.app["access_token_lifetime"] = licensing_cache.refresh_margin / 2
+
+    # Act
+    tokens = [
+        (await licensing_cache.fetch_access_token(mwa_api_endpoint, "id", "src"))[
+            "token"
+        ]
+        for _ in range(2)
+    ]
+
+    # Assert
+    assert tokens == ["token-1", "token-2"]
+
+
+async def test_licensing_cache_refreshes_access_token_in_background(
+    mocker, licensing_server, licensing_cache
+):
+    """Test to check that the access token is fetched again in the background before it expires,
+    and that clearing the cache stops the refresh"""
+    # Arrange
+    mocker.patch("matlab_proxy.util.mw.MHLM_CACHE_REFRESH_RETRY_SECONDS", 0.01)
+    mwa_api_endpoint = str(licensing_server.make_url("/mwa"))
+    licensing_server.app["access_token_lifetime"] = licensing_cache.refresh_margin
+    requests = licensing_server.app["requests"]
+
+    # Act
+    licensing_cache.start_refresh(mwa_api_endpoint, "id", "src")
+    for _ in range(100):
+        if requests["access_token"] >= 3:
+            break
+        await asyncio.sleep(0.01)
+    licensing_cache.clear()
+
+    # Assert
+    assert requests["access_token"] >= 3
+    assert licensing_cache.get_stats()["refreshes"] >= 3
+    assert licensing_cache.get_stats()["entries"] == 0
+    assert not licensing_cache.get_stats()["isRefreshing"]
@@ -0,0 +1,110 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import asyncio
+
+import pytest
+
+from matlab_proxy.util import TimerWheel
+from matlab_proxy.util.polling import AdaptivePollingScheduler
+
+
+@pytest.fixture(name="scheduler")
+def scheduler_fixture():
+    """Returns an AdaptivePollingScheduler with a base interval of 1 second."""
+    return AdaptivePollingScheduler(
+        base_interval=1, starting_interval=0.25, max_interval=8
+    )
+
+
+def test_interval_while_starting(scheduler):
+    """Test to check that MATLAB is probed at the tight interval while it is starting"""
+    for _ in range(3):
+        assert scheduler.next_interval("starting", None, has_clients=False) == 0.25
+
+    assert scheduler.get_stats()["mode"] == "starting"
+
+
+def test_backoff_while_idle_without_clients(scheduler):
+    """Test to check that the interval backs off exponentially up to the ceiling while MATLAB is stably idle"""
+    # Act
+    intervals = [
+        scheduler.next_interval("up", "idle", has_clients=False) for _ in range(6)
+    ]
+
+    # Assert
+    # The first probe sees a change in state, so the base interval is used
+    assert intervals == [1, 2, 4, 8, 8, 8]
+    assert scheduler.get_stats()["mode"] == "backoff"
+
+
+@pytest.mark.parametrize(
+    "matlab_state, matlab_busy_state, has_clients",
+    [("up", "idle", True), ("up", "busy", False), ("down", None, True)],
+    ids=["idle with clients", "busy without clients", "down with clients"],
+)
+def test_no_backoff(scheduler, matlab_state, matlab_busy_state, has_clients):
+    """Test to check that the base interval is used when MATLAB is busy or when clients are connected"""
+    intervals = [
+        scheduler.next_interval(matlab_state, matlab_busy_state, has_clients)
+        for _ in range(3)
+    ]
+
+    assert intervals == [1, 1, 1]
+
+
+def test_change_in_state_resets_backoff(scheduler):
+    """Test to check that a change in the state of MATLAB resets the interval"""
+    for _ in range(4):
+        scheduler.next_interval("down", None, has_clients=False)
+
+    assert scheduler.next_interval("up", "idle", has_clients=False) == 1
+
+
+async def test_probe_now_cuts_wait_short():
+    """Test to check that probe_now() ends the wait for the next probe and resets the interval"""
+    # Arrange
+    scheduler = AdaptivePollingScheduler(
+        base_interval=1, starting_interval=0.25, max_interval=60
+    )
+    for _ in range(10):
+        scheduler.next_interval("down", None, has_clients=False)
+
+    # Act
+    waiter = asyncio.create_task(
+        scheduler.wait_for_next_probe("down", None, has_clients=False)
+    )
+    await asyncio.sleep(0)
+    scheduler.probe_now("MATLAB starting")
+    await asyncio.wait_for(waiter, timeout=1)
+
+    # Assert
+    stats = scheduler.get_stats()
+    assert stats["earlyProbes"] == 1
+    assert stats["lastEarlyProbeReason"] == "MATLAB starting"
+    assert stats["currentInterval"] == 1
+
+
+async def test_wait_for_next_probe_on_timer_wheel():
+    """Test to check that the wait for the next probe happens on the timer wheel and can be cut short"""
+    # Arrange
+    timer_wheel = TimerWheel(resolution=0.1)
+    scheduler = AdaptivePollingScheduler(
+        base_interval=0.2,
+        starting_interval=0.1,
+        max_interval=1,
+        timer_wheel=timer_wheel,
+    )
+
+    # Act
+    await scheduler.wait_for_next_probe("up", "busy", has_clients=True)
+    waiter = asyncio.create_task(
+        scheduler.wait_for_next_probe("down", None, has_clients=True)
+    )
+    await asyncio.sleep(0)
+    scheduler.probe_now("test")
+    await asyncio.wait_for(waiter, timeout=1)
+
+    # Assert
+    job_stats = timer_wheel.get_stats()["jobs"][AdaptivePollingScheduler.JOB_NAME]
+    assert job_stats["runs"] == 2
+    assert scheduler.get_stats()["earlyProbes"] == 1
@@ -0,0 +1,66 @@
+# Copyright 2025 The MathWorks, Inc.
+
+from matlab_proxy.util.startup_report import Histogram, StartupReport
+
+
+def test_histogram():
+    """Test to check that values are counted into the bucket with the smallest upper bound which is not less than the value"""
+    # Arrange
+    histogram = Histogram([1, 5])
+
+    # Act
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+
+    # Assert
+    assert histogram.get_stats() == {
+        "bucketUpperBounds": [1, 5],
+        "bucketCounts": [2, 1, 1],
+        "count": 4,
+        "sum": 14.5,
+    }
+
+
+def test_startup_report_records_first_completion_of_each_phase(mocker):
+    """Test to check that only the first completion of a phase after a start is recorded"""
+    # Arrange
+    monotonic = mocker.patch(
+        "matlab_proxy.util.startup_report.time.monotonic", return_value=100.0
+    )
+    report = StartupReport([1, 5])
+
+    # Act
+    # Phases completed before any start are ignored
+    report.mark("embeddedConnectorPinged")
+    report.start()
+    monotonic.return_value = 100.5
+    report.mark("xvfbReady")
+    monotonic.return_value = 103.0
+    report.mark("embeddedConnectorPinged")
+    monotonic.return_value = 104.0
+    report.mark("embeddedConnectorPinged")
+
+    # Assert
+    stats = report.get_stats()
+    assert stats["starts"] == 1
+    assert stats["latest"] == {"xvfbReady": 0.5, "embeddedConnectorPinged": 3.0}
+    assert stats["histograms"]["embeddedConnectorPinged"]["bucketCounts"] == [0, 1, 0]
+    assert stats["histograms"]["processSpawned"]["count"] == 0
+
+
+def test_startup_report_is_reset_on_start():
+    """Test to check that the report of the latest start does not contain phases of the previous start,
+    while the histograms accumulate across starts"""
+    # Arrange
+    report = StartupReport([1, 5])
+    report.start()
+    report.mark("processSpawned")
+
+    # Act
+    report.start()
+
+    # Assert
+    stats = report.get_stats()
+    assert stats["starts"] == 2
+    assert stats["latest"] == {}
+    assert stats["histograms"]["processSpawned"]["count"] == 1
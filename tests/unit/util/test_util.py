@@ -5,6 +5,7 @@ import pytest
 import psutil
 
 import inspect
+import logging
 
 from matlab_proxy import util
 from matlab_proxy.util import get_child_processes, system, add_signal_handlers
@@ -149,12 +150,14 @@ def tracking_lock():
     return util.TrackingLock("test_purpose")
 
 
-async def test_TrackingLock(tracking_lock):
+async def test_TrackingLock(tracking_lock, caplog):
     """Test to check various methods of TrackingLock class
 
     Args:
         tracking_lock (TrackingLock): Pytest fixture
+        caplog: Built in pytest fixture, to enable debug logs
     """
+    caplog.set_level(logging.DEBUG, logger=util.logger.name)
     name_of_current_fn = inspect.currentframe().f_code.co_name
 
     await tracking_lock.acquire()
@@ -168,45 +171,61 @@ async def test_TrackingLock(tracking_lock):
     assert tracking_lock.purpose is not None
 
 
-async def test_validate_lock_for_caller_when_not_locked(tracking_lock):
-    """Test to check if validate_lock_for_caller returns False when the lock is not acquired
+async def test_TrackingLock_without_debug_logs(tracking_lock, caplog):
+    """Test to check that the function which acquired the lock is not looked up when debug logs are disabled
 
     Args:
         tracking_lock (TrackingLock): Pytest fixture
+        caplog: Built in pytest fixture, to disable debug logs
     """
-    assert not tracking_lock.validate_lock_for_caller("some_caller")
+    caplog.set_level(logging.INFO, logger=util.logger.name)
+
+    await tracking_lock.acquire()
+    assert tracking_lock.acquired_by is None
+    assert tracking_lock.validate_lock_for_current_task()
+    await tracking_lock.release()
 
 
-async def test_validate_lock_for_caller_happy_path(tracking_lock):
-    """Test to check if validate_lock_for_caller returns True when the lock was acquired by the
-    same function as the caller.
+async def test_validate_lock_for_current_task_when_not_locked(tracking_lock):
+    """Test to check if validate_lock_for_current_task returns False when the lock is not acquired
+
+    Args:
+        tracking_lock (TrackingLock): Pytest fixture
+    """
+    assert not tracking_lock.validate_lock_for_current_task()
+
+
+async def test_validate_lock_for_current_task_happy_path(tracking_lock):
+    """Test to check if validate_lock_for_current_task returns True when the lock was acquired by
+    the current task, irrespective of the function which checks it.
 
     Args:
         tracking_lock (TrackingLock): Pytest fixture
     """
-    name_of_current_fn = inspect.currentframe().f_code.co_name
+
+    def nested_fn():
+        return tracking_lock.validate_lock_for_current_task()
 
     await tracking_lock.acquire()
-    assert tracking_lock.validate_lock_for_caller(name_of_current_fn)
+    assert tracking_lock.validate_lock_for_current_task()
+    assert nested_fn()
     await tracking_lock.release()
 
 
-async def test_validate_lock_for_caller_lock_acquired_by_other_function(tracking_lock):
-    """Test to check if validate_lock_for_caller returns False when the lock was acquired by
-    some other function
+async def test_validate_lock_for_current_task_lock_acquired_by_other_task(
+    tracking_lock,
+):
+    """Test to check if validate_lock_for_current_task returns False when the lock was acquired by
+    some other task
 
     Args:
         tracking_lock (TrackingLock): Pytest fixture
     """
     # Arrange
-    name_of_current_fn = inspect.currentframe().f_code.co_name
-
-    # Acquire lock inside a nested function
-    def nested_fn():
-        tracking_lock.acquire()
+    await asyncio.create_task(tracking_lock.acquire())
 
-    # Act
-    nested_fn()
+    # Act & Assert
+    assert tracking_lock.locked()
+    assert not tracking_lock.validate_lock_for_current_task()
 
-    # Assert
-    assert not tracking_lock.validate_lock_for_caller(name_of_current_fn)
+    await tracking_lock.release()
@@ -0,0 +1,426 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import asyncio
+import os
+
+import aiohttp
+import pytest
+from aiohttp import WSMsgType, web
+
+from matlab_proxy.util import websocket_relay
+from matlab_proxy.util.mwi.exceptions import WebSocketMemoryBudgetError
+from tests.unit.mocks.mock_client import MockWebSocketClient
+
+
+@pytest.fixture(name="ws_to")
+def ws_to_fixture(mocker):
+    return mocker.MagicMock(spec=web.WebSocketResponse, closed=False)
+
+
+async def test_relay_messages_forwards_raw_text(mocker, ws_to):
+    """Test to check that TEXT messages received as bytes are sent without being decoded"""
+    # Arrange
+    ws_from = MockWebSocketClient(
+        messages=[
+            mocker.MagicMock(type=WSMsgType.TEXT, data=b'{"key": "value"}'),
+            mocker.MagicMock(type=WSMsgType.TEXT, data="decoded text"),
+            mocker.MagicMock(type=WSMsgType.BINARY, data=b"\x00\x01"),
+        ]
+    )
+
+    # Act
+    await websocket_relay.relay_messages(ws_from, ws_to)
+
+    # Assert
+    ws_to.send_frame.assert_awaited_once_with(b'{"key": "value"}', WSMsgType.TEXT)
+    ws_to.send_str.assert_awaited_once_with("decoded text")
+    ws_to.send_bytes.assert_awaited_once_with(b"\x00\x01")
+
+
+async def test_relay_messages_stops_on_abnormal_closure(mocker, ws_to):
+    """Test to check that relaying stops when the source is closed abnormally"""
+    # Arrange
+    ws_from = MockWebSocketClient(
+        messages=[
+            mocker.MagicMock(type=WSMsgType.ERROR, data=None),
+            mocker.MagicMock(type=WSMsgType.TEXT, data="not relayed"),
+        ]
+    )
+    ws_from.close_code = aiohttp.WSCloseCode.ABNORMAL_CLOSURE
+
+    # Act
+    await websocket_relay.relay_messages(ws_from, ws_to)
+
+    # Assert
+    ws_to.send_str.assert_not_called()
+
+
+def test_get_websocket_options():
+    """Test to check that TEXT messages are only requested as bytes when they can be relayed as such"""
+    # Act
+    options = websocket_relay.get_websocket_options()
+
+    # Assert
+    if websocket_relay.IS_RAW_TEXT_RELAY_SUPPORTED:
+        assert options == {"decode_text": False}
+    else:
+        assert options == {}
+
+
+@pytest.fixture(name="compressing_server")
+async def compressing_server_fixture(aiohttp_server):
+    """Starts a server which sends the messages in app["messages"] through a WebSocketCompressor."""
+
+    async def handler(req):
+        ws = web.WebSocketResponse(compress=True)
+        await ws.prepare(req)
+        compressor = websocket_relay.create_compressor(ws, req.app["policy"])
+        req.app["compressors"].append(compressor)
+
+        for message in req.app["messages"]:
+            await compressor.send(message, WSMsgType.BINARY)
+        await ws.close()
+        return ws
+
+    app = web.Application()
+    app["messages"] = []
+    app["policy"] = {}
+    app["compressors"] = []
+    app.router.add_get("/", handler)
+    return await aiohttp_server(app)
+
+
+async def _receive_all(server):
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(server.make_url("/"), compress=15) as ws:
+            return [msg.data async for msg in ws]
+
+
+async def test_compressor_applies_policy(compressing_server):
+    """Test to check that only messages of at least min_size bytes are compressed and that all are received intact"""
+    # Arrange
+    messages = [b"small", b"a" * 1000, b"b" * 20000, b"tiny"]
+    compressing_server.app["messages"].extend(messages)
+    compressing_server.app["policy"].update(
+        {
+            "min_size": 256,
+            "level": 6,
+            "window_bits": 12,
+            "min_savings": 0,
+        }
+    )
+
+    # Act
+    received = await _receive_all(compressing_server)
+
+    # Assert
+    assert received == messages
+    stats = compressing_server.app["compressors"][0].get_stats()
+    assert stats["compressedMessages"] == 2
+    assert stats["uncompressedMessages"] == 2
+    assert stats["bytesBeforeCompression"] == 21000
+    assert stats["bytesSaved"] > 20000
+    assert stats["windowBits"] == 12
+
+
+async def test_compressor_completes_cancelled_sends(aiohttp_server):
+    """Test to check that a message whose send is cancelled is still compressed and written in full,
+    so that the messages sent after it can be decompressed by the peer"""
+    # Arrange
+    messages = [
+        b"a" * (websocket_relay.WEBSOCKET_MAX_SYNC_COMPRESS_SIZE + 1),
+        b"b" * 1000,
+        b"last",
+    ]
+
+    async def handler(req):
+        ws = web.WebSocketResponse(compress=True)
+        await ws.prepare(req)
+        compressor = websocket_relay.create_compressor(
+            ws, {"min_size": 0, "level": 6, "window_bits": 15, "min_savings": 0}
+        )
+
+        for message in messages[:-1]:
+            send = asyncio.create_task(compressor.send(message, WSMsgType.BINARY))
+            await asyncio.sleep(0)
+            send.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await send
+        await compressor.send(messages[-1], WSMsgType.BINARY)
+        await ws.close()
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    server = await aiohttp_server(app)
+
+    # Act
+    received = await _receive_all(server)
+
+    # Assert
+    assert received == messages
+
+
+async def test_compressor_disables_on_poor_savings(compressing_server):
+    """Test to check that compression is stopped once it does not save enough bytes"""
+    # Arrange
+    messages = [os.urandom(40 * 1024) for _ in range(3)]
+    compressing_server.app["messages"].extend(messages)
+    compressing_server.app["policy"].update(
+        {
+            "min_size": 0,
+            "level": 1,
+            "window_bits": 15,
+            "min_savings": 10,
+        }
+    )
+
+    # Act
+    received = await _receive_all(compressing_server)
+
+    # Assert
+    assert received == messages
+    stats = compressing_server.app["compressors"][0].get_stats()
+    assert stats["disabledReason"] == "savings"
+    assert stats["compressedMessages"] == 2
+    assert stats["uncompressedMessages"] == 1
+
+
+async def test_memory_budget_waits_for_release():
+    """Test to check that acquiring a used up budget waits until enough of it is released"""
+    # Arrange
+    parent = websocket_relay.MemoryBudget(100)
+    budget = websocket_relay.MemoryBudget(50, parent=parent)
+    await budget.acquire(40)
+
+    # Act
+    waiter = asyncio.create_task(budget.acquire(20))
+    await asyncio.sleep(0)
+    is_waiting = not waiter.done()
+    budget.release(40)
+    await waiter
+
+    # Assert
+    assert is_waiting
+    assert budget.used == parent.used == 20
+    assert budget.get_stats() == {
+        "limit": 50,
+        "used": 20,
+        "peak": 40,
+        "waits": 1,
+        "refusals": 0,
+    }
+
+
+@pytest.mark.parametrize(
+    "size, close_code",
+    [
+        (60, aiohttp.WSCloseCode.MESSAGE_TOO_BIG),
+        (20, aiohttp.WSCloseCode.TRY_AGAIN_LATER),
+    ],
+    ids=["Larger than the budget", "Budget not released in time"],
+)
+async def test_memory_budget_refusals(size, close_code):
+    """Test to check that the budget is refused with the expected close code and that nothing is left acquired"""
+    # Arrange
+    parent = websocket_relay.MemoryBudget(100)
+    budget = websocket_relay.MemoryBudget(50, parent=parent, wait_timeout=0.01)
+    await budget.acquire(40)
+
+    # Act
+    with pytest.raises(WebSocketMemoryBudgetError) as exc_info:
+        await budget.acquire(size)
+
+    # Assert
+    assert exc_info.value.close_code == close_code
+    assert budget.used == parent.used == 40
+    assert budget.get_stats()["refusals"] == 1
+
+
+async def test_memory_budget_parent_refusal():
+    """Test to check that a refusal by the parent budget does not release bytes the parent never acquired"""
+    # Arrange
+    parent = websocket_relay.MemoryBudget(100)
+    budget = websocket_relay.MemoryBudget(500, parent=parent)
+
+    # Act
+    with pytest.raises(WebSocketMemoryBudgetError) as exc_info:
+        await budget.acquire(200)
+
+    # Assert
+    assert exc_info.value.close_code == aiohttp.WSCloseCode.MESSAGE_TOO_BIG
+    assert parent.used == 0
+    assert budget.used == 0
+
+
+async def test_relay_messages_closes_both_websockets_when_over_budget(mocker, ws_to):
+    """Test to check that a message larger than the memory budget closes both websockets with MESSAGE_TOO_BIG"""
+    # Arrange
+    ws_from = MockWebSocketClient(
+        messages=[
+            mocker.MagicMock(type=WSMsgType.BINARY, data=b"a" * 10),
+            mocker.MagicMock(type=WSMsgType.BINARY, data=b"b" * 100),
+            mocker.MagicMock(type=WSMsgType.BINARY, data=b"not relayed"),
+        ]
+    )
+    ws_from.close = mocker.AsyncMock()
+    budget = websocket_relay.MemoryBudget(50)
+
+    # Act
+    await websocket_relay.relay_messages(ws_from, ws_to, memory_budget=budget)
+
+    # Assert
+    ws_to.send_bytes.assert_not_called()
+    for ws in (ws_from, ws_to):
+        assert ws.close.await_args.kwargs["code"] == aiohttp.WSCloseCode.MESSAGE_TOO_BIG
+    assert budget.used == 0
+
+
+async def test_relay_messages_refuses_concurrent_messages_over_total_budget(mocker):
+    """Test to check that concurrent connections whose messages do not fit into the shared budget
+    are closed with TRY_AGAIN_LATER, while the others are relayed"""
+    # Arrange
+    total_budget = websocket_relay.MemoryBudget(100, wait_timeout=0.05)
+    send_unblocked = asyncio.Event()
+
+    async def blocked_send(*args, **kwargs):
+        await send_unblocked.wait()
+
+    websockets, relays = [], []
+    for _ in range(4):
+        ws_from = MockWebSocketClient(
+            messages=[mocker.MagicMock(type=WSMsgType.BINARY, data=b"a" * 40)]
+        )
+        ws_to = mocker.MagicMock(spec=web.WebSocketResponse, closed=False)
+        ws_to.send_bytes = mocker.AsyncMock(side_effect=blocked_send)
+        budget = websocket_relay.MemoryBudget(50, parent=total_budget)
+        websockets.append((ws_from, ws_to))
+        relays.append(
+            asyncio.create_task(
+                websocket_relay.relay_messages(ws_from, ws_to, memory_budget=budget)
+            )
+        )
+
+    # Act
+    done, pending = await asyncio.wait(relays, timeout=0.5)
+    used_while_sending = total_budget.used
+    send_unblocked.set()
+    await asyncio.gather(*pending)
+
+    # Assert
+    assert len(done) == len(pending) == 2
+    assert used_while_sending == 80
+    for relay, (ws_from, ws_to) in zip(relays, websockets):
+        if relay in done:
+            assert ws_from.close_code == aiohttp.WSCloseCode.TRY_AGAIN_LATER
+            assert (
+                ws_to.close.await_args.kwargs["code"]
+                == aiohttp.WSCloseCode.TRY_AGAIN_LATER
+            )
+        else:
+            ws_to.send_bytes.assert_awaited_once_with(b"a" * 40)
+    assert total_budget.used == 0
+    assert total_budget.get_stats()["refusals"] == 2
+
+
+@pytest.fixture(name="receiving_server")
+async def receiving_server_fixture(aiohttp_server):
+    """Starts a server which stores the messages it receives in app["received"]."""
+
+    async def handler(req):
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(req)
+        async for msg in ws:
+            req.app["received"].append((msg.type, msg.data))
+        return ws
+
+    app = web.Application()
+    app["received"] = []
+    app.router.add_get("/", handler)
+    return await aiohttp_server(app)
+
+
+async def test_relay_messages_fragments_large_messages(
+    mocker, monkeypatch, receiving_server
+):
+    """Test to check that large messages are relayed as masked fragments which the peer reassembles"""
+    # Arrange
+    monkeypatch.setattr(websocket_relay, "WS_RELAY_FRAGMENT_SIZE", 1024)
+    header_spy = mocker.spy(websocket_relay, "_get_frame_header")
+    messages = [
+        (WSMsgType.BINARY, os.urandom(10 * 1024 + 3)),
+        (WSMsgType.TEXT, "small"),
+        (WSMsgType.TEXT, "x" * 5000),
+    ]
+    ws_from = MockWebSocketClient(
+        messages=[mocker.MagicMock(type=mt, data=md) for mt, md in messages]
+    )
+    budget = websocket_relay.MemoryBudget(100 * 1024)
+
+    # Act
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(receiving_server.make_url("/")) as ws_to:
+            await websocket_relay.relay_messages(ws_from, ws_to, memory_budget=budget)
+
+    # Assert
+    assert receiving_server.app["received"] == messages
+    # 11 fragments for the first message and 5 for the last one
+    assert header_spy.call_count == 16
+    assert budget.used == 0
+
+
+class _IdleWebSocket(MockWebSocketClient):
+    """Mock websocket on which no message is ever received, until it is closed."""
+
+    async def __anext__(self):
+        await asyncio.Event().wait()
+
+
+async def test_registry_cleans_up_connection(mocker):
+    """Test to check that once either side of a connection is closed, the relay of the other side is cancelled,
+    both websockets are closed and the connection is unregistered"""
+    # Arrange
+    registry = websocket_relay.WebSocketRegistry()
+    ws_server = MockWebSocketClient(
+        messages=[mocker.MagicMock(type=WSMsgType.BINARY, data=b"\x00\x01")]
+    )
+    ws_client = _IdleWebSocket()
+    ws_client.send_bytes = mocker.AsyncMock()
+
+    # Act
+    connection = await registry.relay("/ws", ws_server, ws_client)
+
+    # Assert
+    ws_client.send_bytes.assert_awaited_once_with(b"\x00\x01")
+    assert ws_server.closed and ws_client.closed
+    assert registry.get_stats() == {
+        "active": 0,
+        "opened": 1,
+        "closed": 1,
+        "connections": [],
+    }
+    stats = connection.get_stats()
+    assert stats["fromBrowser"]["messages"] == 1
+    assert stats["fromBrowser"]["messageSizes"]["bucketCounts"][0] == 1
+    assert stats["toBrowser"]["messages"] == 0
+
+
+async def test_registry_close_all():
+    """Test to check that closing all connections stops relaying them and closes their websockets with GOING_AWAY"""
+    # Arrange
+    registry = websocket_relay.WebSocketRegistry()
+    ws_server, ws_client = _IdleWebSocket(), _IdleWebSocket()
+    relay = asyncio.create_task(registry.relay("/ws", ws_server, ws_client))
+    await asyncio.sleep(0)
+    active = registry.get_stats()["active"]
+
+    # Act
+    await registry.close_all()
+    await relay
+
+    # Assert
+    assert active == 1
+    assert (
+        ws_server.close_code == ws_client.close_code == aiohttp.WSCloseCode.GOING_AWAY
+    )
+    assert registry.get_stats()["active"] == 0